@@ -0,0 +1,183 @@
+"""Benchmark TTS turn latency with a per-call vs a reused synthesizer.
+
+A local fake stands in for the Speech SDK synthesizer: opening its service
+connection costs a simulated WebSocket + TLS handshake, and audio starts a
+fixed time after ``speak_text_async``.  The same ``SpeechTtsService`` code
+path is measured twice:
+
+- per call: a fresh synthesizer for every utterance, connected lazily by
+  the first ``speak`` (the previous behaviour), and
+- reused: one synthesizer per session, pre-connected in ``start``.
+
+Run from the repository root:
+
+    python -m app.backend.benchmarks.bench_speech_tts
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+from typing import Any
+
+from azure.core.credentials import AccessToken
+
+from app.backend.services.speech_tts_service import SpeechTtsService
+
+_HANDSHAKE_SECONDS = 0.120
+_FIRST_AUDIO_SECONDS = 0.030
+_CHUNKS_PER_UTTERANCE = 5
+_CHUNK = b"\x00" * 4800
+_TURNS = 8
+
+
+class _FakeSignal:
+    def __init__(self) -> None:
+        self._callbacks: list[Any] = []
+
+    def connect(self, callback: Any) -> None:
+        self._callbacks.append(callback)
+
+    def disconnect_all(self) -> None:
+        self._callbacks.clear()
+
+    def fire(self, evt: Any) -> None:
+        for callback in list(self._callbacks):
+            callback(evt)
+
+
+_result_ids = itertools.count()
+
+
+class _FakeResult:
+    def __init__(self, result_id: str, audio_data: bytes = b"") -> None:
+        self.result_id = result_id
+        self.audio_data = audio_data
+
+
+class _FakeEvent:
+    def __init__(self, result_id: str, audio_data: bytes = b"") -> None:
+        self.result = _FakeResult(result_id, audio_data)
+
+
+class _FakeFuture:
+    def get(self) -> None:
+        return None
+
+
+class _FakeSynthesizer:
+    def __init__(self) -> None:
+        self.authorization_token = ""
+        self.connected = False
+        self.synthesizing = _FakeSignal()
+        self.synthesis_completed = _FakeSignal()
+        self.synthesis_canceled = _FakeSignal()
+
+    def speak_text_async(self, text: str) -> _FakeFuture:
+        # Like the SDK, every event of one request carries that request's id.
+        result_id = f"result-{next(_result_ids)}"
+        threading.Thread(target=self._render, args=(result_id,), daemon=True).start()
+        return _FakeFuture()
+
+    def stop_speaking_async(self) -> _FakeFuture:
+        return _FakeFuture()
+
+    def _render(self, result_id: str) -> None:
+        if not self.connected:
+            time.sleep(_HANDSHAKE_SECONDS)
+            self.connected = True
+        time.sleep(_FIRST_AUDIO_SECONDS)
+        for _ in range(_CHUNKS_PER_UTTERANCE):
+            self.synthesizing.fire(_FakeEvent(result_id, _CHUNK))
+        self.synthesis_completed.fire(_FakeEvent(result_id))
+
+
+class _FakeConnection:
+    def __init__(self, synthesizer: _FakeSynthesizer) -> None:
+        self._synthesizer = synthesizer
+
+    def open(self, for_continuous_recognition: bool) -> None:
+        time.sleep(_HANDSHAKE_SECONDS)
+        self._synthesizer.connected = True
+
+    def close(self) -> None:
+        self._synthesizer.connected = False
+
+
+class _FakeCredential:
+    async def get_token(self, *scopes: str, **kwargs: Any) -> AccessToken:
+        return AccessToken("token", int(time.time()) + 3600)
+
+
+class _ReusedTts(SpeechTtsService):
+    def _build_synthesizer(self, auth_token: str) -> tuple[Any, Any]:
+        synthesizer = _FakeSynthesizer()
+        synthesizer.authorization_token = auth_token
+        synthesizer.synthesizing.connect(self._on_synthesizing)
+        synthesizer.synthesis_completed.connect(self._on_completed)
+        synthesizer.synthesis_canceled.connect(self._on_canceled)
+        connection = _FakeConnection(synthesizer)
+        connection.open(True)
+        return synthesizer, connection
+
+
+class _PerCallTts(_ReusedTts):
+    """Previous behaviour: new synthesizer per utterance, no pre-connect."""
+
+    async def start(self) -> None:
+        self._credential = self._shared_credential
+
+    def _build_synthesizer(self, auth_token: str) -> tuple[Any, Any]:
+        synthesizer = _FakeSynthesizer()
+        synthesizer.authorization_token = auth_token
+        synthesizer.synthesizing.connect(self._on_synthesizing)
+        synthesizer.synthesis_completed.connect(self._on_completed)
+        synthesizer.synthesis_canceled.connect(self._on_canceled)
+        return synthesizer, None
+
+    async def synthesize_audio(self, text: str, cancel_event: asyncio.Event | None = None):
+        async for chunk in super().synthesize_audio(text, cancel_event):
+            yield chunk
+        await self._discard_synthesizer()
+
+
+async def _measure(tts: SpeechTtsService) -> tuple[float, list[float]]:
+    started = time.perf_counter()
+    await tts.start()
+    start_ms = (time.perf_counter() - started) * 1e3
+    first_audio_ms: list[float] = []
+    for turn in range(_TURNS):
+        turn_start = time.perf_counter()
+        first: float | None = None
+        # Distinct text per turn so the TTS audio cache never short-circuits.
+        async for _chunk in tts.synthesize_audio(f"This is turn {turn} of {id(tts)}."):
+            if first is None:
+                first = (time.perf_counter() - turn_start) * 1e3
+        first_audio_ms.append(first or 0.0)
+    await tts.close()
+    return start_ms, first_audio_ms
+
+
+async def _main() -> None:
+    print(
+        f"fake handshake {_HANDSHAKE_SECONDS * 1e3:.0f} ms, "
+        f"first audio {_FIRST_AUDIO_SECONDS * 1e3:.0f} ms after speak, {_TURNS} turns"
+    )
+    for label, tts in (
+        ("per call", _PerCallTts(credential=_FakeCredential())),
+        ("reused", _ReusedTts(credential=_FakeCredential())),
+    ):
+        start_ms, first_audio = await _measure(tts)
+        later = first_audio[1:]
+        print(
+            f"{label:9s} start {start_ms:6.1f} ms | first turn {first_audio[0]:6.1f} ms | "
+            f"later turns avg {sum(later) / len(later):6.1f} ms"
+        )
+
+
+def main() -> None:
+    asyncio.run(_main())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Golden-corpus check and benchmark for the TTS sanitizer.
+
+``tts_golden_corpus.json`` holds realistic agent replies (Markdown lists,
+Mermaid blocks, source citations, bare URLs, emoji) together with the text
+the previous two-stage cleanup produced for them.  This script checks that
+
+- ``sanitize_for_tts`` reproduces that text exactly, and
+- ``TtsSanitizer`` fed the same reply as streamed deltas produces the same
+  words (segments are spoken separately, so whitespace may differ),
+
+then compares whole-text cleanup after the stream ends with incremental
+cleanup while it streams, on long replies.
+
+Run from the repository root:
+
+    python -m app.backend.benchmarks.bench_tts_sanitizer
+"""
+
+import json
+import time
+from pathlib import Path
+
+from app.backend.services.tts_sanitizer import TtsSanitizer, sanitize_for_tts
+
+_CORPUS = Path(__file__).with_name("tts_golden_corpus.json")
+_DELTA_SIZES = (1, 3, 8, 24, 64)
+_LONG_REPLY_REPEATS = 20
+_ITERATIONS = 50
+
+
+def _chunks(text: str, size: int) -> list[str]:
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def _stream(deltas: list[str]) -> list[str]:
+    sanitizer = TtsSanitizer()
+    segments = [sanitizer.feed(delta) for delta in deltas]
+    segments.append(sanitizer.flush())
+    return [s for s in segments if s]
+
+
+def _words(text: str) -> list[str]:
+    return text.split()
+
+
+def check_corpus(corpus: list[dict[str, str]]) -> None:
+    for index, case in enumerate(corpus):
+        whole = sanitize_for_tts(case["text"])
+        assert whole == case["expected"], f"case {index}: whole-text mismatch\n{whole!r}"
+        for size in _DELTA_SIZES:
+            streamed = " ".join(_stream(_chunks(case["text"], size)))
+            assert _words(streamed) == _words(case["expected"]), (
+                f"case {index}, delta size {size}: streaming mismatch\n{streamed!r}"
+            )
+    print(f"golden corpus: {len(corpus)} cases OK (whole text + {len(_DELTA_SIZES)} delta sizes)")
+
+
+def bench(text: str, delta_size: int) -> None:
+    deltas = _chunks(text, delta_size)
+
+    start = time.perf_counter()
+    for _ in range(_ITERATIONS):
+        sanitize_for_tts("".join(deltas))
+    whole_ms = (time.perf_counter() - start) / _ITERATIONS * 1e3
+
+    per_delta_us: list[float] = []
+    start = time.perf_counter()
+    for _ in range(_ITERATIONS):
+        sanitizer = TtsSanitizer()
+        for delta in deltas:
+            t0 = time.perf_counter()
+            sanitizer.feed(delta)
+            per_delta_us.append((time.perf_counter() - t0) * 1e6)
+        sanitizer.flush()
+    incremental_ms = (time.perf_counter() - start) / _ITERATIONS * 1e3
+    per_delta_us.sort()
+    p50 = per_delta_us[len(per_delta_us) // 2]
+    p99 = per_delta_us[int(len(per_delta_us) * 0.99)]
+
+    print(
+        f"{len(text):7d} chars, {len(deltas):5d} deltas of {delta_size:3d}: "
+        f"whole-text {whole_ms:6.2f} ms after the last delta | "
+        f"incremental {incremental_ms:6.2f} ms spread over the stream, "
+        f"per delta p50 {p50:6.1f} us p99 {p99:6.1f} us"
+    )
+
+
+def main() -> None:
+    corpus = json.loads(_CORPUS.read_text(encoding="utf-8"))
+    check_corpus(corpus)
+    long_reply = "\n\n".join(case["text"] for case in corpus) * _LONG_REPLY_REPEATS
+    for size in (8, 24, 64):
+        bench(long_reply, size)
+
+
+if __name__ == "__main__":
+    main()
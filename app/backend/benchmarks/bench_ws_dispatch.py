@@ -0,0 +1,63 @@
+"""Micro-benchmark for WebSocket receive-loop message decoding.
+
+Compares the previous path (``json.loads`` + full discriminated-union
+validation for every message) with ``parse_incoming`` (faster decoder when
+installed, audio fast path) on realistic microphone frames: 4096 PCM16
+samples at 24 kHz, i.e. ~5.9 frames per second per talking user.
+
+Run from the repository root:
+
+    python -m app.backend.benchmarks.bench_ws_dispatch
+"""
+
+import base64
+import json
+import os
+import time
+
+from pydantic import TypeAdapter
+
+from app.backend.models.ws_messages import IncomingMessage, parse_incoming
+
+_FRAME_SAMPLES = 4096
+_SAMPLE_RATE = 24000
+_ITERATIONS = 20000
+
+
+def _legacy_parse(raw: str, adapter: TypeAdapter) -> object:
+    return adapter.validate_python(json.loads(raw))
+
+
+def _per_message_us(fn, raw: str, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(raw)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    adapter = TypeAdapter(IncomingMessage)
+    pcm = os.urandom(_FRAME_SAMPLES * 2)
+    audio_raw = json.dumps({"type": "audio", "data": base64.b64encode(pcm).decode("ascii")})
+    control_raw = json.dumps({"type": "control", "action": "start_listening"})
+    frames_per_second = _SAMPLE_RATE / _FRAME_SAMPLES
+
+    print(f"audio frame: {len(audio_raw)} bytes JSON, {frames_per_second:.1f} frames/s per user")
+    for label, raw in (("audio", audio_raw), ("control", control_raw)):
+        legacy = _per_message_us(lambda r: _legacy_parse(r, adapter), raw, _ITERATIONS)
+        fast = _per_message_us(parse_incoming, raw, _ITERATIONS)
+        print(
+            f"{label:8s} legacy {legacy:8.2f} us/msg   fast {fast:8.2f} us/msg   "
+            f"speed-up {legacy / fast:5.2f}x"
+        )
+        if label == "audio":
+            for users in (100, 500):
+                rate = users * frames_per_second
+                print(
+                    f"         {users} talking users: legacy {legacy * rate / 1e4:5.2f}% "
+                    f"of one core, fast {fast * rate / 1e4:5.2f}%"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -19,7 +19,67 @@ class Settings(BaseSettings):
     cors_origins: str = "http://localhost:3000"
     session_ttl_seconds: int = 3600
     max_sessions_per_user: int = 5
+    # Per-node admission budgets by resource class: "sessions", "copilot"
+    # (dedicated CLI processes), "voicelive", "avatar".  Unlisted classes are
+    # unlimited, e.g. {"sessions": 400, "copilot": 40, "avatar": 10}.
+    admission_budgets: dict[str, int] = {}
+    # Clients waiting for capacity beyond this are turned away immediately.
+    admission_max_queue: int = 200
+    admission_queue_timeout_seconds: float = 120.0
+    # Retry hint sent with a rejection.
+    admission_retry_after_seconds: int = 30
+    # Max sessions torn down in parallel (TTL expiry, shutdown).
+    session_cleanup_concurrency: int = 16
+    # Deadline for a batch of TTL expiries; teardowns still running are cancelled.
+    session_expiry_timeout_seconds: float = 30.0
+    # Idle time after which a session releases its Copilot/VoiceLive/TTS
+    # resources until the next activity (0 disables hibernation).
+    session_hibernate_after_seconds: int = 900
+    # Global deadline for tearing down all sessions on shutdown; keep it
+    # below the container termination grace period.
+    shutdown_timeout_seconds: float = 20.0
+    # Shared secret for POST /drain (X-Drain-Token header); empty disables it.
+    drain_token: str = ""
+    # Pre-warmed CopilotAgent pool, keyed by skill (e.g. {"databricks": 2}).
+    # Skills without an entry are not pooled.
+    copilot_pool_min_size: dict[str, int] = {}
+    copilot_pool_max_size: dict[str, int] = {}
+    copilot_pool_max_idle_seconds: int = 900
+    # CLI processes shared by lite (text-only) sessions; each hosts many
+    # Copilot sessions, placed on the least-loaded process.
+    copilot_shared_clients: int = 4
     logic_app_trigger_url: str = ""
+    # Per-connection outbound queue: ~100 ms TTS chunks, so 100 frames is 10 s.
+    ws_outbox_max_audio_frames: int = 100
+    ws_outbox_max_messages: int = 2000
+    ws_slow_consumer_seconds: float = 10.0
+    # Batch streamed agent_text deltas: flush after N ms or M chars (0 ms = off).
+    agent_text_coalesce_ms: int = 40
+    agent_text_coalesce_bytes: int = 2048
+    # Send TTS audio at real-time pace, this far ahead of playback (0 = burst).
+    tts_pacing_lead_ms: int = 400
+    # Synthesized-sentence PCM cache shared by all sessions (0 MB = off).
+    # Set tts_cache_dir to add a disk tier that survives restarts.
+    tts_cache_memory_mb: int = 64
+    tts_cache_dir: str = ""
+    tts_cache_disk_mb: int = 512
+    # Thread pools for blocking Speech SDK calls, one per workload class.
+    sdk_synthesis_workers: int = 16
+    sdk_avatar_connect_workers: int = 8
+    sdk_avatar_speak_workers: int = 16
+    sdk_stop_workers: int = 4
+    # Event-loop lag monitor: probe every interval; when the loop is blocked
+    # longer than the stall threshold, a watchdog thread logs the stack it is
+    # stuck in (0 ms disables stack capture).
+    loop_monitor_enabled: bool = True
+    loop_monitor_interval_ms: int = 100
+    loop_monitor_stall_ms: int = 250
+    # Speculative voice turns: start the agent once the partial transcript
+    # has been stable this long, keep the reply if the final transcript
+    # matches it word for word within the ratio, otherwise restart.
+    speculative_turns_enabled: bool = False
+    speculative_stable_ms: int = 400
+    speculative_match_ratio: float = 0.9
 
 
 settings = Settings()
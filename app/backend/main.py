@@ -7,7 +7,14 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.backend.config import settings
 from app.backend.routers import email, health, ws
+from app.backend.services.avatar_tts_service import ice_token_cache
+from app.backend.services.azure_credentials import shared_credential
+from app.backend.services.copilot_clients import copilot_client_pool
+from app.backend.services.copilot_pool import copilot_pool
+from app.backend.services.loop_monitor import loop_monitor
+from app.backend.services.sdk_executors import shutdown_executors
 from app.backend.services.session_manager import session_manager
+from app.backend.services.tts_cache import tts_cache
 
 logging.basicConfig(
     level=logging.INFO,
@@ -20,9 +27,20 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Starting session manager")
     await session_manager.start()
+    await loop_monitor.start()
+    await copilot_pool.start()
+    await tts_cache.start()
+    if settings.avatar_enabled:
+        await ice_token_cache.start()
     yield
-    logger.info("Shutting down — cleaning up all sessions")
+    logger.info("Shutting down — draining and cleaning up all sessions")
     await session_manager.cleanup_all()
+    await copilot_pool.close()
+    await copilot_client_pool.close()
+    await ice_token_cache.close()
+    shutdown_executors()
+    await loop_monitor.close()
+    await shared_credential.close()
 
 
 app = FastAPI(
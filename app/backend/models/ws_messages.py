@@ -1,9 +1,37 @@
+import json
 from typing import Annotated, Any, Literal, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from app.backend.models.session_state import SessionState
 
+try:  # optional faster decoder; orjson.JSONDecodeError subclasses json's
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on the environment
+    _json_loads = json.loads
+
+# Binary WebSocket sub-protocol for raw PCM16 (24 kHz mono) audio.  Clients
+# that offer it in Sec-WebSocket-Protocol exchange audio as binary frames:
+# one header byte giving the frame type, followed by the raw PCM payload.
+# Everything else stays JSON.  Clients that don't offer it keep the
+# base64-in-JSON ``audio`` / ``tts_audio`` messages.
+BINARY_AUDIO_SUBPROTOCOL = "ads.pcm16.v1"
+FRAME_MIC_AUDIO = 0x01  # client -> server microphone audio
+FRAME_TTS_AUDIO = 0x02  # server -> client TTS audio, in the session's TTS codec
+
+# TTS output codecs a client can request with the ``tts_codec`` query
+# parameter on connect.  "pcm" (raw PCM16 24 kHz mono) is the default;
+# "opus" is Opus in a WebM stream and "mp3" is 48 kbps MP3, both for
+# clients that decode through MediaSource instead of a PCM worklet.
+TtsCodec = Literal["pcm", "opus", "mp3"]
+TTS_CODECS: tuple[str, ...] = ("pcm", "opus", "mp3")
+DEFAULT_TTS_CODEC: TtsCodec = "pcm"
+# Audio bytes per second of playback: exact for PCM16 24 kHz mono, the
+# nominal bitrate for the compressed codecs.
+TTS_BYTES_PER_SECOND: dict[str, int] = {"pcm": 48000, "opus": 3000, "mp3": 6000}
+
 
 class AudioMessage(BaseModel):
     type: Literal["audio"] = "audio"
@@ -39,6 +67,26 @@ IncomingMessage = Annotated[
     Field(discriminator="type"),
 ]
 
+_incoming_adapter = TypeAdapter(IncomingMessage)
+
+
+def parse_incoming(raw: str | bytes) -> str | IncomingMessage:
+    """Decode one JSON WebSocket message.
+
+    ``audio`` messages are by far the most frequent, so they skip model
+    validation: the function peeks at ``type`` and returns the base64
+    payload string directly.  Every other message (and any malformed
+    audio message) goes through full discriminated-union validation.
+
+    Raises ``json.JSONDecodeError`` or ``pydantic.ValidationError``.
+    """
+    data = _json_loads(raw)
+    if type(data) is dict and data.get("type") == "audio":
+        audio = data.get("data")
+        if type(audio) is str:
+            return audio
+    return _incoming_adapter.validate_python(data)
+
 
 class TranscriptMessage(BaseModel):
     type: Literal["transcript"] = "transcript"
@@ -55,6 +103,7 @@ class AgentTextMessage(BaseModel):
 class TtsAudioMessage(BaseModel):
     type: Literal["tts_audio"] = "tts_audio"
     data: str
+    codec: TtsCodec = DEFAULT_TTS_CODEC
 
 
 class TtsStopMessage(BaseModel):
@@ -86,6 +135,30 @@ class ErrorMessage(BaseModel):
     message: str
 
 
+class QueuedMessage(BaseModel):
+    """The node is at capacity; the client is waiting for a session slot."""
+    type: Literal["queued"] = "queued"
+    position: int
+    queue_length: int
+
+
+class BusyMessage(BaseModel):
+    """Sent before closing when the client can't be admitted; retry later."""
+    type: Literal["busy"] = "busy"
+    message: str
+    retry_after_seconds: int
+
+
+class ReconnectMessage(BaseModel):
+    """Sent before the server closes the socket because it is draining.
+
+    The client should reconnect (landing on another instance) and restore
+    its conversation history there.
+    """
+    type: Literal["reconnect"] = "reconnect"
+    reason: str = "draining"
+
+
 class SessionSummaryChunkMessage(BaseModel):
     """Streaming chunk of the session summary document."""
     type: Literal["session_summary_chunk"] = "session_summary_chunk"
@@ -103,5 +176,8 @@ OutgoingMessage = Union[
     AvatarStateMessage,
     StateMessage,
     ErrorMessage,
+    QueuedMessage,
+    BusyMessage,
+    ReconnectMessage,
     SessionSummaryChunkMessage,
 ]
@@ -1,13 +1,56 @@
-from fastapi import APIRouter
+import secrets
+from typing import Any
 
+from fastapi import APIRouter, Header, HTTPException, Response
+from fastapi.responses import PlainTextResponse
+
+from app.backend.config import settings
+from app.backend.services.admission import admission_controller
+from app.backend.services.copilot_clients import copilot_client_pool
+from app.backend.services.loop_monitor import loop_monitor
+from app.backend.services.metrics import latency_summary, render_prometheus
+from app.backend.services.sdk_executors import executor_stats
 from app.backend.services.session_manager import session_manager
+from app.backend.services.tts_cache import tts_cache
 
 router = APIRouter(tags=["health"])
 
 
 @router.get("/health")
-async def health() -> dict[str, str | int]:
+async def health(response: Response) -> dict[str, Any]:
+    # 503 while draining so load balancers stop routing new clients here.
+    if session_manager.draining:
+        response.status_code = 503
     return {
-        "status": "ok",
+        "status": "draining" if session_manager.draining else "ok",
         "active_sessions": session_manager.active_session_count,
+        "hibernating_sessions": session_manager.hibernating_session_count,
+        "admission": admission_controller.stats(),
+        "copilot_shared_clients": copilot_client_pool.stats(),
+        "tts_cache": tts_cache.stats(),
+        "sdk_executors": executor_stats(),
+        "event_loop": loop_monitor.stats(),
     }
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Counters, gauges and histograms in the Prometheus text format."""
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@router.get("/metrics/latency")
+async def latency() -> dict[str, Any]:
+    """p50/p95/p99 of the per-turn latency histograms (see ``turn_trace``)."""
+    return latency_summary()
+
+
+@router.post("/drain")
+async def drain(x_drain_token: str = Header(default="")) -> dict[str, Any]:
+    """Enter drain mode ahead of shutdown (e.g. from a preStop hook)."""
+    if not settings.drain_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not secrets.compare_digest(x_drain_token, settings.drain_token):
+        raise HTTPException(status_code=403, detail="Invalid drain token.")
+    session_manager.begin_drain()
+    return {"status": "draining", "active_sessions": session_manager.active_session_count}
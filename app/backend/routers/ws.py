@@ -1,24 +1,34 @@
 import asyncio
+import base64
 import json
-import re
 import logging
+from collections import deque
+from contextlib import aclosing
 from typing import Any
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from pydantic import TypeAdapter, ValidationError
+from pydantic import ValidationError
 
+from app.backend.config import settings
 from app.backend.models.session_state import SessionState
 from app.backend.models.ws_messages import (
+    BINARY_AUDIO_SUBPROTOCOL,
+    DEFAULT_TTS_CODEC,
+    FRAME_MIC_AUDIO,
+    FRAME_TTS_AUDIO,
+    TTS_BYTES_PER_SECOND,
+    TTS_CODECS,
     AgentTextMessage,
-    AudioMessage,
     AvatarAnswerMessage,
     AvatarIceMessage,
     AvatarIceRequest,
     AvatarOfferMessage,
     AvatarStateMessage,
+    BusyMessage,
     ControlMessage,
     ErrorMessage,
-    IncomingMessage,
+    QueuedMessage,
+    ReconnectMessage,
     RestoreHistoryMessage,
     SessionSummaryChunkMessage,
     StateMessage,
@@ -26,77 +36,45 @@ from app.backend.models.ws_messages import (
     TranscriptMessage,
     TtsAudioMessage,
     TtsStopMessage,
+    parse_incoming,
 )
 
+from app.backend.services.admission import (
+    AdmissionRejected,
+    AdmissionTicket,
+    admission_controller,
+    session_needs,
+)
+from app.backend.services.copilot_agent import RESTORE_REASON_RESUME
 from app.backend.services.session_manager import Session, session_manager
+from app.backend.services.speculative_turn import SpeculativeTurn, TurnSpeculator
+from app.backend.services.tts_sanitizer import TtsSanitizer, sanitize_for_tts
+from app.backend.services.turn_trace import TurnTrace
+from app.backend.services.ws_outbox import WS_FRAMES_IN, DeltaCoalescer, TtsPacer, WsOutbox
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-_incoming_adapter = TypeAdapter(IncomingMessage)
-
-# Regex to strip fenced code blocks (```...```) from text before TTS.
-# This prevents the avatar / audio TTS from reading out Mermaid diagrams,
-# JSON snippets, or other code that the chat UI renders visually.
-_CODE_BLOCK_RE = re.compile(r"```[\s\S]*?```", re.MULTILINE)
-# Parenthetical source citations: "(Source: [label](url))" or "(Source: url)"
-_SOURCE_CITATION_RE = re.compile(
-    r"\(Source:\s*"           # literal "(Source:"
-    r"(?:\[[^\]]*\]\([^)]*\)"  # markdown link [label](url)
-    r"|[^)]+)"                # or bare text/url
-    r"\)",                    # closing paren
-    re.IGNORECASE,
-)
+_TTS_FRAME_HEADER = bytes([FRAME_TTS_AUDIO])
+# Close code for connections turned away while draining (RFC 6455 "Service Restart").
+_DRAIN_CLOSE_CODE = 1012
+# Close code for connections refused by admission control ("Try Again Later").
+_BUSY_CLOSE_CODE = 1013
+
+
+def _outbox(ws: WebSocket) -> WsOutbox:
+    """Return the connection's outbound writer (created on accept)."""
+    return ws.state.outbox
+
+
+def _pacer(ws: WebSocket) -> TtsPacer:
+    """Return the connection's TTS pacer (created with the session)."""
+    return ws.state.tts_pacer
 
-# Standalone markdown links: [label](url) -> keep label only
-_MD_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)")
-
-# Bare URLs: remove the entire sentence/clause containing a bare URL.
-# This avoids orphaned filler like "See also: for more details." after the
-# URL is stripped.  The URL part uses (?:[^\s.]|\.[^\s])+ so that a period
-# is consumed only when followed by a non-space char (e.g. delta.io) — a
-# sentence-ending period ('. ') is NOT swallowed.
-_BARE_URL_SENTENCE_RE = re.compile(r"[^\n.]*https?://(?:[^\s.]|\.[^\s])+[^\n.]*\.?")
-# Standalone "Sources:" lines (e.g. "Sources: Link1 . Link2")
-# These appear at the end of MCP-grounded responses as a references block.
-_SOURCES_LINE_RE = re.compile(r"^Sources?:\s*.*$", re.IGNORECASE | re.MULTILINE)
-
-# Markdown emphasis: **bold**, *italic*, __bold__, _italic_
-# Strip the markers but keep the enclosed text.
-_MD_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
-_MD_ITALIC_RE = re.compile(r"\*(.+?)\*")
-_MD_BOLD2_RE = re.compile(r"__(.+?)__")
-_MD_ITALIC2_RE = re.compile(r"_(.+?)_")
-
-
-def _strip_for_tts(text: str) -> str:
-    """Remove code blocks, source citations, URLs, and markdown for natural TTS."""
-    cleaned = _CODE_BLOCK_RE.sub("", text)
-    # Remove full "(Source: ...)" parenthetical citations
-    cleaned = _SOURCE_CITATION_RE.sub("", cleaned)
-    # Remove standalone "Sources: ..." reference lines
-    cleaned = _SOURCES_LINE_RE.sub("", cleaned)
-    # Convert remaining markdown links to just their label text
-    cleaned = _MD_LINK_RE.sub(r"\1", cleaned)
-    # Remove entire sentences/clauses that contain bare URLs
-    cleaned = _BARE_URL_SENTENCE_RE.sub("", cleaned)
-    # Strip markdown emphasis markers (keep enclosed text)
-    cleaned = _MD_BOLD_RE.sub(r"\1", cleaned)
-    cleaned = _MD_BOLD2_RE.sub(r"\1", cleaned)
-    cleaned = _MD_ITALIC_RE.sub(r"\1", cleaned)
-    cleaned = _MD_ITALIC2_RE.sub(r"\1", cleaned)
-    # Collapse runs of 3+ newlines into 2 (paragraph break)
-    cleaned = re.sub(r"\n{3,}", "\n\n", cleaned)
-    # Collapse multiple spaces left by removals
-    cleaned = re.sub(r"  +", " ", cleaned)
-    return cleaned.strip()
 
 async def _send_msg(ws: WebSocket, data: dict[str, Any]) -> None:
-    try:
-        await ws.send_json(data)
-    except Exception:
-        logger.debug("Failed to send WS message", exc_info=True)
+    _outbox(ws).send(data)
 
 
 async def _set_state(ws: WebSocket, session: Session, state: SessionState) -> None:
@@ -104,24 +82,57 @@ async def _set_state(ws: WebSocket, session: Session, state: SessionState) -> No
     await _send_msg(ws, StateMessage(state=state).model_dump())
 
 
-async def _handle_audio(ws: WebSocket, session: Session, msg: AudioMessage) -> None:
+async def _send_tts_audio(ws: WebSocket, session: Session, audio: bytes) -> None:
+    """Send one TTS chunk as a binary frame or base64 JSON, per the client's protocol.
+
+    *audio* is in the session's negotiated codec; binary frames rely on the
+    codec announced in ``session_created``, JSON messages also tag it.
+    Chunks are paced to real time; nothing is sent once TTS is cancelled.
+    """
+    if not await _pacer(ws).wait(len(audio), session.tts_cancel_event):
+        return
+    if session.turn_trace is not None:
+        session.turn_trace.mark("first_audio")
+    if session.binary_audio:
+        await _outbox(ws).send_audio(_TTS_FRAME_HEADER + audio)
+    else:
+        await _outbox(ws).send_audio(
+            TtsAudioMessage(
+                data=base64.b64encode(audio).decode("ascii"), codec=session.tts_codec,
+            ).model_dump()
+        )
+
+
+async def _handle_audio(ws: WebSocket, session: Session, audio: str | memoryview) -> None:
+    """Forward microphone audio (base64 JSON or a raw binary payload) to VoiceLive."""
     if session.voicelive is None:
         return
     try:
-        await session.voicelive.send_audio(msg.data)
+        await session.voicelive.send_audio(audio)
     except Exception:
         await _send_msg(ws, ErrorMessage(message="Failed to send audio to VoiceLive").model_dump())
 
 
+async def _handle_binary_frame(ws: WebSocket, session: Session, frame: bytes) -> None:
+    if not frame or frame[0] != FRAME_MIC_AUDIO:
+        await _send_msg(ws, ErrorMessage(message="Invalid binary frame").model_dump())
+        return
+    # Slice without copying; VoiceLive encodes straight from this buffer.
+    await _handle_audio(ws, session, memoryview(frame)[1:])
+
+
 async def _cancel_tts(ws: WebSocket, session: Session) -> None:
     """Signal TTS cancellation and notify the frontend to stop playback.
     Always sends tts_stop to the frontend regardless of backend session
-    state, because the backend finishes sending all TTS chunks almost
-    instantly (they're pre-synthesized in memory) and transitions to IDLE
-    long before the frontend finishes playing.  The frontend worklet queue
-    may still have seconds of audio buffered.
+    state: audio is paced ahead of playback by ``tts_pacing_lead_ms``, so
+    the backend may already be IDLE while the frontend still plays the
+    last lead's worth.  Setting the cancel event stops paced delivery and
+    any in-progress Speech SDK synthesis.
     """
     session.tts_cancel_event.set()
+    _pacer(ws).reset()
+    # Drop queued audio so tts_stop goes out ahead of nothing stale.
+    _outbox(ws).drop_audio()
     await _send_msg(ws, TtsStopMessage().model_dump())
     # Also stop avatar speech if connected
     if session.avatar_tts is not None and session.avatar_tts.is_connected:
@@ -176,58 +187,153 @@ async def _handle_avatar_ice_request(
         return
 
     try:
-        ice_token = session.avatar_tts._ice_token or {}
-        if not ice_token:
-            await session.avatar_tts._refresh_ice_token()
-            ice_token = session.avatar_tts._ice_token or {}
-        ice_servers = [{
-            "urls": ice_token.get("Urls", []),
-            "username": ice_token.get("Username", ""),
-            "credential": ice_token.get("Password", ""),
-        }]
+        ice_servers = await session.avatar_tts.get_ice_servers()
         await _send_msg(ws, AvatarIceMessage(ice_servers=ice_servers).model_dump())
-        logger.info("Sent ICE servers to frontend: %s", ice_token.get("Urls", []))
+        logger.info("Sent ICE servers to frontend: %s", ice_servers[0]["urls"])
     except Exception:
         logger.exception("Failed to get ICE servers")
         await _send_msg(ws, ErrorMessage(message="Failed to get ICE servers").model_dump())
 
 
+async def _speak_sentences(
+    ws: WebSocket,
+    session: Session,
+    sentences: asyncio.Queue[str | None],
+) -> None:
+    """Synthesize queued sentences in order while the agent is still streaming.
+
+    Sentences arrive already sanitized.  A single consumer keeps audio in
+    sentence order.  ``None`` marks the end
+    of the response; barge-in (``tts_cancel_event``) stops delivery between
+    and within sentences.
+    """
+    while True:
+        sentence = await sentences.get()
+        if sentence is None:
+            return
+        if session.tts_cancel_event.is_set():
+            logger.info("TTS: stopping sentence pipeline due to barge-in")
+            return
+        if session.speech_tts is None:
+            continue
+        if session.state == SessionState.THINKING:
+            await _set_state(ws, session, SessionState.SPEAKING)
+        try:
+            async with aclosing(
+                session.speech_tts.synthesize_audio(
+                    sentence, session.tts_cancel_event, session.turn_trace,
+                )
+            ) as audio_chunks:
+                async for audio_chunk in audio_chunks:
+                    if session.tts_cancel_event.is_set():
+                        logger.info("TTS: stopping chunk delivery due to barge-in")
+                        return
+                    await _send_tts_audio(ws, session, audio_chunk)
+        except Exception:
+            logger.warning("TTS synthesis failed for sentence", exc_info=True)
+
+
 async def _process_agent_response(
     ws: WebSocket,
     session: Session,
     text: str,
     agent_lock: asyncio.Lock,
+    trace: TurnTrace | None = None,
+    speculation: SpeculativeTurn | None = None,
 ) -> None:
     """Send text to the Copilot agent and stream the response back.
 
     Runs as a background task so the WS receive loop is never blocked.
     Uses agent_lock to serialise concurrent agent calls (e.g. rapid user
     messages or voice transcriptions arriving while a previous turn is
-    still streaming).
+    still streaming).  *trace* carries a voice turn's capture timings;
+    text turns start their own.  A confirmed *speculation* already holds
+    agent_lock and has the reply under way; it is streamed instead of
+    sending *text* again.
     """
-    async with agent_lock:
+    if trace is None:
+        trace = TurnTrace(session.session_id, "text")
+    trace.mark("turn_received")
+    # Keeps the session from hibernating under the turn, queued or running.
+    session.agent_turns += 1
+    try:
+        await _run_agent_turn(ws, session, text, agent_lock, trace, speculation)
+    finally:
+        session.agent_turns -= 1
+
+
+async def _run_agent_turn(
+    ws: WebSocket,
+    session: Session,
+    text: str,
+    agent_lock: asyncio.Lock,
+    trace: TurnTrace,
+    speculation: SpeculativeTurn | None,
+) -> None:
+    async with (agent_lock if speculation is None else speculation.holding_lock()):
+        trace.mark("agent_start")
         await _set_state(ws, session, SessionState.THINKING)
         session.turn_count += 1
+        trace.turn = session.turn_count
+        session.turn_trace = trace
         session.conversation_history.append({"role": "user", "content": text})
 
         full_response: list[str] = []
+        # Audio-only sessions pipeline TTS per sentence so the first audio
+        # goes out as soon as the first sentence is complete.  Avatar
+        # sessions keep speaking the whole reply once it has streamed.
+        sentence_stream: TtsSanitizer | None = None
+        sentence_queue: asyncio.Queue[str | None] = asyncio.Queue()
+        tts_task: asyncio.Task[None] | None = None
+        if not session.lite_mode and session.avatar_tts is None and session.speech_tts is not None:
+            session.tts_cancel_event.clear()
+            sentence_stream = TtsSanitizer()
+            tts_task = asyncio.create_task(
+                _speak_sentences(ws, session, sentence_queue),
+                name="tts-sentences",
+            )
+        # Merge deltas into fewer agent_text frames (flushed before is_final).
+        text_batcher = DeltaCoalescer(
+            _outbox(ws), lambda t: AgentTextMessage(text=t, is_final=False).model_dump(),
+        )
+        agent_stream = (
+            session.copilot.send_message(text, trace) if speculation is None else speculation.stream()
+        )
         try:
-            async for chunk in session.copilot.send_message(text):
-                full_response.append(chunk)
-                await _send_msg(ws, AgentTextMessage(text=chunk, is_final=False).model_dump())
-
+            async with aclosing(agent_stream) as chunks:
+                async for chunk in chunks:
+                    full_response.append(chunk)
+                    text_batcher.add(chunk)
+                    if sentence_stream is not None:
+                        speakable = sentence_stream.feed(chunk)
+                        if speakable:
+                            sentence_queue.put_nowait(speakable)
+
+            text_batcher.flush()
+            logger.debug(
+                "agent_text: %d deltas sent as %d frames",
+                text_batcher.deltas_received, text_batcher.frames_sent,
+            )
             final_text = "".join(full_response)
             # Always send is_final so the frontend clears its tracking ref.
             # Without this, if the agent produces no text (e.g. only tool
             # calls), currentAssistantIdRef on the frontend stays stale and
             # the next response's chunks get appended to the wrong bubble.
             await _send_msg(ws, AgentTextMessage(text=final_text, is_final=True).model_dump())
+            trace.mark("final_text")
             session.conversation_history.append({"role": "assistant", "content": final_text})
 
+            if sentence_stream is not None and tts_task is not None:
+                speakable = sentence_stream.flush()
+                if speakable:
+                    sentence_queue.put_nowait(speakable)
+                sentence_queue.put_nowait(None)
+                await tts_task
+
             # In lite mode, skip all TTS / avatar speech.
             tts_text = ""
-            if not session.lite_mode:
-                tts_text = _strip_for_tts(final_text) if final_text else ""
+            if not session.lite_mode and sentence_stream is None:
+                tts_text = sanitize_for_tts(final_text) if final_text else ""
             if tts_text:
                 await _set_state(ws, session, SessionState.SPEAKING)
                 # Clear cancellation flag before starting TTS
@@ -258,7 +364,7 @@ async def _process_agent_response(
                             ws,
                             AvatarStateMessage(state="speaking").model_dump(),
                         )
-                        await session.avatar_tts.speak(tts_text)
+                        await session.avatar_tts.speak(tts_text, trace)
                         # Keep avatar connected for the next turn to avoid
                         # 4429 throttling from rapid connect/disconnect cycles.
                         # The connection is torn down on barge-in (_cancel_tts)
@@ -287,25 +393,43 @@ async def _process_agent_response(
                         len(tts_text),
                     )
                     try:
-                        async for audio_chunk in session.speech_tts.synthesize(tts_text):
-                            # Check if barge-in was requested
-                            if session.tts_cancel_event.is_set():
-                                logger.info("TTS: stopping chunk delivery due to barge-in")
-                                break
-                            await _send_msg(ws, TtsAudioMessage(data=audio_chunk).model_dump())
+                        async with aclosing(
+                            session.speech_tts.synthesize_audio(
+                                tts_text, session.tts_cancel_event, trace,
+                            )
+                        ) as audio_chunks:
+                            async for audio_chunk in audio_chunks:
+                                # Check if barge-in was requested
+                                if session.tts_cancel_event.is_set():
+                                    logger.info("TTS: stopping chunk delivery due to barge-in")
+                                    break
+                                await _send_tts_audio(ws, session, audio_chunk)
                     except Exception:
                         logger.warning("TTS synthesis failed", exc_info=True)
 
         except Exception:
             logger.exception("Error processing agent response")
+            text_batcher.flush()
             await _send_msg(ws, ErrorMessage(message="Error processing your message").model_dump())
         finally:
+            text_batcher.flush()
+            if tts_task is not None and not tts_task.done():
+                tts_task.cancel()
+                try:
+                    await tts_task
+                except asyncio.CancelledError:
+                    pass
             # Only transition to IDLE if the session is still in an agent-owned
             # state (THINKING or SPEAKING).  If the user toggled the mic on
             # while the agent was running, the state will already be LISTENING
             # — we must not overwrite that or the mic appears "broken".
             if session.state in (SessionState.THINKING, SessionState.SPEAKING):
                 await _set_state(ws, session, SessionState.IDLE)
+            # Idle time for hibernation counts from the end of the turn.
+            session.touch()
+            if session.turn_trace is trace:
+                session.turn_trace = None
+            trace.finish()
 
 
 async def _handle_text(
@@ -337,15 +461,16 @@ async def _generate_session_summary(
     async with agent_lock:
         await _set_state(ws, session, SessionState.THINKING)
         full_summary: list[str] = []
+        summary_batcher = DeltaCoalescer(
+            _outbox(ws), lambda t: SessionSummaryChunkMessage(text=t, is_final=False).model_dump(),
+        )
         try:
             async for chunk in session.copilot.generate_summary(
                 session.conversation_history
             ):
                 full_summary.append(chunk)
-                await _send_msg(
-                    ws,
-                    SessionSummaryChunkMessage(text=chunk, is_final=False).model_dump(),
-                )
+                summary_batcher.add(chunk)
+            summary_batcher.flush()
 
             # Send the final consolidated summary
             final_text = "".join(full_summary)
@@ -355,11 +480,13 @@ async def _generate_session_summary(
             )
         except Exception:
             logger.exception("Error generating session summary")
+            summary_batcher.flush()
             await _send_msg(
                 ws,
                 ErrorMessage(message="Failed to generate session summary").model_dump(),
             )
         finally:
+            summary_batcher.flush()
             # Now clean up the session
             await session_manager.cleanup_session(session.session_id)
             await _set_state(ws, session, SessionState.IDLE)
@@ -414,6 +541,7 @@ async def _voicelive_listener(
 ) -> None:
     """Listen for VoiceLive events and dispatch agent calls as background tasks."""
     agent_tasks: list[asyncio.Task[None]] = []
+    speculator = TurnSpeculator(session, agent_lock) if settings.speculative_turns_enabled else None
 
     try:
         async for event in session.voicelive.receive_events():
@@ -421,27 +549,45 @@ async def _voicelive_listener(
 
             if event_type == "conversation.item.input_audio_transcription.completed":
                 text = event.get("transcript", "")
+                trace, session.voice_trace = session.voice_trace, None
+                speculation = speculator.take(text) if speculator is not None else None
                 if text:
+                    if trace is None:
+                        trace = TurnTrace(session.session_id, "voice")
+                    trace.mark("transcript_final")
                     await _send_msg(ws, TranscriptMessage(text=text, is_final=True).model_dump())
 
                     # Spawn agent processing in background (non-blocking)
                     task = asyncio.create_task(
-                        _process_agent_response(ws, session, text, agent_lock),
+                        _process_agent_response(ws, session, text, agent_lock, trace, speculation),
                         name="agent-voice",
                     )
+                    if speculation is not None:
+                        # Cancelled before it adopted the speculation: free its lock.
+                        task.add_done_callback(lambda _, spec=speculation: spec.abandon())
                     agent_tasks.append(task)
 
             elif event_type == "conversation.item.input_audio_transcription.delta":
                 text = event.get("transcript", "") or event.get("delta", "")
+                if text and speculator is not None:
+                    speculator.on_partial(text, replace=bool(event.get("transcript")))
                 if text:
                     # Barge-in: if TTS is playing and user starts speaking, stop it
                     await _cancel_tts(ws, session)
                     await _send_msg(ws, TranscriptMessage(text=text, is_final=False).model_dump())
 
             elif event_type == "input_audio_buffer.speech_started":
+                session.voice_trace = TurnTrace(session.session_id, "voice")
+                session.voice_trace.mark("speech_started")
+                if speculator is not None:
+                    speculator.on_speech_started()
                 # VoiceLive detected speech start — immediate barge-in
                 await _cancel_tts(ws, session)
 
+            elif event_type == "input_audio_buffer.speech_stopped":
+                if session.voice_trace is not None:
+                    session.voice_trace.mark("speech_stopped")
+
             elif event_type == "error":
                 error_msg = event.get("error", {}).get("message", "VoiceLive error")
                 await _send_msg(ws, ErrorMessage(message=error_msg).model_dump())
@@ -451,6 +597,8 @@ async def _voicelive_listener(
     except Exception:
         logger.exception("VoiceLive listener error")
     finally:
+        if speculator is not None:
+            await speculator.close()
         # Clean up any outstanding agent tasks
         for task in agent_tasks:
             if not task.done():
@@ -463,6 +611,43 @@ async def _voicelive_listener(
                     pass
 
 
+async def _resume_session(
+    ws: WebSocket, session: Session, agent_lock: asyncio.Lock,
+) -> asyncio.Task[None] | None:
+    """Wake a hibernated session before handling the message that woke it.
+
+    Services restart inline so audio can flow right away; the conversation
+    is restored into the new Copilot agent in the background, under
+    agent_lock so it lands before the next turn.  Returns that task, or
+    None if the wake failed.
+    """
+    try:
+        await session_manager.wake(session)
+    except AdmissionRejected as exc:
+        logger.info("Session %s can't wake yet: %s", session.session_id, exc.reason)
+        await _send_msg(
+            ws,
+            ErrorMessage(
+                message=f"Server is busy; please try again in {exc.retry_after} seconds.",
+            ).model_dump(),
+        )
+        return None
+    except Exception:
+        logger.exception("Failed to wake session %s", session.session_id)
+        await _send_msg(ws, ErrorMessage(message="Failed to resume the session. Please try again.").model_dump())
+        return None
+    if session.avatar_tts is not None:
+        # The old avatar connection is gone; the browser negotiates a new one.
+        await _send_msg(ws, AvatarStateMessage(state="disconnected").model_dump())
+
+    async def _restore() -> None:
+        async with agent_lock:
+            await session.copilot.restore_conversation_context(
+                session.conversation_history, reason=RESTORE_REASON_RESUME,
+            )
+
+    return asyncio.create_task(_restore(), name="resume-context")
+
 
 async def _restore_history(
     ws: WebSocket,
@@ -500,11 +685,82 @@ async def _restore_history(
             )
 
 
+async def _send_reconnect(ws: WebSocket) -> None:
+    """Tell the client to reconnect elsewhere, then close the socket."""
+    await _send_msg(ws, ReconnectMessage().model_dump())
+    await _outbox(ws).close(code=_DRAIN_CLOSE_CODE)
+
+
+def _spawn_drain(ws: WebSocket) -> None:
+    """Session drain hook: runs ``_send_reconnect`` in the background."""
+    ws.state.drain_task = asyncio.create_task(_send_reconnect(ws), name="ws-drain")
+
+
+async def _wait_for_admission(
+    ws: WebSocket, user_id: str, needs: dict[str, int],
+) -> tuple[AdmissionTicket | None, deque[dict[str, Any]], asyncio.Task[dict[str, Any]] | None]:
+    """Queue for admission, sending position updates, until admitted or refused.
+
+    Keeps reading the socket meanwhile so a client that leaves frees its
+    place at once; anything it sent is returned for replay, together with
+    a still-pending receive.  On refusal the client gets a ``busy`` message
+    with a retry hint and the socket is closed.
+    """
+    def _on_position(position: int, queue_length: int) -> None:
+        _outbox(ws).send(QueuedMessage(position=position, queue_length=queue_length).model_dump())
+
+    acquire_task = asyncio.create_task(
+        admission_controller.acquire(user_id, needs, _on_position), name="admission-wait",
+    )
+    early: deque[dict[str, Any]] = deque()
+    receive_task: asyncio.Task[dict[str, Any]] | None = None
+    try:
+        while not acquire_task.done():
+            if receive_task is None:
+                receive_task = asyncio.create_task(ws.receive(), name="admission-receive")
+            done, _ = await asyncio.wait(
+                {acquire_task, receive_task}, return_when=asyncio.FIRST_COMPLETED,
+            )
+            if receive_task in done:
+                message = receive_task.result()
+                receive_task = None
+                if message["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(message.get("code", 1000))
+                early.append(message)
+        ticket = acquire_task.result()
+    except AdmissionRejected as exc:
+        if receive_task is not None:
+            receive_task.cancel()
+        logger.info("Admission refused for user %s: %s", user_id, exc.reason)
+        await _send_msg(ws, BusyMessage(
+            message=exc.reason, retry_after_seconds=exc.retry_after,
+        ).model_dump())
+        await _outbox(ws).close(code=_BUSY_CLOSE_CODE)
+        return None, early, None
+    except BaseException:
+        acquire_task.cancel()
+        if receive_task is not None:
+            receive_task.cancel()
+        raise
+    return ticket, early, receive_task
+
+
 @router.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket) -> None:
-    await websocket.accept()
+    # Clients that offer the binary sub-protocol get raw PCM audio frames.
+    binary_audio = BINARY_AUDIO_SUBPROTOCOL in websocket.scope.get("subprotocols", [])
+    await websocket.accept(subprotocol=BINARY_AUDIO_SUBPROTOCOL if binary_audio else None)
+    outbox = WsOutbox(websocket)
+    websocket.state.outbox = outbox
+    outbox.start()
+    if session_manager.draining:
+        await _send_reconnect(websocket)
+        return
 
     session: Session | None = None
+    # Messages (and a pending read) left over from the admission queue.
+    early_messages: deque[dict[str, Any]] = deque()
+    pending_receive: asyncio.Task[dict[str, Any]] | None = None
     voicelive_task: asyncio.Task[None] | None = None
     agent_tasks: list[asyncio.Task[None]] = []
     # Serialises agent calls so concurrent text/voice messages don't
@@ -515,11 +771,39 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
         user_id = websocket.query_params.get("user_id", "anonymous")
         lite_mode = websocket.query_params.get("lite", "").lower() in ("1", "true")
         skill = websocket.query_params.get("skill", "databricks")
-        session = await session_manager.create_session(user_id, lite_mode=lite_mode, skill=skill)
+        tts_codec = websocket.query_params.get("tts_codec", DEFAULT_TTS_CODEC)
+        if tts_codec not in TTS_CODECS:
+            logger.info("Unsupported tts_codec %r requested, using %s", tts_codec, DEFAULT_TTS_CODEC)
+            tts_codec = DEFAULT_TTS_CODEC
+        needs = session_needs(lite_mode)
+        ticket = admission_controller.try_acquire(needs)
+        if ticket is None:
+            ticket, early_messages, pending_receive = await _wait_for_admission(
+                websocket, user_id, needs,
+            )
+            if ticket is None:
+                return
+            if session_manager.draining:
+                ticket.release()
+                await _send_reconnect(websocket)
+                return
+        try:
+            session = await session_manager.create_session(
+                user_id, lite_mode=lite_mode, skill=skill, tts_codec=tts_codec, admission=ticket,
+            )
+        except BaseException:
+            ticket.release()
+            raise
+        session.binary_audio = binary_audio
+        session.on_drain = lambda: _spawn_drain(websocket)
+        websocket.state.tts_pacer = TtsPacer(TTS_BYTES_PER_SECOND[session.tts_codec])
         await _send_msg(websocket, {
             "type": "session_created",
             "session_id": session.session_id,
             "lite_mode": session.lite_mode,
+            "binary_audio": session.binary_audio,
+            "tts_codec": session.tts_codec,
+            "startup_timings": session.startup_timings,
         })
         await _send_msg(websocket, StateMessage(state=session.state).model_dump())
         # VoiceLive listener is only needed in full (non-lite) mode.
@@ -529,15 +813,47 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
             )
 
         while True:
-            raw = await websocket.receive_text()
+            if early_messages:
+                message = early_messages.popleft()
+            elif pending_receive is not None:
+                message = await pending_receive
+                pending_receive = None
+            else:
+                message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            session.touch()
+            if session.hibernating:
+                resume_task = await _resume_session(websocket, session, agent_lock)
+                if resume_task is None:
+                    continue
+                agent_tasks.append(resume_task)
+                if voicelive_task is not None and not voicelive_task.done():
+                    # Normally over with the old connection, but may still be
+                    # unwinding; never run two listeners on one session.
+                    voicelive_task.cancel()
+                    try:
+                        await voicelive_task
+                    except asyncio.CancelledError:
+                        pass
+                if session.voicelive is not None:
+                    voicelive_task = asyncio.create_task(
+                        _voicelive_listener(websocket, session, agent_lock),
+                    )
+            if message.get("bytes") is not None:
+                WS_FRAMES_IN["binary"].inc()
+                await _handle_binary_frame(websocket, session, message["bytes"])
+                continue
             try:
-                data = json.loads(raw)
-                msg = _incoming_adapter.validate_python(data)
+                msg = parse_incoming(message.get("text") or "")
             except (json.JSONDecodeError, ValidationError) as exc:
+                WS_FRAMES_IN["invalid"].inc()
                 await _send_msg(websocket, ErrorMessage(message=f"Invalid message: {exc}").model_dump())
                 continue
+            WS_FRAMES_IN["audio" if isinstance(msg, str) else msg.type].inc()
 
-            if isinstance(msg, AudioMessage):
+            # Fast path: audio frames arrive as their bare base64 payload.
+            if isinstance(msg, str):
                 await _handle_audio(websocket, session, msg)
             elif isinstance(msg, TextMessage):
                 # Non-blocking: agent runs in background task
@@ -566,6 +882,8 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
     except Exception:
         logger.exception("WebSocket error")
     finally:
+        if pending_receive is not None and not pending_receive.done():
+            pending_receive.cancel()
         # Cancel agent tasks
         for task in agent_tasks:
             if not task.done():
@@ -584,4 +902,7 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
             except asyncio.CancelledError:
                 pass
         if session:
-            await session_manager.cleanup_session(session.session_id)
+            # The client is gone; nothing waits on the teardown, which the
+            # session manager tracks (and bounds on shutdown).
+            session_manager.release_session(session.session_id)
+        await outbox.close()
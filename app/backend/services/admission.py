@@ -0,0 +1,290 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from typing import Any
+
+from app.backend.config import settings
+from app.backend.services.metrics import Gauge
+
+logger = logging.getLogger(__name__)
+
+# Resource classes a session can hold.  "copilot" counts dedicated Copilot
+# CLI processes (full sessions); lite sessions run on the shared clients and
+# only need a "sessions" slot.
+RESOURCE_CLASSES: tuple[str, ...] = ("sessions", "copilot", "voicelive", "avatar")
+# Classes whose resources a hibernated session gives up until it wakes.
+HIBERNATION_RELEASED: tuple[str, ...] = ("copilot", "voicelive", "avatar")
+
+
+def session_needs(lite_mode: bool) -> dict[str, int]:
+    """Resource units a new session of the given mode holds while alive."""
+    needs = {"sessions": 1}
+    if not lite_mode:
+        needs["copilot"] = 1
+        needs["voicelive"] = 1
+        if settings.avatar_enabled:
+            needs["avatar"] = 1
+    return needs
+
+
+class AdmissionRejected(Exception):
+    """The node is full and the wait queue is too; retry after ``retry_after`` seconds."""
+
+    def __init__(self, reason: str, retry_after: int) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionTicket:
+    """Resources granted to one session; ``release`` (idempotent) returns them.
+
+    ``suspend``/``resume`` hand part of the grant back while a session has
+    released those resources (hibernation) and take it back afterwards.
+    """
+
+    def __init__(self, controller: "AdmissionController", needs: dict[str, int]) -> None:
+        self._controller = controller
+        self.needs = needs
+        self._suspended: dict[str, int] = {}
+        self._released = False
+
+    def suspend(self, classes: tuple[str, ...]) -> None:
+        """Return the units of *classes* to the pool until ``resume``."""
+        if self._released or self._suspended:
+            return
+        held = {cls: units for cls, units in self.needs.items() if cls in classes}
+        if not held:
+            return
+        self._suspended = held
+        self._controller._release(held)
+
+    def resume(self) -> None:
+        """Take suspended units back.
+
+        An existing session doesn't queue behind new ones, but it can't
+        exceed the budgets either: raises ``AdmissionRejected`` if the units
+        no longer fit (the ticket stays suspended).
+        """
+        if self._released or not self._suspended:
+            return
+        self._controller._reclaim(self._suspended)
+        self._suspended = {}
+
+    def release(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        held = {cls: units - self._suspended.get(cls, 0) for cls, units in self.needs.items()}
+        self._controller._release(held)
+
+
+class _Waiter:
+    __slots__ = ("user_id", "needs", "future", "on_position", "position", "enqueued_at")
+
+    def __init__(
+        self,
+        user_id: str,
+        needs: dict[str, int],
+        on_position: Callable[[int, int], None] | None,
+    ) -> None:
+        self.user_id = user_id
+        self.needs = needs
+        self.future: asyncio.Future[AdmissionTicket] = asyncio.get_running_loop().create_future()
+        self.on_position = on_position
+        self.position = 0
+        self.enqueued_at = time.monotonic()
+
+
+class AdmissionController:
+    """Global per-node budgets for session resources, with a fair wait queue.
+
+    Budgets come from ``admission_budgets`` (resource class -> units; classes
+    without an entry are unlimited).  A session that doesn't fit waits in a
+    queue that is FIFO per user and round-robin across users, so one user
+    opening many tabs can't push everyone else back.  Waiters hear about
+    their position as it changes.  Once ``admission_max_queue`` clients are
+    waiting, or a waiter has waited ``admission_queue_timeout_seconds``, the
+    request is rejected straight away with a retry hint.
+    """
+
+    def __init__(self) -> None:
+        self._in_use: dict[str, int] = dict.fromkeys(RESOURCE_CLASSES, 0)
+        self._queues: OrderedDict[str, deque[_Waiter]] = OrderedDict()
+        self._waiting = 0
+        # Metrics
+        self.admitted = 0
+        self.queued = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.queue_high_water = 0
+        self.wait_seconds_max = 0.0
+
+    def try_acquire(self, needs: dict[str, int]) -> AdmissionTicket | None:
+        """Grant *needs* immediately, or None if it doesn't fit (or others wait)."""
+        if self._waiting or not self._fits(needs):
+            return None
+        return self._grant(needs)
+
+    async def acquire(
+        self,
+        user_id: str,
+        needs: dict[str, int],
+        on_position: Callable[[int, int], None] | None = None,
+    ) -> AdmissionTicket:
+        """Wait for *needs* to fit; ``on_position(position, queue_length)`` tracks the wait.
+
+        Raises ``AdmissionRejected`` if the queue is full or the wait times out.
+        """
+        ticket = self.try_acquire(needs)
+        if ticket is not None:
+            return ticket
+        if self._waiting >= settings.admission_max_queue:
+            self.rejected += 1
+            raise AdmissionRejected("Server is at capacity", self._retry_after())
+
+        waiter = _Waiter(user_id, needs, on_position)
+        self._queues.setdefault(user_id, deque()).append(waiter)
+        self._waiting += 1
+        self.queued += 1
+        self.queue_high_water = max(self.queue_high_water, self._waiting)
+        # It may fit even though others are waiting (they're blocked on
+        # other resource classes).
+        self._dispatch()
+        self._update_positions()
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(waiter.future), timeout=settings.admission_queue_timeout_seconds,
+            )
+        except BaseException as exc:
+            if waiter.future.done():
+                # Granted just as the wait was abandoned: hand it back.
+                waiter.future.result().release()
+            else:
+                self._remove(waiter)
+            if isinstance(exc, asyncio.TimeoutError):
+                self.timed_out += 1
+                raise AdmissionRejected("Timed out waiting for capacity", self._retry_after()) from None
+            raise
+        finally:
+            self.wait_seconds_max = max(self.wait_seconds_max, time.monotonic() - waiter.enqueued_at)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "in_use": dict(self._in_use),
+            "budgets": {cls: settings.admission_budgets.get(cls) for cls in RESOURCE_CLASSES},
+            "waiting": self._waiting,
+            "queue_high_water": self.queue_high_water,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "wait_ms_max": round(self.wait_seconds_max * 1e3, 1),
+        }
+
+    def _fits(self, needs: dict[str, int]) -> bool:
+        budgets = settings.admission_budgets
+        return all(
+            cls not in budgets or self._in_use[cls] + units <= budgets[cls]
+            for cls, units in needs.items()
+        )
+
+    def _grant(self, needs: dict[str, int]) -> AdmissionTicket:
+        for cls, units in needs.items():
+            self._in_use[cls] += units
+        self.admitted += 1
+        return AdmissionTicket(self, needs)
+
+    def _reclaim(self, units_by_class: dict[str, int]) -> None:
+        if not self._fits(units_by_class):
+            self.rejected += 1
+            raise AdmissionRejected("Server is at capacity", self._retry_after())
+        for cls, units in units_by_class.items():
+            self._in_use[cls] += units
+
+    def _release(self, needs: dict[str, int]) -> None:
+        for cls, units in needs.items():
+            self._in_use[cls] -= units
+        if self._waiting:
+            self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Admit waiters that now fit, round-robin across users.
+
+        Waiters that don't fit are skipped rather than blocking the ones
+        behind them (e.g. a lite session behind one waiting for an avatar).
+        """
+        granted = False
+        progressed = True
+        while progressed:
+            progressed = False
+            for user_id, queue in self._queues.items():
+                waiter = next((w for w in queue if self._fits(w.needs)), None)
+                if waiter is None:
+                    continue
+                queue.remove(waiter)
+                self._waiting -= 1
+                if queue:
+                    # This user goes to the back of the rotation.
+                    self._queues.move_to_end(user_id)
+                else:
+                    del self._queues[user_id]
+                waiter.future.set_result(self._grant(waiter.needs))
+                granted = progressed = True
+                break
+        if granted:
+            self._update_positions()
+
+    def _remove(self, waiter: _Waiter) -> None:
+        queue = self._queues.get(waiter.user_id)
+        if queue is None or waiter not in queue:
+            return
+        queue.remove(waiter)
+        self._waiting -= 1
+        if not queue:
+            del self._queues[waiter.user_id]
+        # A blocked head may have left; others may fit now.
+        self._dispatch()
+        self._update_positions()
+
+    def _update_positions(self) -> None:
+        """Recompute 1-based positions in service order and notify changes."""
+        position = 0
+        depth = 0
+        while True:
+            found = False
+            for queue in self._queues.values():
+                if depth < len(queue):
+                    found = True
+                    position += 1
+                    waiter = queue[depth]
+                    if waiter.position != position:
+                        waiter.position = position
+                        if waiter.on_position is not None:
+                            try:
+                                waiter.on_position(position, self._waiting)
+                            except Exception:
+                                logger.debug("Admission position callback failed", exc_info=True)
+            if not found:
+                return
+            depth += 1
+
+    def _retry_after(self) -> int:
+        return settings.admission_retry_after_seconds
+
+
+admission_controller = AdmissionController()
+
+Gauge(
+    "admission_in_use",
+    "Admitted resource units in use, per resource class.",
+    ("resource",),
+    collect=lambda: [((cls,), units) for cls, units in admission_controller.stats()["in_use"].items()],
+)
+Gauge(
+    "admission_waiting",
+    "Sessions waiting in the admission queue.",
+    collect=lambda: [((), admission_controller.stats()["waiting"])],
+)
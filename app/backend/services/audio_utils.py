@@ -9,51 +9,97 @@ _ABBREVIATIONS = re.compile(
 )
 
 _ELLIPSIS = re.compile(r"\.{2,}")
+_TERMINATOR_RE = re.compile(r"[.?!]")
+
+_CODE_FENCE = "```"
+_CODE_BLOCK_RE = re.compile(r"```[\s\S]*?```")
 
 
 def detect_sentence_boundaries(text: str) -> list[str]:
     """Split text on sentence-ending punctuation while respecting abbreviations and ellipsis."""
     sentences: list[str] = []
-    current: list[str] = []
-
-    i = 0
-    chars = list(text)
-    length = len(chars)
-
-    while i < length:
-        char = chars[i]
-        current.append(char)
+    start = 0
+    length = len(text)
 
-        if char in ".?!":
-            current_text = "".join(current)
+    for match in _TERMINATOR_RE.finditer(text):
+        i = match.start()
+        char = text[i]
 
-            if char == "." and _ELLIPSIS.search(current_text):
-                i += 1
-                continue
+        if char == "." and _ELLIPSIS.search(text, start, i + 1):
+            continue
 
-            if char == "." and _ABBREVIATIONS.search(current_text):
-                i += 1
-                continue
+        # Abbreviations are at most 7 characters ("approx."), so only look back that far.
+        if char == "." and _ABBREVIATIONS.search(text, max(start, i - 7), i + 1):
+            continue
 
-            is_end = (i + 1 >= length) or (i + 1 < length and chars[i + 1] == " ")
+        is_end = (i + 1 >= length) or text[i + 1] == " "
 
-            if is_end:
-                sentence = current_text.strip()
-                if sentence:
-                    sentences.append(sentence)
-                current = []
-                if i + 1 < length and chars[i + 1] == " ":
-                    i += 1
+        if is_end:
+            sentence = text[start:i + 1].strip()
+            if sentence:
+                sentences.append(sentence)
+            start = i + 2 if i + 1 < length else i + 1
 
-        i += 1
-
-    remainder = "".join(current).strip()
+    remainder = text[start:].strip()
     if remainder:
         sentences.append(remainder)
 
     return sentences
 
 
+class SentenceStream:
+    """Incrementally cut a streamed response at sentence boundaries.
+
+    Deltas are fed as they arrive from the agent; each call returns the raw
+    text (whitespace and line breaks preserved) of the sentences that became
+    complete, or "" if none did.  The last fragment is always held back
+    until more text arrives (a trailing "." may still turn out to be part
+    of "3.5" or an abbreviation), and fenced code blocks are dropped as a
+    whole so sentence splits never land inside a Mermaid diagram.
+    """
+
+    def __init__(self) -> None:
+        self._raw = ""
+        self._pending = ""
+
+    def feed(self, delta: str) -> str:
+        self._raw += delta
+        # Only consume text up to an unterminated code fence (or a trailing
+        # run of backticks that may become one in the next delta).
+        safe_end = len(self._raw)
+        if self._raw.count(_CODE_FENCE) % 2:
+            safe_end = self._raw.rfind(_CODE_FENCE)
+        else:
+            stripped = self._raw.rstrip("`")
+            if len(self._raw) - len(stripped) < len(_CODE_FENCE):
+                safe_end = len(stripped)
+        if safe_end == 0:
+            return ""
+
+        safe, self._raw = self._raw[:safe_end], self._raw[safe_end:]
+        safe = _CODE_BLOCK_RE.sub("", safe)
+        # A new boundary needs a new terminator, or text after a trailing one.
+        rescan = any(c in safe for c in ".?!") or self._pending.endswith((".", "?", "!"))
+        self._pending += safe
+        if not rescan:
+            return ""
+
+        sentences = detect_sentence_boundaries(self._pending)
+        if len(sentences) < 2:
+            return ""
+        # Everything before the last (possibly incomplete) fragment is done.
+        cut = self._pending.rfind(sentences[-1])
+        complete, self._pending = self._pending[:cut], self._pending[cut:]
+        return complete
+
+    def flush(self) -> str:
+        """Return whatever is left once the stream has ended."""
+        remainder = _CODE_BLOCK_RE.sub("", self._pending + self._raw)
+        self._raw = ""
+        self._pending = ""
+        return remainder
+
+
 def base64_encode_audio(data: bytes) -> str:
     return base64.b64encode(data).decode("ascii")
 
@@ -4,9 +4,20 @@ import logging
 from typing import Any
 
 import aiohttp
-from azure.identity.aio import DefaultAzureCredential
 
 from app.backend.config import settings
+from app.backend.services.azure_credentials import (
+    COGNITIVE_SERVICES_SCOPE,
+    SharedAzureCredential,
+    shared_credential,
+)
+from app.backend.services.metrics import Counter
+from app.backend.services.sdk_executors import (
+    avatar_connect_executor,
+    avatar_speak_executor,
+    stop_executor,
+)
+from app.backend.services.turn_trace import TurnTrace
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +25,123 @@ _ICE_TOKEN_REFRESH_SECONDS = 60 * 60 * 23  # ~23 hours
 _AVATAR_CONNECT_TIMEOUT = 30  # seconds to wait for avatar WebRTC handshake
 _AVATAR_RETRY_MAX = 3  # max retries for transient errors (e.g. 4429 throttling)
 _AVATAR_RETRY_BASE_DELAY = 2.0  # base delay in seconds (exponential backoff)
+_ICE_TOKEN_RETRY_SECONDS = 60  # retry delay after a failed background refresh
+
+_CONNECT_ATTEMPTS = Counter(
+    "avatar_connect_attempts_total",
+    "Avatar WebRTC connect attempts by result (ok, throttled, timeout, error).",
+    ("result",),
+)
+_CONNECT_RESULTS = {
+    result: _CONNECT_ATTEMPTS.labels(result) for result in ("ok", "throttled", "timeout", "error")
+}
+_CONNECT_RETRIES = Counter(
+    "avatar_connect_retries_total", "Avatar connect retries after a timeout or 4429 throttle.",
+).labels()
+
+
+class IceTokenCache:
+    """Process-wide cache of the avatar ICE relay token.
+
+    The relay token is the same for every session, so one copy is fetched
+    through a pooled HTTP client and refreshed in the background every
+    ``_ICE_TOKEN_REFRESH_SECONDS``.  Callers read it from memory; only a
+    cache miss (no token yet, or a stale one after failed refreshes) waits
+    on an on-demand fetch, and concurrent misses share that fetch.
+    """
+
+    def __init__(self, credential: SharedAzureCredential = shared_credential) -> None:
+        self._credential = credential
+        self._token: dict[str, Any] | None = None
+        self._fetched_at = 0.0
+        self._http: aiohttp.ClientSession | None = None
+        self._inflight: asyncio.Task[dict[str, Any]] | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Fetch the first token and start the background refresh loop."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop(), name="ice-token-refresh")
+
+    async def get(self) -> dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        if self._token is not None and loop.time() - self._fetched_at < _ICE_TOKEN_REFRESH_SECONDS:
+            return self._token
+        logger.info("ICE token cache miss, fetching on demand")
+        return await asyncio.shield(self._refresh())
+
+    @staticmethod
+    def ice_servers(token: dict[str, Any]) -> list[dict[str, Any]]:
+        return [{
+            "urls": token.get("Urls", []),
+            "username": token.get("Username", ""),
+            "credential": token.get("Password", ""),
+        }]
+
+    def _refresh(self) -> asyncio.Task[dict[str, Any]]:
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._fetch(), name="ice-token-fetch")
+        return self._inflight
+
+    async def _fetch(self) -> dict[str, Any]:
+        """Fetch ICE relay token from Azure Speech service."""
+        region = settings.azure_speech_region
+        resource_id = settings.azure_speech_service_id
+
+        token_response = await self._credential.get_token(COGNITIVE_SERVICES_SCOPE)
+        aad_token = token_response.token
+
+        url = (
+            f"https://{region}.tts.speech.microsoft.com"
+            f"/cognitiveservices/avatar/relay/token/v1"
+        )
+        headers = {"Authorization": f"Bearer aad#{resource_id}#{aad_token}"}
+
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=15))
+
+        logger.info("Fetching ICE token from %s with resource_id=%s", url, resource_id)
+        async with self._http.get(url, headers=headers) as resp:
+            if resp.status != 200:
+                body = await resp.text()
+                raise RuntimeError(
+                    f"Failed to fetch ICE token: {resp.status} {body}"
+                )
+            token = json.loads(await resp.text())
+        self._token = token
+        self._fetched_at = asyncio.get_running_loop().time()
+        logger.info("ICE token refreshed")
+        return token
+
+    async def _refresh_loop(self) -> None:
+        delay = 0.0
+        while True:
+            try:
+                await asyncio.sleep(delay)
+                await self._refresh()
+                delay = _ICE_TOKEN_REFRESH_SECONDS
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                logger.warning("Background ICE token refresh failed", exc_info=True)
+                delay = _ICE_TOKEN_RETRY_SECONDS
+
+    async def close(self) -> None:
+        for task in (self._refresh_task, self._inflight):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._refresh_task = None
+        self._inflight = None
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+
+
+ice_token_cache = IceTokenCache()
 
 
 class AvatarTtsService:
@@ -29,8 +157,14 @@ class AvatarTtsService:
       3. disconnect_avatar() -> tears down connection, stops billing
     """
 
-    def __init__(self) -> None:
-        self._credential: DefaultAzureCredential | None = None
+    def __init__(
+        self,
+        credential: SharedAzureCredential = shared_credential,
+        ice_cache: IceTokenCache = ice_token_cache,
+    ) -> None:
+        self._shared_credential = credential
+        self._credential: SharedAzureCredential | None = None
+        self._ice_cache = ice_cache
         self._ice_token: dict[str, Any] | None = None
         self._synthesizer: Any | None = None  # speechsdk.SpeechSynthesizer
         self._connection: Any | None = None  # speechsdk.Connection
@@ -38,37 +172,17 @@ class AvatarTtsService:
 
     async def start(self) -> None:
         """Initialize credentials and fetch initial ICE token."""
-        self._credential = DefaultAzureCredential()
+        self._credential = self._shared_credential
         await self._refresh_ice_token()
 
     async def _refresh_ice_token(self) -> None:
-        """Fetch ICE relay token from Azure Speech service."""
-        region = settings.azure_speech_region
-        resource_id = settings.azure_speech_service_id
-
-        if self._credential is None:
-            raise RuntimeError("AvatarTtsService.start() must be called first")
-        token_response = await self._credential.get_token(
-            "https://cognitiveservices.azure.com/.default"
-        )
-        aad_token = token_response.token
-
-        url = (
-            f"https://{region}.tts.speech.microsoft.com"
-            f"/cognitiveservices/avatar/relay/token/v1"
-        )
-        headers = {"Authorization": f"Bearer aad#{resource_id}#{aad_token}"}
+        """Load the ICE relay token from the process-wide cache."""
+        self._ice_token = await self._ice_cache.get()
 
-        logger.info("Fetching ICE token from %s with resource_id=%s", url, resource_id)
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as resp:
-                if resp.status != 200:
-                    body = await resp.text()
-                    raise RuntimeError(
-                        f"Failed to fetch ICE token: {resp.status} {body}"
-                    )
-                self._ice_token = json.loads(await resp.text())
-                logger.info("ICE token refreshed")
+    async def get_ice_servers(self) -> list[dict[str, Any]]:
+        """Return ICE relay servers for the browser peer connection."""
+        await self._refresh_ice_token()
+        return self._ice_cache.ice_servers(self._ice_token or {})
 
     async def connect_avatar(self, client_sdp: str) -> tuple[str, list[dict[str, Any]]]:
         """Establish WebRTC avatar connection.
@@ -85,21 +199,17 @@ class AvatarTtsService:
         if self._connected or self._synthesizer:
             await self.disconnect_avatar()
 
-        if not self._ice_token:
-            await self._refresh_ice_token()
+        # Served from memory unless the shared cache is cold or stale.
+        await self._refresh_ice_token()
 
         region = settings.azure_speech_region
         resource_id = settings.azure_speech_service_id
 
         if self._credential is None:
             raise RuntimeError("AvatarTtsService.start() must be called first")
-        token_response = await self._credential.get_token(
-            "https://cognitiveservices.azure.com/.default"
-        )
+        token_response = await self._credential.get_token(COGNITIVE_SERVICES_SCOPE)
         aad_token = token_response.token
 
-        loop = asyncio.get_event_loop()
-
         def _do_connect():
             logger.info(
                 "Avatar _do_connect: creating SpeechConfig endpoint=wss://%s...enableTalkingAvatar, voice=%s",
@@ -189,11 +299,13 @@ class AvatarTtsService:
         for attempt in range(1, _AVATAR_RETRY_MAX + 1):
             try:
                 remote_sdp = await asyncio.wait_for(
-                    loop.run_in_executor(None, _do_connect),
+                    avatar_connect_executor.run(_do_connect),
                     timeout=_AVATAR_CONNECT_TIMEOUT,
                 )
+                _CONNECT_RESULTS["ok"].inc()
                 break  # success
             except asyncio.TimeoutError:
+                _CONNECT_RESULTS["timeout"].inc()
                 logger.error(
                     "Avatar connect_avatar: timed out after %ds (attempt %d/%d)",
                     _AVATAR_CONNECT_TIMEOUT, attempt, _AVATAR_RETRY_MAX,
@@ -211,11 +323,14 @@ class AvatarTtsService:
                 last_error = exc
                 # Only retry on throttling (4429) errors
                 if "4429" not in str(exc):
+                    _CONNECT_RESULTS["error"].inc()
                     raise
+                _CONNECT_RESULTS["throttled"].inc()
 
             if attempt < _AVATAR_RETRY_MAX:
                 delay = _AVATAR_RETRY_BASE_DELAY * (2 ** (attempt - 1))
                 logger.info("Avatar connect_avatar: retrying in %.1fs", delay)
+                _CONNECT_RETRIES.inc()
                 await asyncio.sleep(delay)
                 # Re-clean before retry
                 if self._connected or self._synthesizer:
@@ -224,26 +339,20 @@ class AvatarTtsService:
                 raise last_error  # type: ignore[misc]
         self._connected = True
         logger.info("Avatar connected successfully")
-        ice = self._ice_token or {}
-        ice_servers = [{
-            "urls": ice.get("Urls", []),
-            "username": ice.get("Username", ""),
-            "credential": ice.get("Password", ""),
-        }]
-        return remote_sdp, ice_servers
+        return remote_sdp, self._ice_cache.ice_servers(self._ice_token or {})
 
-    async def speak(self, text: str) -> None:
+    async def speak(self, text: str, trace: TurnTrace | None = None) -> None:
         """Speak text through the connected avatar.
 
         The avatar lip-syncs and produces audio+video through the
         existing WebRTC stream.  This call blocks until speech is done.
+        *trace*, if given, gets ``avatar_speak``/``avatar_done`` marks.
         """
         import azure.cognitiveservices.speech as speechsdk
 
         if not self._synthesizer or not self._connected:
             raise RuntimeError("Avatar not connected")
 
-        loop = asyncio.get_event_loop()
         synthesizer = self._synthesizer
 
         def _do_speak() -> None:
@@ -255,14 +364,17 @@ class AvatarTtsService:
                     details.reason, details.error_details,
                 )
 
-        await loop.run_in_executor(None, _do_speak)
+        if trace is not None:
+            trace.mark("avatar_speak")
+        await avatar_speak_executor.run(_do_speak)
+        if trace is not None:
+            trace.mark("avatar_done")
 
     async def stop_speaking(self) -> None:
         """Interrupt the current avatar speech (barge-in)."""
         if not self._connection:
             return
 
-        loop = asyncio.get_event_loop()
         connection = self._connection
 
         def _do_stop() -> None:
@@ -274,7 +386,8 @@ class AvatarTtsService:
             except Exception:
                 logger.warning("Failed to stop avatar speaking", exc_info=True)
 
-        await loop.run_in_executor(None, _do_stop)
+        # Reserved lane: never queued behind long avatar speech.
+        await stop_executor.run(_do_stop)
 
     async def disconnect_avatar(self) -> None:
         """Tear down the avatar WebRTC session to stop billing.
@@ -283,7 +396,6 @@ class AvatarTtsService:
         fully established (e.g. after a failed connect_avatar attempt).
         """
         self._connected = False
-        loop = asyncio.get_event_loop()
 
         synthesizer = self._synthesizer
         self._synthesizer = None
@@ -297,7 +409,7 @@ class AvatarTtsService:
                     pass
 
             try:
-                await loop.run_in_executor(None, _do_close)
+                await stop_executor.run(_do_close)
             except Exception:
                 logger.warning("Avatar disconnect: error during synthesizer cleanup", exc_info=True)
 
@@ -310,6 +422,5 @@ class AvatarTtsService:
     async def close(self) -> None:
         """Full cleanup — disconnect avatar and release credentials."""
         await self.disconnect_avatar()
-        if self._credential:
-            await self._credential.close()
-            self._credential = None
+        # The credential is shared process-wide; just drop the reference.
+        self._credential = None
@@ -0,0 +1,110 @@
+import asyncio
+import logging
+import time
+from typing import Any
+
+from azure.core.credentials import AccessToken
+from azure.identity.aio import DefaultAzureCredential
+
+logger = logging.getLogger(__name__)
+
+COGNITIVE_SERVICES_SCOPE = "https://cognitiveservices.azure.com/.default"
+
+_REFRESH_MARGIN_SECONDS = 300  # refresh in the background this long before expiry
+_MIN_VALIDITY_SECONDS = 30  # below this remaining lifetime, callers wait for a new token
+_RETRY_DELAY_SECONDS = 30  # scheduled refresh retry after a failed fetch
+
+
+class SharedAzureCredential:
+    """Process-wide AsyncTokenCredential with an in-memory token cache.
+
+    Wraps a single DefaultAzureCredential so the credential chain is resolved
+    once per process instead of once per session.  Tokens are cached per
+    scope and refreshed on a timer before they expire, so hot paths (TTS
+    synthesis, avatar connects) are served from memory.  Concurrent refreshes
+    of the same scope share one in-flight request.
+
+    Implements the ``AsyncTokenCredential`` protocol, so it can be handed to
+    SDKs (e.g. VoiceLive ``connect``) directly.  Services must not close it;
+    its lifetime is owned by the application lifespan.
+    """
+
+    def __init__(self) -> None:
+        self._credential: DefaultAzureCredential | None = None
+        self._tokens: dict[tuple[str, ...], AccessToken] = {}
+        self._inflight: dict[tuple[str, ...], asyncio.Task[AccessToken]] = {}
+        self._timers: dict[tuple[str, ...], asyncio.TimerHandle] = {}
+
+    async def get_token(self, *scopes: str, **kwargs: Any) -> AccessToken:
+        if kwargs:
+            # Claims challenges / tenant overrides are rare; don't cache them.
+            return await self._get_credential().get_token(*scopes, **kwargs)
+
+        token = self._tokens.get(scopes)
+        if token is not None:
+            remaining = token.expires_on - time.time()
+            if remaining > _MIN_VALIDITY_SECONDS:
+                if remaining < _REFRESH_MARGIN_SECONDS:
+                    self._refresh(scopes)
+                return token
+        # Shield so a cancelled caller doesn't cancel the shared refresh.
+        return await asyncio.shield(self._refresh(scopes))
+
+    def _get_credential(self) -> DefaultAzureCredential:
+        if self._credential is None:
+            self._credential = DefaultAzureCredential()
+        return self._credential
+
+    def _refresh(self, scopes: tuple[str, ...]) -> asyncio.Task[AccessToken]:
+        task = self._inflight.get(scopes)
+        if task is None:
+            task = asyncio.create_task(self._fetch(scopes), name="azure-token-refresh")
+            self._inflight[scopes] = task
+            task.add_done_callback(lambda t: self._on_refreshed(scopes, t))
+        return task
+
+    async def _fetch(self, scopes: tuple[str, ...]) -> AccessToken:
+        token = await self._get_credential().get_token(*scopes)
+        self._tokens[scopes] = token
+        return token
+
+    def _on_refreshed(self, scopes: tuple[str, ...], task: asyncio.Task[AccessToken]) -> None:
+        self._inflight.pop(scopes, None)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.warning("Azure token refresh failed for %s: %s", scopes, exc)
+            delay = _RETRY_DELAY_SECONDS
+        else:
+            delay = max(
+                task.result().expires_on - time.time() - _REFRESH_MARGIN_SECONDS,
+                _RETRY_DELAY_SECONDS,
+            )
+        timer = self._timers.pop(scopes, None)
+        if timer is not None:
+            timer.cancel()
+        loop = asyncio.get_running_loop()
+        self._timers[scopes] = loop.call_later(delay, self._refresh, scopes)
+
+    async def close(self) -> None:
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        for task in list(self._inflight.values()):
+            task.cancel()
+        self._inflight.clear()
+        self._tokens.clear()
+        if self._credential is not None:
+            await self._credential.close()
+            self._credential = None
+
+    async def __aenter__(self) -> "SharedAzureCredential":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        # Shared across sessions; closed once from the app lifespan.
+        return None
+
+
+shared_credential = SharedAzureCredential()
@@ -5,7 +5,9 @@ from collections.abc import AsyncGenerator
 from copilot import CopilotClient, CopilotSession, PermissionHandler, SessionEvent
 from copilot.types import MCPRemoteServerConfig
 
-from app.backend.config import settings
+from app.backend.services.copilot_clients import client_options, copilot_client_pool
+from app.backend.services.metrics import Counter
+from app.backend.services.turn_trace import TurnTrace
 
 logger = logging.getLogger(__name__)
 
@@ -215,32 +217,71 @@ _MCP_SERVERS: dict[str, MCPRemoteServerConfig] = {
 # Sentinel to signal end of streaming
 _STREAM_DONE = object()
 
+_TURNS = Counter(
+    "copilot_turns_total",
+    "Agent turns by outcome (completed, error, timeout, aborted).",
+    ("outcome",),
+)
+_TURN_OUTCOMES = {
+    outcome: _TURNS.labels(outcome) for outcome in ("completed", "error", "timeout", "aborted")
+}
+_TOOL_CALLS = Counter("copilot_tool_calls_total", "Tool calls made by the agent.").labels()
+
+# Why the context is being restored; leads the restoration prompt.
+RESTORE_REASON_MODE_SWITCH = (
+    "The user has switched conversation modes (between lite and full)."
+)
+RESTORE_REASON_RESUME = (
+    "The session was paused while the user was away and has now resumed."
+)
+RESTORE_REASON_RECONNECT = (
+    "The session lost its connection to the assistant and has been reconnected."
+)
+# Leads the prompt sent after an aborted (speculative) turn.
+_DISREGARD_ABORTED_NOTE = (
+    "[The previous user message was an early, incomplete transcript and has "
+    "been withdrawn; ignore it and any reply to it.] "
+)
+
+
+class AgentTurn:
+    """Handle on one ``send_message`` call, so that call alone can be aborted."""
+
+    __slots__ = ("sent", "history")
+
+    def __init__(self) -> None:
+        # True once the prompt was handed to the Copilot session.
+        self.sent = False
+        # Local history entries this turn added.
+        self.history: list[dict[str, str]] = []
+
 
 class CopilotAgent:
-    def __init__(self, skill: str = _DEFAULT_SKILL) -> None:
+    def __init__(self, skill: str = _DEFAULT_SKILL, *, shared_client: bool = False) -> None:
+        # Shared-client agents run their session on a pooled CLI process
+        # (see copilot_clients) instead of spawning their own.
+        self._shared_client = shared_client
         self._client: CopilotClient | None = None
         self._session: CopilotSession | None = None
         self._conversation_history: list[dict[str, str]] = []
         self._unsubscribe: callable | None = None
         self._skill = skill
         self._skill_dirs = _SKILL_DIRECTORIES.get(skill, _SKILL_DIRECTORIES[_DEFAULT_SKILL])
+        # Set by abort_turn: the session still holds the aborted prompt.
+        self._disregard_aborted = False
+
+    @property
+    def shared_client(self) -> bool:
+        return self._shared_client
 
     async def start(self) -> None:
-        options: dict = {}
-        if settings.copilot_github_token:
-            options["github_token"] = settings.copilot_github_token
-            options["use_logged_in_user"] = False
-
-        self._client = CopilotClient(options or None)
-        await self._client.start()
-
-        self._session = await self._client.create_session({
-            "model": "claude-sonnet-4.6",
-            "skill_directories": self._skill_dirs,
-            "system_message": {"content": _SYSTEM_PROMPT},
-            "mcp_servers": _MCP_SERVERS,
-            "on_permission_request": PermissionHandler.approve_all,
-        })
+        if self._shared_client:
+            self._client = await copilot_client_pool.acquire()
+        else:
+            self._client = CopilotClient(client_options())
+            await self._client.start()
+
+        await self._create_session()
 
         # Warm-up: send a hidden message to force skill loading so the
         # first real user message doesn't stall.
@@ -255,12 +296,59 @@ class CopilotAgent:
             logger.warning("Copilot warm-up failed (non-fatal)", exc_info=True)
             self._conversation_history.clear()
 
-    async def send_message(self, text: str) -> AsyncGenerator[str, None]:
-        """Send a message and yield streaming delta chunks."""
+    async def _create_session(self) -> None:
+        try:
+            self._session = await self._client.create_session({
+                "model": "claude-sonnet-4.6",
+                "skill_directories": self._skill_dirs,
+                "system_message": {"content": _SYSTEM_PROMPT},
+                "mcp_servers": _MCP_SERVERS,
+                "on_permission_request": PermissionHandler.approve_all,
+            })
+        except Exception:
+            if self._shared_client:
+                # Don't place more sessions on a client that can't host one.
+                await copilot_client_pool.release(self._client, failed=True)
+                self._client = None
+            raise
+
+    async def _reattach(self) -> None:
+        """Move to another shared client after ours died, replaying the conversation."""
+        logger.warning("Shared Copilot client lost; moving the session to another one")
+        # The session went down with the process; nothing to destroy.
+        self._session = None
+        self._disregard_aborted = False
+        self._client = await copilot_client_pool.acquire()
+        await self._create_session()
+        history = list(self._conversation_history)
+        if history:
+            await self.restore_conversation_context(history, reason=RESTORE_REASON_RECONNECT)
+            # Keep the entries themselves, not the restoration prompt (abort_turn matches by identity).
+            self._conversation_history[:] = history
+
+    async def send_message(
+        self, text: str, trace: TurnTrace | None = None, turn: AgentTurn | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """Send a message and yield streaming delta chunks.
+
+        *trace*, if given, is marked when the prompt is sent, at the first
+        delta, on tool calls and when the turn completes.  *turn* records
+        what this call did, for ``abort_turn``.
+        """
         if not self._client or not self._session:
             raise RuntimeError("CopilotAgent not started")
-
-        self._conversation_history.append({"role": "user", "content": text})
+        if self._shared_client and not copilot_client_pool.is_live(self._client):
+            await self._reattach()
+        if turn is None:
+            turn = AgentTurn()
+
+        user_entry = {"role": "user", "content": text}
+        self._conversation_history.append(user_entry)
+        turn.history.append(user_entry)
+        prompt = text
+        if self._disregard_aborted:
+            self._disregard_aborted = False
+            prompt = _DISREGARD_ABORTED_NOTE + text
 
         queue: asyncio.Queue = asyncio.Queue()
         full_response: list[str] = []
@@ -268,6 +356,7 @@ class CopilotAgent:
         # Mutable state shared with the closure.  Using a list so
         # ``nonlocal`` isn't needed (we mutate the container, not rebind).
         _turn_had_tool_calls = [False]
+        _turn_outcome = ["completed"]
 
         def _event_handler(event: SessionEvent) -> None:
             event_type = event.type.value if hasattr(event.type, 'value') else str(event.type)
@@ -302,6 +391,7 @@ class CopilotAgent:
             elif event_type == "session.error":
                 error_msg = event.data.message or "Unknown Copilot error"
                 logger.error("Copilot session error: %s", error_msg)
+                _turn_outcome[0] = "error"
                 queue.put_nowait(_STREAM_DONE)
             elif event_type in (
                 # SDK-level tool call events (assistant-initiated)
@@ -314,39 +404,85 @@ class CopilotAgent:
             ):
                 _turn_had_tool_calls[0] = True
                 logger.info("Copilot tool event: %s", event_type)
+                if event_type in ("assistant.tool_call", "tool.execution_start"):
+                    _TOOL_CALLS.inc()
+                    if trace is not None:
+                        trace.mark("tool_call")
                 queue.put_nowait(None)  # keep-alive sentinel
             else:
                 logger.info("Copilot event (unhandled): %s", event_type)
         unsubscribe = self._session.on(_event_handler)
 
+        outcome = "aborted"
         try:
             # send() returns a message ID, streaming happens via events
-            await self._session.send({"prompt": text})
+            # Counts as sent even if cancelled mid-request: it may have arrived.
+            turn.sent = True
+            try:
+                await self._session.send({"prompt": prompt})
+            except Exception:
+                turn.sent = False
+                raise
+            if trace is not None:
+                trace.mark("copilot_sent")
 
             while True:
                 try:
                     chunk = await asyncio.wait_for(queue.get(), timeout=300.0)
                 except asyncio.TimeoutError:
                     logger.warning("Copilot response timed out after 300s")
+                    outcome = "timeout"
                     break
 
                 if chunk is _STREAM_DONE:
+                    outcome = _turn_outcome[0]
+                    if trace is not None:
+                        trace.mark("copilot_done")
                     break
                 # Skip keep-alive sentinels from tool-call events
                 if chunk is None:
                     continue
+                if trace is not None:
+                    trace.mark("first_token")
                 full_response.append(chunk)
                 yield chunk
         finally:
             unsubscribe()
+            _TURN_OUTCOMES[outcome].inc()
 
-        self._conversation_history.append({
-            "role": "assistant",
-            "content": "".join(full_response),
-        })
+        reply_entry = {"role": "assistant", "content": "".join(full_response)}
+        self._conversation_history.append(reply_entry)
+        turn.history.append(reply_entry)
 
-    async def restore_conversation_context(self, history: list[dict[str, str]]) -> None:
-        """Restore conversation context after a mode-toggle reconnect.
+    async def abort_turn(self, turn: AgentTurn) -> None:
+        """Withdraw *turn*, a ``send_message`` call whose stream was closed.
+
+        For speculative turns started from a partial transcript.  Its
+        entries leave the local history.  If its prompt reached the Copilot
+        session, the turn is aborted there and the next message tells the
+        model to ignore it.
+        """
+        # By identity: an equal entry may belong to another turn.
+        self._conversation_history[:] = [
+            entry for entry in self._conversation_history
+            if not any(entry is own for own in turn.history)
+        ]
+        turn.history.clear()
+        if not turn.sent or not self._session:
+            return
+        try:
+            await self._session.abort()
+        except Exception:
+            logger.warning("Failed to abort Copilot turn", exc_info=True)
+        self._disregard_aborted = True
+
+    async def restore_conversation_context(
+        self,
+        history: list[dict[str, str]],
+        *,
+        reason: str = RESTORE_REASON_MODE_SWITCH,
+    ) -> None:
+        """Restore conversation context after a mode-toggle reconnect or a resume.
 
         Sends a hidden context message to the Copilot session so it is aware
         of the prior conversation.  Also populates the local history list.
@@ -370,8 +506,7 @@ class CopilotAgent:
         transcript = "\n\n".join(transcript_lines)
 
         context_prompt = (
-            "[SYSTEM CONTEXT RESTORATION] The user has switched conversation "
-            "modes (between lite and full). The conversation below is the "
+            f"[SYSTEM CONTEXT RESTORATION] {reason} The conversation below is the "
             "complete history of the session so far. Continue the Architecture "
             "Design Session from where it left off. Do NOT greet or restart. "
             "Do NOT summarize what happened — just acknowledge you are ready "
@@ -479,9 +614,12 @@ class CopilotAgent:
                 logger.warning("Error destroying Copilot session", exc_info=True)
             self._session = None
 
-        if self._client:
+        if self._client and self._shared_client:
+            await copilot_client_pool.release(self._client)
+            self._client = None
+        elif self._client:
             try:
-                self._client.stop()
+                await self._client.stop()
             except Exception:
                 logger.warning("Error stopping CopilotClient", exc_info=True)
             self._client = None
@@ -0,0 +1,152 @@
+import asyncio
+import logging
+from typing import Any
+
+from copilot import CopilotClient
+
+from app.backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Shared CLI processes are pinged this often; one that doesn't answer
+# within the timeout is considered dead.
+_PING_INTERVAL_SECONDS = 30.0
+_PING_TIMEOUT_SECONDS = 10.0
+
+
+def client_options() -> dict[str, Any] | None:
+    """Options for a new ``CopilotClient`` (token auth when configured)."""
+    options: dict[str, Any] = {}
+    if settings.copilot_github_token:
+        options["github_token"] = settings.copilot_github_token
+        options["use_logged_in_user"] = False
+    return options or None
+
+
+class _SharedClient:
+    def __init__(self, client: CopilotClient) -> None:
+        self.client = client
+        self.sessions = 0
+        self.failed = False
+
+
+class CopilotClientPool:
+    """Long-lived ``CopilotClient`` processes shared by many agents.
+
+    Each client is one CLI subprocess; the SDK multiplexes any number of
+    ``CopilotSession``s over it and routes events to the right session, so
+    lite (text-only) agents lease a client here instead of spawning their
+    own.  Up to ``copilot_shared_clients`` clients are started on demand
+    and each lease goes to the least-loaded one.  A client that fails to
+    create a session is taken out of rotation and stopped once its last
+    lease is released.  Live clients are pinged periodically; one whose
+    process stopped answering is dropped at once with all its leases, and
+    its agents move to another client on their next message (see
+    ``is_live``).
+    """
+
+    def __init__(self) -> None:
+        self._clients: list[_SharedClient] = []
+        self._by_client: dict[int, _SharedClient] = {}
+        self._spawn_lock = asyncio.Lock()
+        self._monitor_task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    async def acquire(self) -> CopilotClient:
+        """Lease a started client; pair with ``release``."""
+        if self._closed:
+            raise RuntimeError("Copilot client pool is closed")
+        shared = self._least_loaded()
+        if shared is None or (shared.sessions and self._can_spawn()):
+            async with self._spawn_lock:
+                # Another caller may have added a client while we waited.
+                shared = self._least_loaded()
+                if shared is None or (shared.sessions and self._can_spawn()):
+                    shared = await self._spawn()
+        shared.sessions += 1
+        return shared.client
+
+    async def release(self, client: CopilotClient, *, failed: bool = False) -> None:
+        """Return a lease; with *failed*, retire the client from rotation."""
+        shared = self._by_client.get(id(client))
+        if shared is None:
+            return
+        shared.sessions -= 1
+        if failed and not shared.failed:
+            logger.warning("Copilot client pool: retiring failed client (%d sessions on it)", shared.sessions)
+            shared.failed = True
+        if shared.failed and shared.sessions <= 0:
+            await self._remove(shared)
+
+    def is_live(self, client: CopilotClient | None) -> bool:
+        """Whether *client* is still a pooled client (not dropped as dead)."""
+        return client is not None and id(client) in self._by_client
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "clients": len(self._clients),
+            "sessions": [shared.sessions for shared in self._clients],
+        }
+
+    def _least_loaded(self) -> _SharedClient | None:
+        live = [shared for shared in self._clients if not shared.failed]
+        return min(live, key=lambda shared: shared.sessions, default=None)
+
+    def _can_spawn(self) -> bool:
+        live = sum(1 for shared in self._clients if not shared.failed)
+        return live < max(1, settings.copilot_shared_clients)
+
+    async def _spawn(self) -> _SharedClient:
+        client = CopilotClient(client_options())
+        await client.start()
+        shared = _SharedClient(client)
+        self._clients.append(shared)
+        self._by_client[id(client)] = shared
+        logger.info("Copilot client pool: started shared client %d", len(self._clients))
+        if self._monitor_task is None or self._monitor_task.done():
+            self._monitor_task = asyncio.create_task(self._monitor(), name="copilot-client-monitor")
+        return shared
+
+    async def _monitor(self) -> None:
+        while self._clients:
+            await asyncio.sleep(_PING_INTERVAL_SECONDS)
+            live = [shared for shared in self._clients if not shared.failed]
+            results = await asyncio.gather(
+                *(asyncio.wait_for(shared.client.ping(), _PING_TIMEOUT_SECONDS) for shared in live),
+                return_exceptions=True,
+            )
+            for shared, result in zip(live, results):
+                if isinstance(result, Exception) and shared in self._clients:
+                    await self._drop_dead(shared, result)
+
+    async def _drop_dead(self, shared: _SharedClient, error: Exception) -> None:
+        logger.warning(
+            "Copilot client pool: shared client not responding (%r), dropping it and its %d lease(s)",
+            error, shared.sessions,
+        )
+        shared.failed = True
+        # Its agents' sessions died with the process; their slots are free.
+        shared.sessions = 0
+        await self._remove(shared)
+
+    async def _remove(self, shared: _SharedClient) -> None:
+        if shared in self._clients:
+            self._clients.remove(shared)
+        self._by_client.pop(id(shared.client), None)
+        try:
+            await shared.client.stop()
+        except Exception:
+            logger.warning("Error stopping shared CopilotClient", exc_info=True)
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._monitor_task is not None and not self._monitor_task.done():
+            self._monitor_task.cancel()
+            try:
+                await self._monitor_task
+            except asyncio.CancelledError:
+                pass
+        await asyncio.gather(*(self._remove(shared) for shared in list(self._clients)))
+
+
+copilot_client_pool = CopilotClientPool()
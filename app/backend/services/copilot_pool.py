@@ -0,0 +1,188 @@
+import asyncio
+import logging
+import time
+from collections import deque
+
+from app.backend.config import settings
+from app.backend.services.copilot_agent import CopilotAgent
+
+logger = logging.getLogger(__name__)
+
+_REAP_INTERVAL_SECONDS = 30
+_WARM_RETRY_DELAY = 5.0  # back-off after a failed warm-up before refilling again
+
+# Pool lane: (skill, shared_client).  Lite sessions draw from the
+# shared-client lane so their agents run on the shared CLI processes.
+_Lane = tuple[str, bool]
+
+
+class _PooledAgent:
+    def __init__(self, agent: CopilotAgent) -> None:
+        self.agent = agent
+        self.primed_at = time.monotonic()
+
+
+class CopilotAgentPool:
+    """Keeps started, warmed-up CopilotAgents ready per skill.
+
+    ``CopilotAgent.start`` spawns the CLI client, creates a session and runs
+    a full warm-up turn, which dominates session creation latency.  The pool
+    does that work ahead of time so ``acquire`` can hand out a primed agent
+    instantly.
+
+    Sizing per skill:
+      - ``copilot_pool_min_size`` agents are always kept warm.
+      - Each ``acquire`` miss raises the warm target by one, up to
+        ``copilot_pool_max_size``, so bursts grow the pool.
+      - Agents idle longer than ``copilot_pool_max_idle_seconds`` are
+        retired and the target decays back toward the minimum.
+
+    Agents on shared CLI clients (for lite sessions) are pooled in their
+    own lane per skill, which starts empty and grows only on misses.
+    """
+
+    def __init__(self) -> None:
+        self._ready: dict[_Lane, deque[_PooledAgent]] = {}
+        self._warming: dict[_Lane, int] = {}
+        self._target: dict[_Lane, int] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._reap_task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    async def start(self) -> None:
+        self._closed = False
+        for skill, minimum in settings.copilot_pool_min_size.items():
+            lane = (skill, False)
+            self._target[lane] = min(minimum, self._max_size(skill))
+            self._refill(lane)
+        if any(settings.copilot_pool_max_size.values()) or self._target:
+            self._reap_task = asyncio.create_task(self._reap_loop(), name="copilot-pool-reaper")
+
+    def acquire(self, skill: str, *, shared_client: bool = False) -> CopilotAgent | None:
+        """Return a primed agent for *skill*, or ``None`` if none is ready.
+
+        Never blocks: on a miss the caller starts its own agent and the pool
+        grows its target so the next burst is absorbed.
+        """
+        lane = (skill, shared_client)
+        ready = self._ready.get(lane)
+        if ready:
+            pooled = ready.popleft()
+            logger.info(
+                "Copilot pool: handed out %s agent (%d left ready)", _label(lane), len(ready),
+            )
+            self._refill(lane)
+            return pooled.agent
+
+        maximum = self._max_size(skill)
+        if maximum > 0:
+            self._target[lane] = min(self._target.get(lane, 0) + 1, maximum)
+            logger.info(
+                "Copilot pool: miss for %s, target now %d", _label(lane), self._target[lane],
+            )
+            self._refill(lane)
+        return None
+
+    def ready_count(self, skill: str, *, shared_client: bool = False) -> int:
+        return len(self._ready.get((skill, shared_client), ()))
+
+    def _max_size(self, skill: str) -> int:
+        return settings.copilot_pool_max_size.get(
+            skill, settings.copilot_pool_min_size.get(skill, 0)
+        )
+
+    def _min_size(self, lane: _Lane) -> int:
+        skill, shared_client = lane
+        return 0 if shared_client else settings.copilot_pool_min_size.get(skill, 0)
+
+    def _refill(self, lane: _Lane) -> None:
+        if self._closed:
+            return
+        missing = (
+            self._target.get(lane, 0)
+            - len(self._ready.get(lane, ()))
+            - self._warming.get(lane, 0)
+        )
+        for _ in range(missing):
+            self._warming[lane] = self._warming.get(lane, 0) + 1
+            task = asyncio.create_task(self._warm_one(lane), name=f"copilot-pool-warm-{_label(lane)}")
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _warm_one(self, lane: _Lane) -> None:
+        skill, shared_client = lane
+        agent = CopilotAgent(skill=skill, shared_client=shared_client)
+        try:
+            await agent.start()
+        except asyncio.CancelledError:
+            self._warming[lane] -= 1
+            await agent.stop()
+            raise
+        except Exception:
+            logger.warning("Copilot pool: failed to warm %s agent", _label(lane), exc_info=True)
+            await agent.stop()
+            self._warming[lane] -= 1
+            await asyncio.sleep(_WARM_RETRY_DELAY)
+            self._refill(lane)
+            return
+
+        self._warming[lane] -= 1
+        if self._closed:
+            await agent.stop()
+            return
+        self._ready.setdefault(lane, deque()).append(_PooledAgent(agent))
+        logger.info(
+            "Copilot pool: %s agent ready (%d ready)", _label(lane), len(self._ready[lane]),
+        )
+
+    async def _reap_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.sleep(_REAP_INTERVAL_SECONDS)
+                await self._reap_idle()
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                logger.exception("Error in Copilot pool reaper")
+
+    async def _reap_idle(self) -> None:
+        cutoff = time.monotonic() - settings.copilot_pool_max_idle_seconds
+        for lane, ready in list(self._ready.items()):
+            # Agents are appended as they become ready, so the oldest are first.
+            stale: list[_PooledAgent] = []
+            while ready and ready[0].primed_at < cutoff:
+                stale.append(ready.popleft())
+            if not stale:
+                continue
+            self._target[lane] = max(self._min_size(lane), self._target.get(lane, 0) - len(stale))
+            logger.info("Copilot pool: retiring %d idle %s agent(s)", len(stale), _label(lane))
+            for pooled in stale:
+                await pooled.agent.stop()
+            self._refill(lane)
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._reap_task and not self._reap_task.done():
+            self._reap_task.cancel()
+            try:
+                await self._reap_task
+            except asyncio.CancelledError:
+                pass
+        for task in list(self._tasks):
+            task.cancel()
+        for task in list(self._tasks):
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        for ready in self._ready.values():
+            while ready:
+                await ready.popleft().agent.stop()
+
+
+def _label(lane: _Lane) -> str:
+    skill, shared_client = lane
+    return f"{skill} (shared client)" if shared_client else skill
+
+
+copilot_pool = CopilotAgentPool()
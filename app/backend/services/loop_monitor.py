@@ -0,0 +1,162 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Any
+
+from app.backend.config import settings
+from app.backend.services.metrics import Counter, Histogram
+
+logger = logging.getLogger(__name__)
+
+_STACK_LIMIT = 30  # innermost frames kept per captured stall
+_RECENT_STALLS = 20  # stalls kept for /health
+_STALL_LOG_INTERVAL = 5.0  # min seconds between stall stack logs
+
+# Lag is usually well under a millisecond; buckets resolve small stalls.
+_LAG_BUCKETS: tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)
+
+_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "How late the event loop ran a timer scheduled to fire now.",
+    buckets=_LAG_BUCKETS,
+).labels()
+_STALLS = Counter(
+    "event_loop_stalls_total", "Times the event loop was blocked past loop_monitor_stall_ms.",
+).labels()
+
+
+class LoopLagMonitor:
+    """Measures event-loop scheduling lag and catches what blocks the loop.
+
+    A probe task sleeps ``loop_monitor_interval_ms`` at a time and records
+    how much later than requested it woke up: time the loop spent running
+    something else.  The probe also leaves a heartbeat; a daemon watchdog
+    thread checks it and, once the loop is overdue by
+    ``loop_monitor_stall_ms``, grabs the loop thread's current stack with
+    ``sys._current_frames`` -- i.e. the coroutine or callback that is
+    blocking right now, not whatever runs after it.  One stack is taken per
+    stall and logging is rate-limited, so a stuck node can't flood the logs.
+    """
+
+    def __init__(self) -> None:
+        self._task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._loop_thread_id = 0
+        # Monotonic time the probe went to sleep; read by the watchdog.
+        self._heartbeat = 0.0
+        self._interval = 0.1
+        self.max_lag = 0.0
+        self.stalls = 0
+        self.recent_stalls: deque[dict[str, Any]] = deque(maxlen=_RECENT_STALLS)
+        self._last_stall_log = 0.0
+        self._suppressed_logs = 0
+
+    async def start(self) -> None:
+        if not settings.loop_monitor_enabled:
+            logger.info("Event-loop monitor disabled")
+            return
+        if self._task is not None and not self._task.done():
+            return
+        self._interval = max(0.001, settings.loop_monitor_interval_ms / 1000)
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._task = asyncio.create_task(self._run(), name="loop-lag-monitor")
+        if settings.loop_monitor_stall_ms > 0:
+            self._stop.clear()
+            self._watchdog = threading.Thread(
+                target=self._watch, args=(settings.loop_monitor_stall_ms / 1000,),
+                name="loop-watchdog", daemon=True,
+            )
+            self._watchdog.start()
+
+    async def _run(self) -> None:
+        interval = self._interval
+        while True:
+            started = time.monotonic()
+            self._heartbeat = started
+            await asyncio.sleep(interval)
+            lag = max(0.0, time.monotonic() - started - interval)
+            _LAG.observe(lag)
+            if lag > self.max_lag:
+                self.max_lag = lag
+
+    def _watch(self, threshold: float) -> None:
+        """Watchdog thread: capture the loop thread's stack when it stalls."""
+        check_every = max(0.01, threshold / 4)
+        reported = 0.0
+        while not self._stop.wait(check_every):
+            heartbeat = self._heartbeat
+            overdue = time.monotonic() - heartbeat - self._interval
+            if overdue < threshold or heartbeat == reported:
+                continue
+            # One capture per stall: the heartbeat moves once the loop runs again.
+            reported = heartbeat
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = traceback.format_stack(frame, limit=_STACK_LIMIT) if frame is not None else []
+            del frame
+            self._record_stall(overdue, stack)
+
+    def _record_stall(self, overdue: float, stack: list[str]) -> None:
+        self.stalls += 1
+        _STALLS.inc()
+        # Innermost frame, e.g. 'File ".../tts_sanitizer.py", line 42, in detect_sentence_boundaries'.
+        where = stack[-1].strip().splitlines()[0] if stack else "unknown"
+        self.recent_stalls.append({
+            "at": time.time(),
+            "blocked_ms": round(overdue * 1e3, 1),
+            "where": where,
+        })
+        now = time.monotonic()
+        if now - self._last_stall_log < _STALL_LOG_INTERVAL:
+            self._suppressed_logs += 1
+            return
+        self._last_stall_log = now
+        suppressed, self._suppressed_logs = self._suppressed_logs, 0
+        logger.warning(
+            "Event loop blocked for %.0f ms so far (%d stall log(s) suppressed); loop thread stack:\n%s",
+            overdue * 1e3, suppressed, "".join(stack),
+        )
+
+    def stats(self) -> dict[str, Any]:
+        # Bucket interpolation can overshoot the largest lag actually seen.
+        p50, p95, p99 = (
+            None if value is None else min(value, self.max_lag)
+            for value in (_LAG.quantile(0.50), _LAG.quantile(0.95), _LAG.quantile(0.99))
+        )
+        return {
+            "enabled": self._task is not None and not self._task.done(),
+            "samples": _LAG.count,
+            "lag_ms_p50": _ms(p50),
+            "lag_ms_p95": _ms(p95),
+            "lag_ms_p99": _ms(p99),
+            "lag_ms_max": _ms(self.max_lag),
+            "stalls": self.stalls,
+            "recent_stalls": list(self.recent_stalls),
+        }
+
+    async def close(self) -> None:
+        self._stop.set()
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1.0)
+            self._watchdog = None
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+
+def _ms(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1e3, 2)
+
+
+loop_monitor = LoopLagMonitor()
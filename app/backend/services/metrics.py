@@ -0,0 +1,278 @@
+import bisect
+import logging
+import math
+from collections.abc import Callable, Iterable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets (seconds) covering fast cache hits up to slow tool-heavy turns.
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 7.5, 10.0, 20.0, 30.0, 60.0,
+)
+
+
+class _HistogramChild:
+    """One label combination of a ``Histogram``; ``observe`` doesn't allocate."""
+
+    __slots__ = ("_buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self._buckets = buckets
+        # counts[i] is the number of observations in (buckets[i-1], buckets[i]];
+        # the last slot is the +Inf overflow.
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self._buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the *q* quantile by interpolating within its bucket."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                if index == len(self._buckets):
+                    return self._buckets[-1]
+                lower = self._buckets[index - 1] if index else 0.0
+                upper = self._buckets[index]
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self._buckets[-1]
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "avg": round(self.sum / self.count, 4) if self.count else None,
+            "p50": _round(self.quantile(0.50)),
+            "p95": _round(self.quantile(0.95)),
+            "p99": _round(self.quantile(0.99)),
+        }
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class _Metric:
+    """Base for labelled metrics; children are created once per label set."""
+
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.help = help_text
+        self.labelnames = labelnames
+        self._children: dict[tuple[str, ...], Any] = {}
+        _REGISTRY.append(self)
+
+    def _new_child(self) -> Any:
+        raise NotImplementedError
+
+    def labels(self, *values: str) -> Any:
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            child = self._children[values] = self._new_child()
+        return child
+
+    def bind(self, *prefix: str) -> "_ChildMap":
+        """Children keyed by the last label value, created on first use.
+
+        For labels only known at runtime (e.g. message types): looking up an
+        existing key is a plain dict hit with no tuple built.
+        """
+        return _ChildMap(self, prefix)
+
+    def children(self) -> dict[tuple[str, ...], Any]:
+        return self._children
+
+
+class _ChildMap(dict):
+    def __init__(self, metric: _Metric, prefix: tuple[str, ...]) -> None:
+        super().__init__()
+        self._metric = metric
+        self._prefix = prefix
+
+    def __missing__(self, value: str) -> Any:
+        child = self[value] = self._metric.labels(*self._prefix, value)
+        return child
+
+
+class Counter(_Metric):
+    """Monotonic counter; bind label values once and ``inc`` the child."""
+
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment an unlabelled counter."""
+        self.labels().inc(amount)
+
+
+class Gauge(_Metric):
+    """Point-in-time value, either ``set`` on a child or read at scrape time.
+
+    With *collect*, the gauge is sampled only when exported: the callable
+    returns ``(label_values, value)`` pairs, so nothing is tracked on the
+    hot path for values the owning object already knows (queue depths,
+    session counts).
+    """
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...] = (),
+        collect: Callable[[], Iterable[tuple[tuple[str, ...], float]]] | None = None,
+    ) -> None:
+        super().__init__(name, help_text, labelnames)
+        self._collect = collect
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        """Set an unlabelled gauge."""
+        self.labels().set(value)
+
+    def samples(self) -> Iterable[tuple[tuple[str, ...], float]]:
+        if self._collect is not None:
+            return self._collect()
+        return [(values, child.value) for values, child in self._children.items()]
+
+
+class Histogram(_Metric):
+    """Bucketed histogram with optional labels.
+
+    Bind label values once (``hist.labels("voice")``) and keep the child:
+    observing through it is a bisect and three increments.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        self.buckets = buckets
+        super().__init__(name, help_text, labelnames)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Observe on an unlabelled histogram."""
+        self.labels().observe(value)
+
+
+_REGISTRY: list[_Metric] = []
+
+
+def latency_summary() -> dict[str, Any]:
+    """Count, average and p50/p95/p99 of every histogram, per label set."""
+    summary: dict[str, Any] = {}
+    for histogram in _REGISTRY:
+        if not isinstance(histogram, Histogram):
+            continue
+        summary[histogram.name] = {
+            ",".join(f"{k}={v}" for k, v in zip(histogram.labelnames, values)) or "all": child.summary()
+            for values, child in histogram.children().items()
+        }
+    return summary
+
+
+def render_prometheus() -> str:
+    """Every registered metric in the Prometheus text exposition format."""
+    lines: list[str] = []
+    for metric in _REGISTRY:
+        lines.append(f"# HELP {metric.name} {_escape_help(metric.help)}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        try:
+            if isinstance(metric, Gauge):
+                for values, value in metric.samples():
+                    lines.append(f"{metric.name}{_label_text(metric.labelnames, values)} {_number(value)}")
+            elif isinstance(metric, Counter):
+                for values, child in list(metric.children().items()):
+                    lines.append(f"{metric.name}{_label_text(metric.labelnames, values)} {_number(child.value)}")
+            elif isinstance(metric, Histogram):
+                for values, child in list(metric.children().items()):
+                    _render_histogram(lines, metric, values, child)
+        except Exception:
+            logger.warning("Failed to export metric %s", metric.name, exc_info=True)
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _render_histogram(
+    lines: list[str], metric: Histogram, values: tuple[str, ...], child: _HistogramChild,
+) -> None:
+    cumulative = 0
+    for upper, bucket_count in zip(metric.buckets, child.counts):
+        cumulative += bucket_count
+        labels = _label_text(metric.labelnames + ("le",), values + (_number(upper),))
+        lines.append(f"{metric.name}_bucket{labels} {cumulative}")
+    labels = _label_text(metric.labelnames + ("le",), values + ("+Inf",))
+    lines.append(f"{metric.name}_bucket{labels} {child.count}")
+    labels = _label_text(metric.labelnames, values)
+    lines.append(f"{metric.name}_sum{labels} {_number(child.sum)}")
+    lines.append(f"{metric.name}_count{labels} {child.count}")
+
+
+def _label_text(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_label(str(value))}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+
+def _round(value: float | None) -> float | None:
+    return None if value is None else round(value, 4)
@@ -0,0 +1,156 @@
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from app.backend.config import settings
+from app.backend.services.metrics import Gauge
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("started", "abandoned")
+
+    def __init__(self) -> None:
+        self.started = False
+        self.abandoned = False
+
+
+class SdkExecutor:
+    """Named, bounded thread pool for one class of blocking Speech SDK work.
+
+    Workloads get their own pools so slow calls (30 s avatar connects,
+    whole-utterance avatar speech) can't starve short ones (TTS synthesis
+    starts, barge-in stops) the way they did on the shared default
+    executor.  Calls whose awaiting coroutine is cancelled before a worker
+    picks them up are skipped rather than run late.
+
+    Metrics: queue depth (current and high-water), running calls, and the
+    time calls waited for a worker (total and max).
+    """
+
+    def __init__(self, name: str, max_workers: int) -> None:
+        self.name = name
+        self.max_workers = max_workers
+        self._pool: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.abandoned = 0
+        self.queued = 0
+        self.running = 0
+        self.queue_high_water = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run ``fn(*args)`` on this pool and return its result."""
+        loop = asyncio.get_running_loop()
+        call = _Call()
+        submitted_at = time.monotonic()
+        with self._lock:
+            self.submitted += 1
+            self.queued += 1
+            self.queue_high_water = max(self.queue_high_water, self.queued)
+
+        def _run() -> T | None:
+            waited = time.monotonic() - submitted_at
+            with self._lock:
+                if call.abandoned:
+                    return None
+                call.started = True
+                self.queued -= 1
+                self.running += 1
+                self.wait_seconds_total += waited
+                self.wait_seconds_max = max(self.wait_seconds_max, waited)
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self.running -= 1
+
+        try:
+            result = await loop.run_in_executor(self._get_pool(), _run)
+        except asyncio.CancelledError:
+            with self._lock:
+                if not call.started:
+                    call.abandoned = True
+                    self.queued -= 1
+                    self.abandoned += 1
+            raise
+        except Exception:
+            self.failed += 1
+            raise
+        self.completed += 1
+        return result  # type: ignore[return-value]
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            started = self.submitted - self.queued - self.abandoned
+            return {
+                "max_workers": self.max_workers,
+                "queued": self.queued,
+                "running": self.running,
+                "queue_high_water": self.queue_high_water,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "abandoned": self.abandoned,
+                "wait_ms_avg": round(self.wait_seconds_total / started * 1e3, 2) if started else 0.0,
+                "wait_ms_max": round(self.wait_seconds_max * 1e3, 2),
+            }
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix=f"sdk-{self.name}",
+            )
+        return self._pool
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# Speech SDK synthesizer setup and utterance starts (short calls).
+synthesis_executor = SdkExecutor("synthesis", settings.sdk_synthesis_workers)
+# Avatar WebRTC connects: up to _AVATAR_CONNECT_TIMEOUT each.
+avatar_connect_executor = SdkExecutor("avatar-connect", settings.sdk_avatar_connect_workers)
+# Avatar speech: blocks for the whole utterance.
+avatar_speak_executor = SdkExecutor("avatar-speak", settings.sdk_avatar_speak_workers)
+# Reserved lane for stop/teardown calls, so barge-in never queues behind speech.
+stop_executor = SdkExecutor("stop", settings.sdk_stop_workers)
+
+_EXECUTORS = (synthesis_executor, avatar_connect_executor, avatar_speak_executor, stop_executor)
+
+
+def executor_stats() -> dict[str, dict[str, Any]]:
+    return {executor.name: executor.stats() for executor in _EXECUTORS}
+
+
+Gauge(
+    "sdk_executor_queue_depth",
+    "Speech SDK calls waiting for a worker, per executor.",
+    ("executor",),
+    collect=lambda: [((executor.name,), executor.queued) for executor in _EXECUTORS],
+)
+Gauge(
+    "sdk_executor_running",
+    "Speech SDK calls running, per executor.",
+    ("executor",),
+    collect=lambda: [((executor.name,), executor.running) for executor in _EXECUTORS],
+)
+
+
+def shutdown_executors() -> None:
+    for executor in _EXECUTORS:
+        executor.shutdown()
+    logger.info("SDK executors shut down")
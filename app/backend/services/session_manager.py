@@ -1,48 +1,155 @@
 import asyncio
+import heapq
 import logging
+import time
 import uuid
+from collections import Counter
+from collections.abc import Callable, Coroutine, Iterable
 from datetime import datetime, timezone
 from typing import Any
 
 from app.backend.config import settings
 from app.backend.models.session_state import SessionState
+from app.backend.models.ws_messages import DEFAULT_TTS_CODEC, TtsCodec
+from app.backend.services.admission import HIBERNATION_RELEASED, AdmissionTicket
+from app.backend.services.azure_credentials import shared_credential
 from app.backend.services.copilot_agent import CopilotAgent
+from app.backend.services.copilot_pool import copilot_pool
+from app.backend.services.metrics import Gauge
 from app.backend.services.voicelive_service import VoiceLiveService
 from app.backend.services.avatar_tts_service import AvatarTtsService
 from app.backend.services.speech_tts_service import SpeechTtsService
+from app.backend.services.turn_trace import TurnTrace
 
 logger = logging.getLogger(__name__)
 
-_CLEANUP_INTERVAL_SECONDS = 60
+# Per-service start-up timeouts (seconds).  Copilot's includes the warm-up turn.
+_STARTUP_TIMEOUTS: dict[str, float] = {
+    "voicelive": 20.0,
+    "copilot": 120.0,
+    "speech_tts": 10.0,
+    "avatar_tts": 20.0,
+}
+# How long cancelled teardowns get to run their finally blocks (admission
+# release, executor stops) before _cleanup_many gives up on them.
+_CANCEL_GRACE_SECONDS = 2.0
+
+
+async def _timed_start(name: str, coro: Coroutine[Any, Any, None], timings: dict[str, float]) -> None:
+    """Await one service start-up under its timeout, recording elapsed ms."""
+    started = time.monotonic()
+    try:
+        await asyncio.wait_for(coro, timeout=_STARTUP_TIMEOUTS[name])
+    finally:
+        timings[name] = round((time.monotonic() - started) * 1000, 1)
 
 
 class Session:
-    def __init__(self, session_id: str, user_id: str, *, lite_mode: bool = False, skill: str = "databricks") -> None:
+    def __init__(
+        self,
+        session_id: str,
+        user_id: str,
+        *,
+        lite_mode: bool = False,
+        skill: str = "databricks",
+        copilot: CopilotAgent | None = None,
+        tts_codec: TtsCodec = DEFAULT_TTS_CODEC,
+        admission: AdmissionTicket | None = None,
+    ) -> None:
         self.session_id = session_id
         self.user_id = user_id
         self.lite_mode = lite_mode
         self.skill = skill
-        # In lite mode, voice/TTS/avatar services are not initialised.
-        self.voicelive: VoiceLiveService | None = None if lite_mode else VoiceLiveService()
-        self.copilot: CopilotAgent = CopilotAgent(skill=skill)
-        self.speech_tts: SpeechTtsService | None = None if lite_mode else SpeechTtsService()
-        self.avatar_tts: AvatarTtsService | None = (
-            None if lite_mode else (AvatarTtsService() if settings.avatar_enabled else None)
-        )
+        # Codec of outbound TTS audio, negotiated on connect.
+        self.tts_codec: TtsCodec = tts_codec
+        # Admission budget held until the session is torn down.
+        self.admission = admission
+        self.voicelive: VoiceLiveService | None = None
+        self.copilot: CopilotAgent
+        self.copilot_prewarmed = False
+        self.speech_tts: SpeechTtsService | None = None
+        self.avatar_tts: AvatarTtsService | None = None
+        self._build_services(copilot)
+        # True while idle resources are released (see SessionManager.hibernate);
+        # conversation_history is kept so the session can be rehydrated.
+        self.hibernating = False
+        # Serialises hibernate/wake so they never interleave.
+        self.lifecycle_lock = asyncio.Lock()
         self.state: SessionState = SessionState.IDLE
+        # Agent turns queued or running on this session; hibernation waits for 0.
+        self.agent_turns = 0
         self.created_at: datetime = datetime.now(timezone.utc)
         self.last_activity: datetime = datetime.now(timezone.utc)
+        # Monotonic twin of last_activity; drives the expiry heap.
+        self.last_activity_monotonic: float = time.monotonic()
+        # Deadline of the session's live expiry-heap entry, None if it has none.
+        self.scheduled_deadline: float | None = None
         self.conversation_history: list[dict[str, Any]] = []
         self.turn_count: int = 0
         self.tts_cancel_event: asyncio.Event = asyncio.Event()
         self.avatar_ready_event: asyncio.Event = asyncio.Event()
+        # True when the client negotiated the binary PCM audio sub-protocol.
+        self.binary_audio: bool = False
+        # Per-service start-up durations in ms, filled by SessionManager.
+        self.startup_timings: dict[str, float] = {}
+        # Latency trace of the utterance VoiceLive is capturing, and of the
+        # turn the agent is answering (see ``turn_trace``).
+        self.voice_trace: TurnTrace | None = None
+        self.turn_trace: TurnTrace | None = None
+        # Called once when the server starts draining; the WebSocket handler
+        # uses it to tell the client to reconnect elsewhere.
+        self.on_drain: Callable[[], None] | None = None
+
+    def _build_services(self, copilot: CopilotAgent | None) -> None:
+        """Create (not start) the session's services; used on creation and wake-up."""
+        # In lite mode, voice/TTS/avatar services are not initialised.
+        # All Azure services share one process-wide credential and token cache.
+        self.voicelive = (
+            None if self.lite_mode else VoiceLiveService(credential=shared_credential)
+        )
+        # A pre-warmed agent from the pool is already started.
+        # Lite sessions run on the shared Copilot CLI processes.
+        self.copilot = copilot or CopilotAgent(skill=self.skill, shared_client=self.lite_mode)
+        self.copilot_prewarmed = copilot is not None
+        self.speech_tts = (
+            None
+            if self.lite_mode
+            else SpeechTtsService(credential=shared_credential, codec=self.tts_codec)
+        )
+        self.avatar_tts = (
+            None
+            if self.lite_mode or not settings.avatar_enabled
+            else AvatarTtsService(credential=shared_credential)
+        )
 
     def touch(self) -> None:
+        # O(1): the expiry heap picks up the new deadline lazily.
         self.last_activity = datetime.now(timezone.utc)
+        self.last_activity_monotonic = time.monotonic()
+
+    @property
+    def expires_at(self) -> float:
+        """Monotonic deadline after which the session is expired."""
+        return self.last_activity_monotonic + settings.session_ttl_seconds
+
+    @property
+    def hibernates_at(self) -> float | None:
+        """Monotonic deadline for hibernation, or None if it doesn't apply."""
+        idle_seconds = settings.session_hibernate_after_seconds
+        if self.hibernating or idle_seconds <= 0:
+            return None
+        return self.last_activity_monotonic + idle_seconds
+
+    @property
+    def next_deadline(self) -> float:
+        """Earliest monotonic time at which the session may need attention."""
+        hibernates_at = self.hibernates_at
+        if hibernates_at is None:
+            return self.expires_at
+        return min(hibernates_at, self.expires_at)
 
     def is_expired(self) -> bool:
-        elapsed = (datetime.now(timezone.utc) - self.last_activity).total_seconds()
-        return elapsed > settings.session_ttl_seconds
+        return time.monotonic() > self.expires_at
 
 
 class SessionManager:
@@ -50,53 +157,122 @@ class SessionManager:
         self._sessions: dict[str, Session] = {}
         self._user_sessions: dict[str, list[str]] = {}
         self._cleanup_task: asyncio.Task[None] | None = None
+        # Min-heap of (deadline, session_id) for TTL expiry and hibernation,
+        # one live entry per session (its ``scheduled_deadline``); any other
+        # entry is stale and dropped when popped.  touch() only moves a
+        # session's deadlines later, so the expiry loop re-checks the live
+        # deadlines when an entry comes due and re-queues if needed.
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._expiry_wakeup = asyncio.Event()
+        # In-flight teardowns by session id, shared by every cleanup path so
+        # shutdown can wait on (and time out) teardowns already under way.
+        self._closing: dict[str, asyncio.Task[None]] = {}
+        self._cleanup_limit = asyncio.Semaphore(max(1, settings.session_cleanup_concurrency))
+        self._draining = False
+        self._hibernating = 0
+
+    @property
+    def draining(self) -> bool:
+        """True once shutdown has begun; no new sessions are accepted."""
+        return self._draining
 
     async def start(self) -> None:
         self._cleanup_task = asyncio.create_task(self._cleanup_loop())
 
-    async def create_session(self, user_id: str, *, lite_mode: bool = False, skill: str = "databricks") -> Session:
+    async def create_session(
+        self,
+        user_id: str,
+        *,
+        lite_mode: bool = False,
+        skill: str = "databricks",
+        tts_codec: TtsCodec = DEFAULT_TTS_CODEC,
+        admission: AdmissionTicket | None = None,
+    ) -> Session:
+        """Create and start a session.
+
+        *admission* is the caller's admission ticket; the session releases it
+        on teardown.  If creation fails the caller still owns it.
+        """
+        if self._draining:
+            raise RuntimeError("Server is draining; not accepting new sessions")
         user_session_ids = self._user_sessions.get(user_id, [])
         if len(user_session_ids) >= settings.max_sessions_per_user:
             oldest_id = user_session_ids[0]
             await self.cleanup_session(oldest_id)
         session_id = str(uuid.uuid4())
-        session = Session(session_id=session_id, user_id=user_id, lite_mode=lite_mode, skill=skill)
-        if session.voicelive is not None:
-            try:
-                await session.voicelive.connect()
-            except Exception:
-                logger.warning("VoiceLive connection failed, session will operate without voice", exc_info=True)
-        try:
-            await session.copilot.start()
-        except Exception:
-            logger.error("Copilot agent failed to start", exc_info=True)
-            if session.voicelive is not None:
-                await session.voicelive.close()
-            raise
-        if session.speech_tts is not None:
-            try:
-                await session.speech_tts.start()
-            except Exception:
-                logger.error("Speech TTS failed to start", exc_info=True)
-                if session.voicelive is not None:
-                    await session.voicelive.close()
-                await session.copilot.stop()
-                raise
-        if session.avatar_tts is not None:
-            try:
-                await session.avatar_tts.start()
-            except Exception:
-                logger.warning(
-                    "Avatar TTS failed to start, session will operate without avatar",
-                    exc_info=True,
-                )
-                session.avatar_tts = None
+        session = Session(
+            session_id=session_id,
+            user_id=user_id,
+            lite_mode=lite_mode,
+            skill=skill,
+            copilot=copilot_pool.acquire(skill, shared_client=lite_mode),
+            tts_codec=tts_codec,
+            admission=admission,
+        )
+        await self._start_services(session)
         self._sessions[session_id] = session
+        self._schedule_expiry(session)
         self._user_sessions.setdefault(user_id, []).append(session_id)
         mode_label = "lite" if lite_mode else "full"
         logger.info("Created %s session %s for user %s (skill=%s)", mode_label, session_id, user_id, skill)
         return session
 
+    async def _start_services(self, session: Session) -> None:
+        """Start the session's services concurrently.
+
+        The services do not depend on each other, so they all launch at once
+        and start-up costs roughly the slowest one instead of the sum.
+        VoiceLive and avatar failures are non-fatal; Copilot and Speech
+        failures roll back everything and re-raise.
+        """
+        steps: dict[str, Coroutine[Any, Any, None]] = {}
+        if session.voicelive is not None:
+            steps["voicelive"] = session.voicelive.connect()
+        if not session.copilot_prewarmed:
+            steps["copilot"] = session.copilot.start()
+        if session.speech_tts is not None:
+            steps["speech_tts"] = session.speech_tts.start()
+        if session.avatar_tts is not None:
+            steps["avatar_tts"] = session.avatar_tts.start()
+
+        results = await asyncio.gather(
+            *(_timed_start(name, coro, session.startup_timings) for name, coro in steps.items()),
+            return_exceptions=True,
+        )
+        errors = {
+            name: result
+            for name, result in zip(steps, results)
+            if isinstance(result, BaseException)
+        }
+        logger.info(
+            "Session %s startup timings (ms): %s", session.session_id, session.startup_timings,
+        )
+
+        if "voicelive" in errors:
+            logger.warning(
+                "VoiceLive connection failed, session will operate without voice",
+                exc_info=errors["voicelive"],
+            )
+        if "avatar_tts" in errors and session.avatar_tts is not None:
+            logger.warning(
+                "Avatar TTS failed to start, session will operate without avatar",
+                exc_info=errors["avatar_tts"],
+            )
+            try:
+                await session.avatar_tts.close()
+            except Exception:
+                logger.debug("Error closing failed Avatar TTS", exc_info=True)
+            session.avatar_tts = None
+
+        fatal = [name for name in ("copilot", "speech_tts") if name in errors]
+        if fatal:
+            if "copilot" in errors:
+                logger.error("Copilot agent failed to start", exc_info=errors["copilot"])
+            if "speech_tts" in errors:
+                logger.error("Speech TTS failed to start", exc_info=errors["speech_tts"])
+            await self._close_services(session)
+            raise errors[fatal[0]]
+
     def get_session(self, session_id: str) -> Session:
         session = self._sessions.get(session_id)
         if not session:
@@ -105,9 +281,28 @@ class SessionManager:
         return session
 
     async def cleanup_session(self, session_id: str) -> None:
+        task = self._closing.get(session_id) or self._begin_cleanup(session_id)
+        if task is not None:
+            # Shielded: a cancelled caller (e.g. a WebSocket handler torn
+            # down on shutdown) must not abort the teardown half-way.
+            await asyncio.shield(task)
+
+    def release_session(self, session_id: str) -> None:
+        """Start tearing *session_id* down without waiting for it to finish.
+
+        For callers that don't need the result (a closed WebSocket); the
+        teardown is tracked, so ``cleanup_all`` still waits on it.
+        """
+        if session_id not in self._closing:
+            self._begin_cleanup(session_id)
+
+    def _begin_cleanup(self, session_id: str) -> asyncio.Task[None] | None:
+        """Unregister *session_id* and start its teardown; None if unknown."""
         session = self._sessions.pop(session_id, None)
         if not session:
-            return
+            return None
+        if session.hibernating:
+            self._hibernating -= 1
 
         user_ids = self._user_sessions.get(session.user_id, [])
         if session_id in user_ids:
@@ -115,29 +310,136 @@ class SessionManager:
         if not user_ids:
             self._user_sessions.pop(session.user_id, None)
 
+        task = asyncio.create_task(self._teardown(session), name=f"session-cleanup-{session_id}")
+        self._closing[session_id] = task
+        task.add_done_callback(lambda _: self._closing.pop(session_id, None))
+        return task
+
+    async def _teardown(self, session: Session) -> None:
+        try:
+            async with self._cleanup_limit:
+                try:
+                    await self._close_services(session)
+                except Exception:
+                    logger.exception("Error cleaning up session %s", session.session_id)
+                    return
+            logger.info("Cleaned up session %s", session.session_id)
+        finally:
+            if session.admission is not None:
+                session.admission.release()
+
+    async def _close_services(self, session: Session) -> None:
         if session.voicelive is not None:
             try:
                 await session.voicelive.close()
             except Exception:
-                logger.warning("Error closing VoiceLive for session %s", session_id, exc_info=True)
+                logger.warning("Error closing VoiceLive for session %s", session.session_id, exc_info=True)
         try:
             await session.copilot.stop()
         except Exception:
-            logger.warning("Error stopping Copilot for session %s", session_id, exc_info=True)
+            logger.warning("Error stopping Copilot for session %s", session.session_id, exc_info=True)
         if session.speech_tts is not None:
             try:
                 await session.speech_tts.close()
             except Exception:
-                logger.warning("Error closing SpeechTTS for session %s", session_id, exc_info=True)
+                logger.warning("Error closing SpeechTTS for session %s", session.session_id, exc_info=True)
         if session.avatar_tts is not None:
             try:
                 await session.avatar_tts.close()
             except Exception:
-                logger.warning("Error closing Avatar TTS for session %s", session_id, exc_info=True)
+                logger.warning("Error closing Avatar TTS for session %s", session.session_id, exc_info=True)
+
+    async def hibernate(self, session_id: str) -> None:
+        """Release an idle session's services, keeping its conversation history.
+
+        VoiceLive, Speech and avatar are closed and dropped, and the Copilot
+        client is stopped, so an idle user holds no connections or
+        subprocesses until ``wake`` brings them back.  Their admission units
+        go back to the pool as well; the session keeps its "sessions" slot.
+        A session that became busy since it came due is left running.
+        """
+        session = self._sessions.get(session_id)
+        if session is None:
+            return
+        async with session.lifecycle_lock:
+            if session.hibernating or session_id not in self._sessions:
+                return
+            if session.state != SessionState.IDLE or session.agent_turns:
+                # A turn started after the idle check; look again later.
+                self._schedule_expiry(session)
+                return
+            session.hibernating = True
+            self._hibernating += 1
+            async with self._cleanup_limit:
+                await self._close_services(session)
+            session.voicelive = None
+            session.speech_tts = None
+            session.avatar_tts = None
+            session.avatar_ready_event.clear()
+            if session.admission is not None:
+                session.admission.suspend(HIBERNATION_RELEASED)
+        logger.info("Hibernated idle session %s (%d turns kept)", session_id, session.turn_count)
+        self._schedule_expiry(session)
+
+    async def wake(self, session: Session) -> bool:
+        """Restart a hibernated session's services; True if it was hibernating.
+
+        Uses a pre-warmed Copilot agent when the pool has one.  The caller
+        restores the conversation into the new agent (under its agent lock)
+        with ``CopilotAgent.restore_conversation_context``.  On failure the
+        session stays hibernated and the error propagates; that includes
+        ``AdmissionRejected`` when the node no longer has room for the
+        session's resources.
+        """
+        async with session.lifecycle_lock:
+            if not session.hibernating:
+                return False
+            if session.admission is not None:
+                session.admission.resume()
+            session._build_services(
+                copilot_pool.acquire(session.skill, shared_client=session.lite_mode)
+            )
+            session.startup_timings = {}
+            try:
+                await self._start_services(session)
+            except Exception:
+                # _start_services already closed what it started.
+                session.voicelive = None
+                session.speech_tts = None
+                session.avatar_tts = None
+                if session.admission is not None:
+                    session.admission.suspend(HIBERNATION_RELEASED)
+                raise
+            session.hibernating = False
+            self._hibernating -= 1
+        session.touch()
+        self._schedule_expiry(session)
+        logger.info("Woke session %s: %s", session.session_id, session.startup_timings)
+        return True
+
+    def begin_drain(self) -> None:
+        """Stop accepting sessions and ask every connected client to reconnect elsewhere."""
+        if self._draining:
+            return
+        self._draining = True
+        logger.info("Draining: refusing new sessions, asking %d client(s) to reconnect", len(self._sessions))
+        for session in list(self._sessions.values()):
+            if session.on_drain is None:
+                continue
+            try:
+                session.on_drain()
+            except Exception:
+                logger.warning("Error notifying session %s of drain", session.session_id, exc_info=True)
 
-        logger.info("Cleaned up session %s", session_id)
+    async def cleanup_all(self, timeout: float | None = None) -> list[str]:
+        """Drain, then tear down every session concurrently under one deadline.
 
-    async def cleanup_all(self) -> None:
+        Returns the ids of sessions whose teardown did not finish within
+        *timeout* (``shutdown_timeout_seconds`` by default); those are
+        cancelled.
+        """
+        if timeout is None:
+            timeout = settings.shutdown_timeout_seconds
         if self._cleanup_task and not self._cleanup_task.done():
             self._cleanup_task.cancel()
             try:
@@ -145,29 +447,169 @@ class SessionManager:
             except asyncio.CancelledError:
                 pass
 
-        session_ids = list(self._sessions.keys())
+        self.begin_drain()
+        session_ids = [*self._sessions, *self._closing]
+        start = time.monotonic()
+        timed_out = await self._cleanup_many(session_ids, timeout=timeout)
+        elapsed = time.monotonic() - start
+        if timed_out:
+            logger.error(
+                "Shutdown deadline of %.1fs hit: %d of %d session teardown(s) timed out: %s",
+                timeout, len(timed_out), len(session_ids), timed_out,
+            )
+        else:
+            logger.info("Cleaned up %d session(s) in %.2fs", len(session_ids), elapsed)
+        return timed_out
+
+    async def _cleanup_many(self, session_ids: list[str], timeout: float | None = None) -> list[str]:
+        """Tear sessions down concurrently (at most ``session_cleanup_concurrency``
+        at once); return the ids still running after *timeout*, which are cancelled.
+        """
+        tasks: dict[asyncio.Task[None], str] = {}
         for sid in session_ids:
-            await self.cleanup_session(sid)
+            task = self._closing.get(sid) or self._begin_cleanup(sid)
+            if task is not None:
+                tasks[task] = sid
+        if not tasks:
+            return []
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        if not pending:
+            return []
+        for task in pending:
+            task.cancel()
+        # Let the cancellations unwind, so shutdown doesn't close the loop on them.
+        _, stuck = await asyncio.wait(pending, timeout=_CANCEL_GRACE_SECONDS)
+        if stuck:
+            logger.warning("%d cancelled session teardown(s) still running", len(stuck))
+        return [tasks[task] for task in pending]
+
+    def _schedule_expiry(self, session: Session) -> None:
+        deadline = session.next_deadline
+        scheduled = session.scheduled_deadline
+        if scheduled is not None and scheduled <= deadline:
+            return  # the pending entry re-checks when it comes due
+        session.scheduled_deadline = deadline
+        heapq.heappush(self._expiry_heap, (deadline, session.session_id))
+        self._expiry_wakeup.set()
+
+    def _pop_due(self) -> tuple[list[str], list[str]]:
+        """Pop every due heap entry; return ids to expire and ids to hibernate."""
+        now = time.monotonic()
+        expired: list[str] = []
+        idle: list[str] = []
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            deadline, sid = heapq.heappop(self._expiry_heap)
+            session = self._sessions.get(sid)
+            if session is None or session.scheduled_deadline != deadline:
+                continue  # already cleaned up, or superseded by an earlier entry
+            session.scheduled_deadline = None
+            if session.expires_at <= now:
+                expired.append(sid)
+                continue
+            hibernates_at = session.hibernates_at
+            if hibernates_at is not None and hibernates_at <= now:
+                if session.state == SessionState.IDLE and not session.agent_turns:
+                    idle.append(sid)
+                    continue
+                # Mid-turn or listening: look again an idle period later.
+                # Not a touch, so a client left listening still expires.
+                deadline = min(now + settings.session_hibernate_after_seconds, session.expires_at)
+            else:
+                # Touched since this entry was queued; re-queue at the new deadline.
+                deadline = session.next_deadline
+            session.scheduled_deadline = deadline
+            heapq.heappush(self._expiry_heap, (deadline, sid))
+        return expired, idle
 
     async def _cleanup_loop(self) -> None:
         while True:
             try:
-                await asyncio.sleep(_CLEANUP_INTERVAL_SECONDS)
-                expired = [
-                    sid for sid, session in self._sessions.items()
-                    if session.is_expired()
-                ]
-                for sid in expired:
-                    logger.info("Expiring session %s due to TTL", sid)
-                    await self.cleanup_session(sid)
+                self._expiry_wakeup.clear()
+                if not self._expiry_heap:
+                    await self._expiry_wakeup.wait()
+                    continue
+                delay = self._expiry_heap[0][0] - time.monotonic()
+                if delay > 0:
+                    # Woken early when an earlier deadline is scheduled.
+                    try:
+                        await asyncio.wait_for(self._expiry_wakeup.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                expired, idle = self._pop_due()
+                if idle:
+                    logger.info("Hibernating %d idle session(s)", len(idle))
+                    await asyncio.gather(*(self._hibernate_idle(sid) for sid in idle))
+                if expired:
+                    logger.info("Expiring %d session(s) due to TTL: %s", len(expired), expired)
+                    timed_out = await self._cleanup_many(
+                        expired, timeout=settings.session_expiry_timeout_seconds,
+                    )
+                    if timed_out:
+                        logger.error(
+                            "%d expired session teardown(s) exceeded %.1fs and were cancelled: %s",
+                            len(timed_out), settings.session_expiry_timeout_seconds, timed_out,
+                        )
             except asyncio.CancelledError:
                 break
             except Exception:
                 logger.exception("Error in session cleanup loop")
 
+    async def _hibernate_idle(self, session_id: str) -> None:
+        session = self._sessions.get(session_id)
+        if session is None:
+            return
+        hibernates_at = session.hibernates_at
+        if (
+            hibernates_at is None
+            or hibernates_at > time.monotonic()
+            or session.state != SessionState.IDLE
+        ):
+            # Became active (or already hibernated) since it came due.
+            self._schedule_expiry(session)
+            return
+        try:
+            await self.hibernate(session_id)
+        except Exception:
+            logger.warning("Error hibernating session %s", session_id, exc_info=True)
+            # Still due to expire.
+            self._schedule_expiry(session)
+
     @property
     def active_session_count(self) -> int:
         return len(self._sessions)
 
+    @property
+    def hibernating_session_count(self) -> int:
+        return self._hibernating
+
+    @property
+    def closing_session_count(self) -> int:
+        return len(self._closing)
+
+    def session_counts(self) -> Iterable[tuple[tuple[str, str, str], int]]:
+        """Live sessions grouped by (mode, skill, state); hibernating is a state."""
+        counts = Counter(
+            (
+                "lite" if session.lite_mode else "full",
+                session.skill,
+                "hibernating" if session.hibernating else session.state.value,
+            )
+            for session in self._sessions.values()
+        )
+        return counts.items()
+
 
 session_manager = SessionManager()
+
+Gauge(
+    "sessions",
+    "Live sessions by mode, skill and state.",
+    ("mode", "skill", "state"),
+    collect=session_manager.session_counts,
+)
+Gauge(
+    "sessions_closing",
+    "Sessions whose teardown is still running.",
+    collect=lambda: [((), session_manager.closing_session_count)],
+)
@@ -0,0 +1,241 @@
+import asyncio
+import logging
+import re
+import time
+from collections.abc import AsyncGenerator
+from contextlib import aclosing, asynccontextmanager
+from difflib import SequenceMatcher
+
+from app.backend.config import settings
+from app.backend.services.copilot_agent import AgentTurn, CopilotAgent
+from app.backend.services.metrics import Counter, Histogram
+from app.backend.services.session_manager import Session
+from app.backend.services.turn_trace import TurnTrace
+
+logger = logging.getLogger(__name__)
+
+# Partials shorter than this are too unstable to act on ("so", "um, I").
+_MIN_WORDS = 2
+_WORD_RE = re.compile(r"[\w']+")
+
+_SPECULATIONS = Counter(
+    "speculative_turns_total",
+    "Speculative agent starts by outcome (confirmed, mismatch, superseded, dropped).",
+    ("outcome",),
+)
+_OUTCOMES = {
+    outcome: _SPECULATIONS.labels(outcome)
+    for outcome in ("confirmed", "mismatch", "superseded", "dropped")
+}
+_WASTED = Counter(
+    "speculative_wasted_seconds_total",
+    "Agent time spent on speculative turns that were thrown away.",
+).labels()
+_HEAD_START = Histogram(
+    "speculative_head_start_seconds",
+    "How long before the final transcript a confirmed speculative turn started.",
+).labels()
+
+
+def _words(text: str) -> list[str]:
+    return _WORD_RE.findall(text.lower())
+
+
+def transcripts_match(partial: str, final: str, min_ratio: float) -> bool:
+    """Whether *final* says what *partial* said, ignoring case and punctuation.
+
+    Compared word by word, so "turn it on" vs "turn it off" is a mismatch
+    at the default ratio while a changed comma is not.
+    """
+    partial_words, final_words = _words(partial), _words(final)
+    if partial_words == final_words:
+        return True
+    if not partial_words or not final_words:
+        return False
+    return SequenceMatcher(None, partial_words, final_words, autojunk=False).ratio() >= min_ratio
+
+
+class SpeculativeTurn:
+    """An agent turn started from a partial transcript, with its reply held back.
+
+    The reply is buffered until the turn is confirmed and streamed
+    (``holding_lock`` + ``stream``) or thrown away (``cancel``).  The agent
+    lock is held from start to finish so nothing else talks to the Copilot
+    session meanwhile; ``cancel``, ``holding_lock`` or ``abandon`` releases it.
+    """
+
+    def __init__(
+        self, agent: CopilotAgent, text: str, lock: asyncio.Lock, trace: TurnTrace | None,
+    ) -> None:
+        self.text = text
+        self.started_at = time.monotonic()
+        self._agent = agent
+        self._lock = lock
+        self._trace = trace
+        # The agent call marks its own trace; a confirmed turn absorbs it.
+        self._agent_trace: TurnTrace | None = None
+        if trace is not None:
+            trace.mark("speculation_start")
+            self._agent_trace = TurnTrace(trace.session_id, trace.source)
+        self._agent_turn = AgentTurn()
+        self._adopted = False
+        self._abandoning: asyncio.Task[None] | None = None
+        self._done = False
+        self._chunks: asyncio.Queue[str | Exception | None] = asyncio.Queue()
+        self._task = asyncio.create_task(self._pump(), name="agent-speculative")
+
+    async def _pump(self) -> None:
+        try:
+            async with aclosing(
+                self._agent.send_message(self.text, self._agent_trace, self._agent_turn)
+            ) as stream:
+                async for chunk in stream:
+                    self._chunks.put_nowait(chunk)
+        except Exception as exc:
+            self._chunks.put_nowait(exc)
+        finally:
+            self._chunks.put_nowait(None)
+
+    def confirm(self) -> None:
+        _OUTCOMES["confirmed"].inc()
+        _HEAD_START.observe(time.monotonic() - self.started_at)
+
+    @asynccontextmanager
+    async def holding_lock(self) -> AsyncGenerator[None, None]:
+        """Take over the agent lock this turn holds; released on exit."""
+        self._adopted = True
+        try:
+            yield
+        finally:
+            self._finish()
+
+    async def stream(self) -> AsyncGenerator[str, None]:
+        """Replay the buffered reply, then keep streaming it live."""
+        trace = self._trace
+        try:
+            while True:
+                item = await self._chunks.get()
+                if item is None:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                if trace is not None:
+                    # When the user can first see it, not when it was buffered.
+                    trace.mark("first_token")
+                yield item
+        finally:
+            if not self._task.done():
+                self._task.cancel()
+            if trace is not None and self._agent_trace is not None:
+                trace.absorb(self._agent_trace, exclude=("first_token",))
+
+    def abandon(self) -> None:
+        """Drop a confirmed turn whose consumer never started (its task was cancelled)."""
+        if self._adopted or self._done or self._abandoning is not None:
+            return
+        self._abandoning = asyncio.create_task(self.cancel("dropped"), name="speculation-cancel")
+
+    async def cancel(self, outcome: str) -> None:
+        """Throw the turn away: stop it, abort it on the agent, release the lock."""
+        try:
+            if not self._task.done():
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+            await self._agent.abort_turn(self._agent_turn)
+        finally:
+            _OUTCOMES[outcome].inc()
+            _WASTED.inc(time.monotonic() - self.started_at)
+            self._finish()
+        logger.info("Speculative turn discarded (%s) after %.2fs", outcome, time.monotonic() - self.started_at)
+
+    def _finish(self) -> None:
+        if not self._done:
+            self._done = True
+            self._lock.release()
+
+
+class TurnSpeculator:
+    """Starts the agent on a stable partial transcript, ahead of the final one.
+
+    Fed by the VoiceLive listener.  Partial transcripts accumulate per
+    utterance; once the text has not changed for ``speculative_stable_ms``
+    and no other turn holds the agent lock, a ``SpeculativeTurn`` starts.
+    More speech or different partial text throws it away, and the final
+    transcript either confirms it (``take``) or throws it away too, so the
+    end-of-speech silence window overlaps with the agent's work.
+    """
+
+    def __init__(self, session: Session, lock: asyncio.Lock) -> None:
+        self._session = session
+        self._lock = lock
+        self._partial = ""
+        self._timer: asyncio.Task[None] | None = None
+        self._turn: SpeculativeTurn | None = None
+        self._discarding: set[asyncio.Task[None]] = set()
+
+    def on_speech_started(self) -> None:
+        self._partial = ""
+        self._cancel_timer()
+        self._discard("superseded")
+
+    def on_partial(self, text: str, *, replace: bool = False) -> None:
+        """Add a transcription delta (or, with *replace*, a full hypothesis)."""
+        self._partial = text if replace else self._partial + text
+        if self._turn is not None:
+            if _words(self._turn.text) == _words(self._partial):
+                return
+            self._discard("superseded")
+        self._cancel_timer()
+        self._timer = asyncio.create_task(self._start_when_stable(), name="speculation-timer")
+
+    def take(self, final_text: str) -> SpeculativeTurn | None:
+        """The running speculation if *final_text* confirms it; the caller streams it."""
+        self._partial = ""
+        self._cancel_timer()
+        turn, self._turn = self._turn, None
+        if turn is None:
+            return None
+        if final_text and transcripts_match(turn.text, final_text, settings.speculative_match_ratio):
+            turn.confirm()
+            return turn
+        self._spawn_cancel(turn, "mismatch")
+        return None
+
+    async def _start_when_stable(self) -> None:
+        await asyncio.sleep(settings.speculative_stable_ms / 1000)
+        text = self._partial.strip()
+        if self._turn is not None or self._lock.locked() or len(_words(text)) < _MIN_WORDS:
+            self._timer = None
+            return
+        await self._lock.acquire()
+        self._timer = None
+        # Only suspends if a waiter was handed the lock first; then it's stale.
+        if self._turn is not None or self._partial.strip() != text:
+            self._lock.release()
+            return
+        self._turn = SpeculativeTurn(self._session.copilot, text, self._lock, self._session.voice_trace)
+        logger.info("Speculative turn started on a %d-char partial transcript", len(text))
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _discard(self, outcome: str) -> None:
+        turn, self._turn = self._turn, None
+        if turn is not None:
+            self._spawn_cancel(turn, outcome)
+
+    def _spawn_cancel(self, turn: SpeculativeTurn, outcome: str) -> None:
+        task = asyncio.create_task(turn.cancel(outcome), name="speculation-cancel")
+        self._discarding.add(task)
+        task.add_done_callback(self._discarding.discard)
+
+    async def close(self) -> None:
+        self._cancel_timer()
+        self._discard("dropped")
+        if self._discarding:
+            await asyncio.gather(*self._discarding, return_exceptions=True)
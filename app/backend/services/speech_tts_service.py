@@ -1,137 +1,349 @@
 import asyncio
-import base64
 import logging
-import re
+from collections import deque
 from collections.abc import AsyncGenerator
-
-from azure.identity.aio import DefaultAzureCredential
+from typing import Any
 
 from app.backend.config import settings
+from app.backend.models.ws_messages import DEFAULT_TTS_CODEC, TtsCodec
+from app.backend.services.azure_credentials import (
+    COGNITIVE_SERVICES_SCOPE,
+    SharedAzureCredential,
+    shared_credential,
+)
+from app.backend.services.metrics import Counter
+from app.backend.services.sdk_executors import stop_executor, synthesis_executor
+from app.backend.services.tts_cache import TtsAudioCache, tts_cache
+from app.backend.services.turn_trace import TurnTrace
 
 logger = logging.getLogger(__name__)
 
+_VOICE_NAME = "en-US-AvaMultilingualNeural"
+# SpeechSynthesisOutputFormat member per negotiated TTS codec
+_OUTPUT_FORMATS: dict[str, str] = {
+    "pcm": "Raw24Khz16BitMonoPcm",
+    "opus": "Webm24Khz16Bit24KbpsMonoOpus",
+    "mp3": "Audio24Khz48KBitRateMonoMp3",
+}
+# 100 ms of PCM16 24 kHz mono audio
+_CHUNK_BYTES = 4800
+# How long a stopped utterance's final event may take before the next starts.
+_STOP_GRACE_SECONDS = 1.0
+_FINISHED_IDS_KEPT = 8
+
+_TTS_CHUNKS = Counter("tts_audio_chunks_total", "TTS audio chunks produced, by source.", ("source",))
+_TTS_BYTES = Counter("tts_audio_bytes_total", "TTS audio bytes produced, by source.", ("source",))
+_SYNTH_CHUNKS = _TTS_CHUNKS.labels("synthesis")
+_SYNTH_BYTES = _TTS_BYTES.labels("synthesis")
+_CACHE_CHUNKS = _TTS_CHUNKS.labels("cache")
+_CACHE_BYTES = _TTS_BYTES.labels("cache")
 
-# Regex to match most emoji/symbol Unicode blocks
-_EMOJI_RE = re.compile(
-    "["
-    "\U0001F600-\U0001F64F"  # emoticons
-    "\U0001F300-\U0001F5FF"  # misc symbols & pictographs
-    "\U0001F680-\U0001F6FF"  # transport & map symbols
-    "\U0001F1E0-\U0001F1FF"  # flags
-    "\U0001F900-\U0001F9FF"  # supplemental symbols
-    "\U0001FA00-\U0001FA6F"  # chess symbols
-    "\U0001FA70-\U0001FAFF"  # symbols extended-A
-    "\U00002702-\U000027B0"  # dingbats
-    "\U0000FE00-\U0000FE0F"  # variation selectors
-    "\U0000200D"              # zero-width joiner
-    "\U000025A0-\U000025FF"  # geometric shapes
-    "\U00002600-\U000026FF"  # misc symbols
-    "\U00002300-\U000023FF"  # misc technical
-    "]+",
-    flags=re.UNICODE,
-)
 
+class _Utterance:
+    """One ``speak_text_async`` request and the queue its events go to."""
+
+    __slots__ = ("events", "result_id", "stopping")
+
+    def __init__(self) -> None:
+        # Audio bytes, then None (done) or an exception (synthesis failed).
+        self.events: asyncio.Queue[bytes | Exception | None] = asyncio.Queue()
+        # SDK result id, learned from the utterance's first event.
+        self.result_id: str | None = None
+        self.stopping = False
 
-def _sanitize_for_tts(text: str) -> str:
-    """Strip markdown formatting and emoji so TTS reads natural prose."""
-    # Remove emoji
-    text = _EMOJI_RE.sub("", text)
-    # Remove fenced code blocks entirely (e.g. ```mermaid...```)
-    # Must come before inline backtick removal
-    text = re.sub(r"```[\s\S]*?```", "", text)
-    # Remove markdown bold/italic: **text**, __text__, *text*, _text_
-    text = re.sub(r"\*{1,3}(.+?)\*{1,3}", r"\1", text)
-    text = re.sub(r"_{1,3}(.+?)_{1,3}", r"\1", text)
-    # Remove markdown strikethrough: ~~text~~
-    text = re.sub(r"~~(.+?)~~", r"\1", text)
-    # Remove markdown headings: ## Heading
-    text = re.sub(r"^#{1,6}\s+", "", text, flags=re.MULTILINE)
-    # Remove markdown links: [text](url) → text
-    text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
-    # Remove inline code backticks: `code` → code
-    text = re.sub(r"`{1,3}([^`]*)`{1,3}", r"\1", text)
-    # Remove markdown bullet markers: - item, * item
-    text = re.sub(r"^\s*[-*+]\s+", "", text, flags=re.MULTILINE)
-    # Remove numbered list markers: 1. item
-    text = re.sub(r"^\s*\d+\.\s+", "", text, flags=re.MULTILINE)
-    # Remove markdown horizontal rules: --- or ***
-    text = re.sub(r"^[-*_]{3,}\s*$", "", text, flags=re.MULTILINE)
-    # Remove markdown blockquote markers: > text
-    text = re.sub(r"^>\s?", "", text, flags=re.MULTILINE)
-    # Collapse multiple spaces (e.g. after emoji removal) and blank lines
-    text = re.sub(r" {2,}", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    return text.strip()
 
 class SpeechTtsService:
     """Azure Speech SDK text-to-speech service.
 
-    The Speech SDK is synchronous, so synthesis runs in a thread-pool
-    executor to avoid blocking the async event loop.
+    Each session keeps one long-lived ``SpeechSynthesizer`` whose service
+    connection is pre-opened on ``start``, so turns don't pay the WebSocket
+    handshake.  The AAD token is refreshed in place and the synthesizer is
+    rebuilt transparently after a failure.  Sentences found in the shared
+    ``TtsAudioCache`` are served without a Speech service round trip.
+
+    Blocking SDK calls run on the dedicated SDK executors; audio produced on SDK
+    callback threads is handed to the event loop as it is synthesized.
     """
 
-    def __init__(self) -> None:
-        self._credential: DefaultAzureCredential | None = None
+    def __init__(
+        self,
+        credential: SharedAzureCredential = shared_credential,
+        cache: TtsAudioCache = tts_cache,
+        codec: TtsCodec = DEFAULT_TTS_CODEC,
+    ) -> None:
+        self._shared_credential = credential
+        self._cache = cache
+        self.codec = codec
+        self._output_format = _OUTPUT_FORMATS[codec]
+        self._credential: SharedAzureCredential | None = None
+        self._synthesizer: Any | None = None  # speechsdk.SpeechSynthesizer
+        self._connection: Any | None = None  # speechsdk.Connection
+        self._auth_token = ""
+        # One utterance at a time per synthesizer.
+        self._lock = asyncio.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Requests the SDK has not finished yet, oldest first.  The SDK runs
+        # them in order, so events belong to the head; a stopped utterance
+        # stays queued until its own final event, which can arrive late.
+        self._utterances: deque[_Utterance] = deque()
+        # Result ids of recently finished requests, whose stragglers are dropped.
+        self._finished_ids: deque[str] = deque(maxlen=_FINISHED_IDS_KEPT)
 
     async def start(self) -> None:
-        self._credential = DefaultAzureCredential()
+        self._credential = self._shared_credential
+        # Prime the shared token cache so the first synthesis doesn't wait.
+        await self._credential.get_token(COGNITIVE_SERVICES_SCOPE)
+        try:
+            await self._ensure_synthesizer()
+        except Exception:
+            logger.warning("TTS: failed to pre-connect synthesizer; retrying on first use", exc_info=True)
 
-    async def synthesize(self, text: str) -> AsyncGenerator[str, None]:
-        """Synthesize *text* to PCM16 24 kHz audio, yielding base64 chunks."""
-        import azure.cognitiveservices.speech as speechsdk
+    async def synthesize_audio(
+        self,
+        text: str,
+        cancel_event: asyncio.Event | None = None,
+        trace: TurnTrace | None = None,
+    ) -> AsyncGenerator[bytes, None]:
+        """Stream *text* as audio in the session codec while it is being synthesized.
+
+        Audio is forwarded from the SDK's ``synthesizing`` events as soon as
+        it is rendered, so the first chunk doesn't wait for the whole
+        utterance.  Setting *cancel_event* (barge-in), or closing the
+        generator early, stops the synthesizer mid-utterance.
+
+        PCM is re-framed into 100 ms chunks; compressed codecs are forwarded
+        as the SDK delivers them so small frames aren't held back.
 
+        *text* is expected to be speakable already (see ``tts_sanitizer``).
+        *trace*, if given, gets a ``tts_first_chunk`` mark when the first
+        audio is ready.
+        """
         if not self._credential:
             raise RuntimeError("SpeechTtsService not started")
 
+        cache_key: str | None = None
+        if self._cache.enabled:
+            cache_key = self._cache.key(text, _VOICE_NAME, self._output_format)
+            cached = await self._cache.get(cache_key)
+            if cached is not None:
+                if trace is not None:
+                    trace.mark("tts_first_chunk")
+                for offset in range(0, len(cached), _CHUNK_BYTES):
+                    if cancel_event is not None and cancel_event.is_set():
+                        return
+                    chunk = cached[offset:offset + _CHUNK_BYTES]
+                    _CACHE_CHUNKS.inc()
+                    _CACHE_BYTES.inc(len(chunk))
+                    yield chunk
+                return
 
-        # Strip emoji and markdown so TTS reads natural prose
-        text = _sanitize_for_tts(text)
+        async with self._lock:
+            synthesizer = await self._ensure_synthesizer()
+            utterance = _Utterance()
+            events = utterance.events
+            self._utterances.append(utterance)
+            try:
+                await synthesis_executor.run(synthesizer.speak_text_async, text)
+            except BaseException:
+                self._forget(utterance)
+                raise
 
-        # Obtain an AAD token for the Cognitive Services resource
-        token_response = await self._credential.get_token(
-            "https://cognitiveservices.azure.com/.default"
-        )
+            async def _watch_cancel(event: asyncio.Event) -> None:
+                await event.wait()
+                events.put_nowait(None)
 
-        resource_id = settings.azure_speech_service_id
-        region = settings.azure_speech_region
-        aad_token = token_response.token
-        loop = asyncio.get_event_loop()
-        def _do_synthesis() -> bytes:
-            speech_config = speechsdk.SpeechConfig(
-                auth_token=f"aad#{resource_id}#{aad_token}",
-                region=region,
-            )
-            speech_config.set_speech_synthesis_output_format(
-                speechsdk.SpeechSynthesisOutputFormat.Raw24Khz16BitMonoPcm
+            watcher = (
+                asyncio.create_task(_watch_cancel(cancel_event), name="tts-cancel-watch")
+                if cancel_event is not None else None
             )
-            speech_config.speech_synthesis_voice_name = "en-US-AvaMultilingualNeural"
+            finished = False
+            pending = bytearray()
+            rendered: list[bytes] = []
+            try:
+                while True:
+                    item = await events.get()
+                    if item is None:
+                        finished = not (cancel_event is not None and cancel_event.is_set())
+                        break
+                    if isinstance(item, Exception):
+                        finished = True
+                        await self._discard_synthesizer()
+                        raise item
+                    if trace is not None:
+                        trace.mark("tts_first_chunk")
+                    pending += item
+                    if cache_key is not None:
+                        rendered.append(item)
+                    if self.codec != "pcm":
+                        _SYNTH_CHUNKS.inc()
+                        _SYNTH_BYTES.inc(len(pending))
+                        yield bytes(pending)
+                        pending.clear()
+                        continue
+                    # Re-frame into steady 100 ms chunks regardless of how
+                    # the SDK sizes its synthesizing events.
+                    while len(pending) >= _CHUNK_BYTES:
+                        _SYNTH_CHUNKS.inc()
+                        _SYNTH_BYTES.inc(_CHUNK_BYTES)
+                        yield bytes(pending[:_CHUNK_BYTES])
+                        del pending[:_CHUNK_BYTES]
+                if finished and cache_key is not None:
+                    # Only complete utterances are cached, never barge-in cut-offs.
+                    await self._cache.put(cache_key, b"".join(rendered))
+                if finished and pending:
+                    _SYNTH_CHUNKS.inc()
+                    _SYNTH_BYTES.inc(len(pending))
+                    yield bytes(pending)
+            finally:
+                if watcher is not None:
+                    watcher.cancel()
+                if not finished:
+                    utterance.stopping = True
+                    await self._stop_speaking(synthesizer)
+                    await self._await_final(utterance)
 
-            # Synthesize into memory (no file / speaker output)
-            synthesizer = speechsdk.SpeechSynthesizer(
-                speech_config=speech_config,
-                audio_config=None,
+    async def _ensure_synthesizer(self) -> Any:
+        """Return the session synthesizer, building it or refreshing its token."""
+        if not self._credential:
+            raise RuntimeError("SpeechTtsService not started")
+        token_response = await self._credential.get_token(COGNITIVE_SERVICES_SCOPE)
+        auth_token = f"aad#{settings.azure_speech_service_id}#{token_response.token}"
+        self._loop = asyncio.get_running_loop()
+        if self._synthesizer is None:
+            self._synthesizer, self._connection = await synthesis_executor.run(
+                self._build_synthesizer, auth_token,
             )
+            logger.info("TTS: synthesizer connected")
+        elif auth_token != self._auth_token:
+            self._synthesizer.authorization_token = auth_token
+        self._auth_token = auth_token
+        return self._synthesizer
+
+    def _build_synthesizer(self, auth_token: str) -> tuple[Any, Any]:
+        """Create a synthesizer and pre-open its service connection (blocking)."""
+        import azure.cognitiveservices.speech as speechsdk
+
+        speech_config = speechsdk.SpeechConfig(
+            auth_token=auth_token,
+            region=settings.azure_speech_region,
+        )
+        speech_config.set_speech_synthesis_output_format(
+            getattr(speechsdk.SpeechSynthesisOutputFormat, self._output_format)
+        )
+        speech_config.speech_synthesis_voice_name = _VOICE_NAME
 
-            result = synthesizer.speak_text_async(text).get()
+        # Synthesize into memory (no file / speaker output)
+        synthesizer = speechsdk.SpeechSynthesizer(
+            speech_config=speech_config,
+            audio_config=None,
+        )
+        synthesizer.synthesizing.connect(self._on_synthesizing)
+        synthesizer.synthesis_completed.connect(self._on_completed)
+        synthesizer.synthesis_canceled.connect(self._on_canceled)
 
-            if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
-                return result.audio_data  # raw PCM bytes
+        connection = speechsdk.Connection.from_speech_synthesizer(synthesizer)
+        connection.open(True)
+        return synthesizer, connection
 
-            cancellation = result.cancellation_details
-            raise RuntimeError(
-                f"Speech synthesis failed: {result.reason} — "
-                f"{cancellation.reason}: {cancellation.error_details}"
-            )
+    def _post(self, result_id: str, item: bytes | Exception | None) -> None:
+        """Hand an SDK event to the loop (SDK callback thread)."""
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._route, result_id, item)
+        except RuntimeError:
+            pass  # event loop already closed
+
+    def _route(self, result_id: str, item: bytes | Exception | None) -> None:
+        """Deliver an SDK event to the utterance it belongs to (event loop)."""
+        if result_id in self._finished_ids:
+            logger.debug("TTS: dropping event for finished synthesis %s", result_id)
+            return
+        while self._utterances:
+            head = self._utterances[0]
+            if head.result_id is None:
+                head.result_id = result_id
+            if head.result_id == result_id:
+                break
+            # A later request is running, so the head's final event is late or lost.
+            self._finish_head()
+            head.events.put_nowait(None)
+        else:
+            logger.debug("TTS: dropping event for unknown synthesis %s", result_id)
+            return
+        if item is None or isinstance(item, Exception):
+            self._finish_head()
+            if head.stopping:
+                # The cancellation stop_speaking asked for, not a failure.
+                item = None
+        head.events.put_nowait(item)
+
+    async def _await_final(self, utterance: _Utterance) -> None:
+        """Let a stopped utterance's final event arrive before the next starts."""
+        deadline = asyncio.get_running_loop().time() + _STOP_GRACE_SECONDS
+        while utterance in self._utterances:
+            remaining = deadline - asyncio.get_running_loop().time()
+            try:
+                await asyncio.wait_for(utterance.events.get(), timeout=max(0.0, remaining))
+            except asyncio.TimeoutError:
+                if utterance.result_id is None:
+                    # Never heard from; its events could not be told apart anyway.
+                    self._forget(utterance)
+                return
+
+    def _finish_head(self) -> None:
+        head = self._utterances.popleft()
+        if head.result_id is not None:
+            self._finished_ids.append(head.result_id)
+
+    def _forget(self, utterance: _Utterance) -> None:
+        try:
+            self._utterances.remove(utterance)
+        except ValueError:
+            pass
+
+    def _on_synthesizing(self, evt: Any) -> None:
+        if evt.result.audio_data:
+            self._post(evt.result.result_id, evt.result.audio_data)
+
+    def _on_completed(self, evt: Any) -> None:
+        self._post(evt.result.result_id, None)
+
+    def _on_canceled(self, evt: Any) -> None:
+        cancellation = evt.result.cancellation_details
+        self._post(evt.result.result_id, RuntimeError(
+            f"Speech synthesis failed: {evt.result.reason} — "
+            f"{cancellation.reason}: {cancellation.error_details}"
+        ))
 
-        audio_bytes = await loop.run_in_executor(None, _do_synthesis)
+    async def _stop_speaking(self, synthesizer: Any) -> None:
+        logger.info("TTS: stopping synthesis mid-utterance")
+        try:
+            await stop_executor.run(lambda: synthesizer.stop_speaking_async().get())
+        except Exception:
+            logger.warning("TTS: failed to stop synthesizer, rebuilding", exc_info=True)
+            await self._discard_synthesizer()
 
-        # Chunk into ~4800-byte pieces (100 ms at 24 kHz / 16-bit mono = 4800 bytes)
-        chunk_size = 4800
-        for i in range(0, len(audio_bytes), chunk_size):
-            chunk = audio_bytes[i : i + chunk_size]
-            yield base64.b64encode(chunk).decode("ascii")
+    async def _discard_synthesizer(self) -> None:
+        synthesizer, connection = self._synthesizer, self._connection
+        self._synthesizer = None
+        self._connection = None
+        self._auth_token = ""
+        # Its callbacks go away with it; nothing will finish these.
+        self._utterances.clear()
+        if synthesizer is None:
+            return
+        synthesizer.synthesizing.disconnect_all()
+        synthesizer.synthesis_completed.disconnect_all()
+        synthesizer.synthesis_canceled.disconnect_all()
+        if connection is not None:
+            try:
+                await stop_executor.run(connection.close)
+            except Exception:
+                logger.debug("TTS: error closing synthesizer connection", exc_info=True)
 
     async def close(self) -> None:
-        if self._credential:
-            await self._credential.close()
-            self._credential = None
\ No newline at end of file
+        await self._discard_synthesizer()
+        # The credential is shared process-wide; just drop the reference.
+        self._credential = None
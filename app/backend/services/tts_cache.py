@@ -0,0 +1,223 @@
+import asyncio
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from app.backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+_DISK_SUFFIX = ".pcm"
+# Entries above 1/16 of the cache budget are not cached, so one long
+# whole-reply utterance can't flush every sentence out of the LRU.
+_MAX_ENTRY_SHARE = 16
+
+
+def normalize_tts_text(text: str) -> str:
+    """Collapse whitespace so trivially different renderings share an entry."""
+    return " ".join(text.split())
+
+
+class TtsAudioCache:
+    """Content-addressed cache of synthesized audio, shared by all sessions.
+
+    Entries hold audio in the output format they were synthesized in (PCM,
+    Opus or MP3); keys are ``sha256(voice, output format, normalized text)``,
+    so any sentence the agent repeats (acknowledgements, phase transitions,
+    recurring explanations) is synthesized once per process and codec.
+
+    - Memory tier: LRU bounded by ``tts_cache_memory_mb``.
+    - Disk tier (optional, ``tts_cache_dir``): one file per entry, read back
+      and promoted into memory on a hit; bounded by ``tts_cache_disk_mb``
+      with LRU eviction.  Hits touch the file's mtime, so the entries and
+      their recency survive restarts.
+
+    Disk I/O runs in the default executor.
+    """
+
+    def __init__(self) -> None:
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: OrderedDict[str, int] = OrderedDict()
+        self._disk_bytes = 0
+        self._disk_dir: Path | None = None
+        # Disk entries reserved but not written yet; lookups treat them as misses.
+        self._writing: set[str] = set()
+        # Metrics
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._memory_budget > 0 or self._disk_dir is not None
+
+    @property
+    def _memory_budget(self) -> int:
+        return settings.tts_cache_memory_mb * 1024 * 1024
+
+    @property
+    def _disk_budget(self) -> int:
+        return settings.tts_cache_disk_mb * 1024 * 1024
+
+    @property
+    def _max_entry_bytes(self) -> int:
+        budget = self._memory_budget
+        if self._disk_dir is not None:
+            budget = max(budget, self._disk_budget)
+        return budget // _MAX_ENTRY_SHARE
+
+    @staticmethod
+    def key(text: str, voice: str, output_format: str) -> str:
+        material = "\0".join((voice, output_format, normalize_tts_text(text)))
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    async def start(self) -> None:
+        if not settings.tts_cache_dir:
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, self._load_disk_index, Path(settings.tts_cache_dir))
+        except OSError:
+            logger.warning("TTS cache: disk tier disabled", exc_info=True)
+            return
+        logger.info(
+            "TTS cache: disk tier at %s (%d entries, %.1f MB)",
+            self._disk_dir, len(self._disk), self._disk_bytes / 1e6,
+        )
+
+    async def get(self, key: str) -> bytes | None:
+        audio = self._memory.get(key)
+        if audio is not None:
+            self._memory.move_to_end(key)
+            self.memory_hits += 1
+            return audio
+        if key in self._disk and key not in self._writing:
+            loop = asyncio.get_running_loop()
+            try:
+                audio = await loop.run_in_executor(None, self._read_disk, key)
+            except (OSError, ValueError):
+                logger.debug("TTS cache: dropping unreadable entry %s", key, exc_info=True)
+                self._forget_disk(key)
+                audio = None
+            if audio is not None:
+                self._disk.move_to_end(key)
+                self.disk_hits += 1
+                self._store_memory(key, audio)
+                return audio
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, audio: bytes) -> None:
+        if not audio or len(audio) > self._max_entry_bytes:
+            return
+        self.stores += 1
+        self._store_memory(key, audio)
+        if self._disk_dir is not None and key not in self._disk:
+            evicted = self._reserve_disk(key, len(audio))
+            self._writing.add(key)
+            loop = asyncio.get_running_loop()
+            try:
+                await loop.run_in_executor(None, self._write_disk, key, audio, evicted)
+            except OSError:
+                logger.warning("TTS cache: failed to write entry to disk", exc_info=True)
+                self._forget_disk(key)
+                return
+            finally:
+                self._writing.discard(key)
+            if key not in self._disk:
+                # Evicted by another put while it was being written.
+                await loop.run_in_executor(None, self._remove_disk, [key])
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "disk_entries": len(self._disk),
+            "disk_bytes": self._disk_bytes,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "hit_ratio": round((lookups - self.misses) / lookups, 3) if lookups else 0.0,
+        }
+
+    def _store_memory(self, key: str, audio: bytes) -> None:
+        if len(audio) > self._memory_budget:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = audio
+        self._memory_bytes += len(audio)
+        while self._memory_bytes > self._memory_budget:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self.evictions += 1
+
+    def _reserve_disk(self, key: str, size: int) -> list[str]:
+        """Account for a new disk entry; return the keys evicted to fit it."""
+        self._disk[key] = size
+        self._disk_bytes += size
+        evicted: list[str] = []
+        while self._disk_bytes > self._disk_budget and len(self._disk) > 1:
+            old_key, old_size = self._disk.popitem(last=False)
+            self._disk_bytes -= old_size
+            self.evictions += 1
+            evicted.append(old_key)
+        return evicted
+
+    def _forget_disk(self, key: str) -> None:
+        size = self._disk.pop(key, None)
+        if size is not None:
+            self._disk_bytes -= size
+
+    # -- blocking disk helpers (run in the executor) --
+
+    def _path(self, key: str) -> Path:
+        return Path(settings.tts_cache_dir) / f"{key}{_DISK_SUFFIX}"
+
+    def _load_disk_index(self, directory: Path) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        entries = []
+        for path in directory.glob(f"*{_DISK_SUFFIX}"):
+            stat = path.stat()
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+        # Oldest first, so eviction order survives a restart.
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_bytes += size
+        self._disk_dir = directory
+
+    def _read_disk(self, key: str) -> bytes:
+        path = self._path(key)
+        audio = path.read_bytes()
+        if not audio:
+            raise ValueError(f"empty TTS cache entry {key}")
+        # Recency for the next start's index, which orders by mtime.
+        os.utime(path)
+        return audio
+
+    def _write_disk(self, key: str, audio: bytes, evicted: list[str]) -> None:
+        path = self._path(key)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(audio)
+        os.replace(tmp, path)
+        self._remove_disk(evicted)
+
+    def _remove_disk(self, keys: list[str]) -> None:
+        for key in keys:
+            try:
+                self._path(key).unlink()
+            except FileNotFoundError:
+                pass
+
+
+tts_cache = TtsAudioCache()
@@ -0,0 +1,174 @@
+import re
+
+from app.backend.services.audio_utils import SentenceStream
+
+# Single source of truth for turning agent Markdown into speakable text.
+# Used by both the audio (Speech SDK) and avatar paths, either on a whole
+# reply (sanitize_for_tts) or incrementally while it streams (TtsSanitizer).
+# Pass order matters: citations and links are removed before emphasis, and
+# emphasis before inline code and line-level markers.
+
+# Fenced code blocks (```...```): Mermaid diagrams, JSON snippets and other
+# code that the chat UI renders visually.
+_CODE_BLOCK_RE = re.compile(r"```[\s\S]*?```")
+# Parenthetical source citations: "(Source: [label](url))" or "(Source: url)"
+_SOURCE_CITATION_RE = re.compile(
+    r"\(Source:\s*"           # literal "(Source:"
+    r"(?:\[[^\]]*\]\([^)]*\)"  # markdown link [label](url)
+    r"|[^)]+)"                # or bare text/url
+    r"\)",                    # closing paren
+    re.IGNORECASE,
+)
+# Standalone "Sources:" lines (e.g. "Sources: Link1 . Link2")
+# These appear at the end of MCP-grounded responses as a references block.
+_SOURCES_LINE_RE = re.compile(r"^Sources?:\s*.*$", re.IGNORECASE | re.MULTILINE)
+# Markdown links: [label](url) -> keep label only
+_MD_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+# Bare URLs: remove the entire sentence/clause containing a bare URL.
+# This avoids orphaned filler like "See also: for more details." after the
+# URL is stripped.  The URL part uses (?:[^\s.]|\.[^\s])+ so that a period
+# is consumed only when followed by a non-space char (e.g. delta.io) — a
+# sentence-ending period ('. ') is NOT swallowed.
+_BARE_URL_SENTENCE_RE = re.compile(r"[^\n.]*https?://(?:[^\s.]|\.[^\s])+[^\n.]*\.?")
+# Markdown emphasis: **bold**, *italic*, __bold__, _italic_, ~~strike~~
+_MD_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_MD_ITALIC_RE = re.compile(r"\*(.+?)\*")
+_MD_BOLD2_RE = re.compile(r"__(.+?)__")
+_MD_ITALIC2_RE = re.compile(r"_(.+?)_")
+_MD_STARS_RE = re.compile(r"\*{1,3}(.+?)\*{1,3}")
+_MD_UNDERSCORES_RE = re.compile(r"_{1,3}(.+?)_{1,3}")
+_MD_STRIKE_RE = re.compile(r"~~(.+?)~~")
+# Line-level Markdown: headings, bullets, numbered lists, rules, quotes
+_HEADING_RE = re.compile(r"^#{1,6}\s+", re.MULTILINE)
+_INLINE_CODE_RE = re.compile(r"`{1,3}([^`]*)`{1,3}")
+_BULLET_RE = re.compile(r"^\s*[-*+]\s+", re.MULTILINE)
+_NUMBERED_RE = re.compile(r"^\s*\d+\.\s+", re.MULTILINE)
+_HR_RE = re.compile(r"^[-*_]{3,}\s*$", re.MULTILINE)
+_BLOCKQUOTE_RE = re.compile(r"^>\s?", re.MULTILINE)
+# Whitespace left behind by removals
+_NEWLINES_RE = re.compile(r"\n{3,}")
+_SPACES_RE = re.compile(r"  +")
+# Most emoji/symbol Unicode blocks
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # misc symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map symbols
+    "\U0001F1E0-\U0001F1FF"  # flags
+    "\U0001F900-\U0001F9FF"  # supplemental symbols
+    "\U0001FA00-\U0001FA6F"  # chess symbols
+    "\U0001FA70-\U0001FAFF"  # symbols extended-A
+    "\U00002702-\U000027B0"  # dingbats
+    "\U0000FE00-\U0000FE0F"  # variation selectors
+    "\U0000200D"              # zero-width joiner
+    "\U000025A0-\U000025FF"  # geometric shapes
+    "\U00002600-\U000026FF"  # misc symbols
+    "\U00002300-\U000023FF"  # misc technical
+    "]+",
+    flags=re.UNICODE,
+)
+
+# Prepended to fragments that start mid-line so line-anchored (^) patterns
+# don't treat the fragment start as a line start.
+_MID_LINE = "\x00"
+
+_SOURCE_OPEN_RE = re.compile(r"\(Source:", re.IGNORECASE)
+_SOURCES_LINE_START_RE = re.compile(r"Sources?:", re.IGNORECASE)
+# A line holding only a list/heading/quote marker, e.g. "2. " cut off by the
+# sentence splitter before the item text arrives.
+_BARE_MARKER_LINE_RE = re.compile(r"\s*(?:\d+\.|[-*+>]|#{1,6})\s*")
+
+
+def sanitize_for_tts(text: str, *, at_line_start: bool = True) -> str:
+    """Remove code, citations, URLs, Markdown and emoji so TTS reads natural prose."""
+    if not at_line_start:
+        text = _MID_LINE + text
+    text = _CODE_BLOCK_RE.sub("", text)
+    text = _SOURCE_CITATION_RE.sub("", text)
+    text = _SOURCES_LINE_RE.sub("", text)
+    text = _MD_LINK_RE.sub(r"\1", text)
+    text = _BARE_URL_SENTENCE_RE.sub("", text)
+    text = _MD_BOLD_RE.sub(r"\1", text)
+    text = _MD_BOLD2_RE.sub(r"\1", text)
+    text = _MD_ITALIC_RE.sub(r"\1", text)
+    text = _MD_ITALIC2_RE.sub(r"\1", text)
+    text = _NEWLINES_RE.sub("\n\n", text)
+    text = _SPACES_RE.sub(" ", text).strip()
+    text = _EMOJI_RE.sub("", text)
+    text = _MD_STARS_RE.sub(r"\1", text)
+    text = _MD_UNDERSCORES_RE.sub(r"\1", text)
+    text = _MD_STRIKE_RE.sub(r"\1", text)
+    text = _HEADING_RE.sub("", text)
+    text = _MD_LINK_RE.sub(r"\1", text)
+    text = _INLINE_CODE_RE.sub(r"\1", text)
+    text = _BULLET_RE.sub("", text)
+    text = _NUMBERED_RE.sub("", text)
+    text = _HR_RE.sub("", text)
+    text = _BLOCKQUOTE_RE.sub("", text)
+    text = _SPACES_RE.sub(" ", text)
+    text = _NEWLINES_RE.sub("\n\n", text)
+    return text.replace(_MID_LINE, "").strip()
+
+
+def _has_open_markup(segment: str, at_line_start: bool) -> bool:
+    """True if *segment* ends inside a construct that a later delta may close.
+
+    Links and citations may span lines; emphasis, inline code and
+    "Sources:" lines are line-scoped, so only the last line matters.
+    """
+    if segment.count("[") > segment.count("]"):
+        return True
+    link_open = segment.rfind("](")
+    if link_open != -1 and segment.find(")", link_open) == -1:
+        return True
+    citation = None
+    for citation in _SOURCE_OPEN_RE.finditer(segment):
+        pass
+    if citation is not None and segment.find(")", citation.end()) == -1:
+        return True
+
+    newline = segment.rfind("\n")
+    last_line = segment[newline + 1:]
+    if newline != -1 or at_line_start:
+        if _SOURCES_LINE_START_RE.match(last_line) or _BARE_MARKER_LINE_RE.fullmatch(last_line):
+            return True
+    return any(
+        last_line.count(marker) % 2
+        for marker in ("`", "*", "_", "~~")
+    )
+
+
+class TtsSanitizer:
+    """Streaming counterpart of ``sanitize_for_tts``.
+
+    Consumes agent deltas and returns speakable text as soon as a stretch of
+    complete sentences is free of open markup: code fences are tracked by
+    ``SentenceStream``, and links, citations, emphasis and inline code are
+    held back until they close.  Each closed stretch is cleaned with the
+    same passes as ``sanitize_for_tts``, so the spoken output matches the
+    whole-text result up to whitespace.
+    """
+
+    def __init__(self) -> None:
+        self._sentences = SentenceStream()
+        self._held = ""
+        self._at_line_start = True
+
+    def feed(self, delta: str) -> str:
+        complete = self._sentences.feed(delta)
+        if not complete:
+            return ""
+        self._held += complete
+        if _has_open_markup(self._held, self._at_line_start):
+            return ""
+        return self._release()
+
+    def flush(self) -> str:
+        self._held += self._sentences.flush()
+        return self._release()
+
+    def _release(self) -> str:
+        segment, self._held = self._held, ""
+        text = sanitize_for_tts(segment, at_line_start=self._at_line_start)
+        self._at_line_start = segment.endswith("\n")
+        return text
@@ -0,0 +1,149 @@
+import json
+import logging
+import time
+from typing import Any, Literal
+
+from app.backend.services.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+TurnSource = Literal["voice", "text"]
+
+# Pipeline points, in the order a voice turn normally passes them.
+#   speech_started    VoiceLive input_audio_buffer.speech_started
+#   speculation_start agent started early on a stable partial transcript
+#   speech_stopped    VoiceLive input_audio_buffer.speech_stopped
+#   transcript_final  VoiceLive ...input_audio_transcription.completed
+#   turn_received     agent turn requested (transcript or text message)
+#   agent_start       agent lock acquired, prompt about to be sent
+#   copilot_sent      CopilotSession.send returned
+#   first_token       first assistant delta
+#   tool_call         first tool call (tool_calls counts them all)
+#   copilot_done      turn end without pending tool follow-up
+#   final_text        final agent_text sent to the client
+#   tts_first_chunk   first audio from the Speech SDK (or the TTS cache)
+#   first_audio       first TTS chunk sent to the client
+#   avatar_speak      avatar speak started
+#   avatar_done       avatar speak finished
+#   turn_end          response handling finished
+
+_TTFT = Histogram(
+    "turn_time_to_first_token_seconds",
+    "From end of user input (speech stop, else turn request) to the first agent delta.",
+    ("source",),
+)
+_TTFA = Histogram(
+    "turn_time_to_first_audio_seconds",
+    "From end of user input to the first TTS chunk sent or avatar speech started.",
+    ("source",),
+)
+_TRANSCRIPTION = Histogram(
+    "turn_transcription_seconds",
+    "From VoiceLive speech stop to the final transcript.",
+)
+_AGENT = Histogram(
+    "turn_agent_seconds",
+    "From the agent prompt being sent to the end of the agent turn.",
+    ("source",),
+)
+_TOTAL = Histogram(
+    "turn_total_seconds",
+    "From end of user input to the end of response handling.",
+    ("source",),
+)
+# Children bound once, so finishing a trace allocates no label tuples.
+_BOUND = {
+    source: (_TTFT.labels(source), _TTFA.labels(source), _AGENT.labels(source), _TOTAL.labels(source))
+    for source in ("voice", "text")
+}
+
+
+class TurnTrace:
+    """Monotonic timestamps of one turn through the voice pipeline.
+
+    ``mark`` keeps the first time each point is reached (later marks of the
+    same point are ignored, except that tool calls are counted), so callers
+    can mark unconditionally.  ``finish`` feeds the latency histograms and
+    logs the whole trace as one JSON line.
+    """
+
+    __slots__ = ("session_id", "turn", "source", "marks", "tool_calls", "_finished")
+
+    def __init__(self, session_id: str, source: TurnSource, turn: int = 0) -> None:
+        self.session_id = session_id
+        self.turn = turn
+        self.source: TurnSource = source
+        self.marks: dict[str, float] = {}
+        self.tool_calls = 0
+        self._finished = False
+
+    def mark(self, point: str) -> None:
+        if point == "tool_call":
+            self.tool_calls += 1
+        if point not in self.marks:
+            self.marks[point] = time.monotonic()
+
+    def absorb(self, other: "TurnTrace", exclude: tuple[str, ...] = ()) -> None:
+        """Take over *other*'s marks this trace lacks (a speculative agent call's)."""
+        for point, at in other.marks.items():
+            if point not in exclude:
+                self.marks.setdefault(point, at)
+        self.tool_calls += other.tool_calls
+
+    def has(self, point: str) -> bool:
+        return point in self.marks
+
+    @property
+    def origin(self) -> float | None:
+        """When the user finished their input."""
+        marks = self.marks
+        return marks.get("speech_stopped") or marks.get("transcript_final") or marks.get("turn_received")
+
+    def since(self, start: str | None, end: str) -> float | None:
+        start_time = self.origin if start is None else self.marks.get(start)
+        end_time = self.marks.get(end)
+        if start_time is None or end_time is None:
+            return None
+        return end_time - start_time
+
+    def finish(self) -> None:
+        if self._finished:
+            return
+        self._finished = True
+        self.mark("turn_end")
+        ttft_hist, ttfa_hist, agent_hist, total_hist = _BOUND[self.source]
+
+        ttft = self.since(None, "first_token")
+        if ttft is not None:
+            ttft_hist.observe(ttft)
+        first_audio = "first_audio" if "first_audio" in self.marks else "avatar_speak"
+        ttfa = self.since(None, first_audio)
+        if ttfa is not None:
+            ttfa_hist.observe(ttfa)
+        transcription = self.since("speech_stopped", "transcript_final")
+        if transcription is not None:
+            _TRANSCRIPTION.observe(transcription)
+        agent = self.since("copilot_sent", "copilot_done")
+        if agent is not None:
+            agent_hist.observe(agent)
+        total = self.since(None, "turn_end")
+        if total is not None:
+            total_hist.observe(total)
+
+        logger.info("Turn trace: %s", json.dumps(self.to_dict(), separators=(",", ":")))
+
+    def to_dict(self) -> dict[str, Any]:
+        origin = self.origin
+        if origin is None:
+            origin = min(self.marks.values(), default=0.0)
+        return {
+            "session_id": self.session_id,
+            "turn": self.turn,
+            "source": self.source,
+            "tool_calls": self.tool_calls,
+            # Milliseconds relative to the end of user input (negative before it).
+            "marks_ms": {
+                point: round((at - origin) * 1000, 1)
+                for point, at in sorted(self.marks.items(), key=lambda item: item[1])
+            },
+        }
@@ -1,22 +1,33 @@
 import asyncio
+import base64
 import logging
 from collections.abc import AsyncGenerator
 from typing import Any
 
 from azure.ai.voicelive.aio import connect, VoiceLiveConnection
-from azure.identity.aio import DefaultAzureCredential
-
 from app.backend.config import settings
+from app.backend.services.azure_credentials import SharedAzureCredential, shared_credential
+from app.backend.services.metrics import Counter
 
 logger = logging.getLogger(__name__)
 
 _MAX_RECONNECT_ATTEMPTS = 3
 _RECONNECT_BASE_DELAY = 1.0
 
+_RECONNECT_ATTEMPTS = Counter(
+    "voicelive_reconnect_attempts_total", "VoiceLive reconnect attempts.",
+).labels()
+_RECONNECTS = Counter(
+    "voicelive_reconnects_total",
+    "VoiceLive reconnect sequences by result (ok, gave_up).",
+    ("result",),
+)
+_RECONNECT_RESULTS = {result: _RECONNECTS.labels(result) for result in ("ok", "gave_up")}
+
 
 class VoiceLiveService:
-    def __init__(self) -> None:
-        self._credential: DefaultAzureCredential | None = None
+    def __init__(self, credential: SharedAzureCredential = shared_credential) -> None:
+        self._credential = credential
         self._connection: VoiceLiveConnection | None = None
         self._connected = False
         self._reconnecting = False
@@ -25,8 +36,6 @@ class VoiceLiveService:
         self._ctx_manager: Any = None
 
     async def connect(self) -> None:
-        self._credential = DefaultAzureCredential()
-
         endpoint = settings.azure_voicelive_endpoint.rstrip("/")
         model = settings.azure_voicelive_model or None
 
@@ -83,6 +92,7 @@ class VoiceLiveService:
 
     async def _attempt_reconnect(self) -> None:
         for attempt in range(1, _MAX_RECONNECT_ATTEMPTS + 1):
+            _RECONNECT_ATTEMPTS.inc()
             delay = _RECONNECT_BASE_DELAY * (2 ** (attempt - 1))
             logger.info(
                 "VoiceLive reconnect attempt %d/%d in %.1fs",
@@ -92,15 +102,22 @@ class VoiceLiveService:
             try:
                 await self.connect()
                 logger.info("VoiceLive reconnected on attempt %d", attempt)
+                _RECONNECT_RESULTS["ok"].inc()
                 return
             except Exception:
                 logger.warning("VoiceLive reconnect attempt %d failed", attempt)
         logger.error("VoiceLive reconnection failed after %d attempts", _MAX_RECONNECT_ATTEMPTS)
+        _RECONNECT_RESULTS["gave_up"].inc()
 
-    async def send_audio(self, base64_data: str) -> None:
+    async def send_audio(self, audio: str | bytes | memoryview) -> None:
+        """Append microphone audio, given as base64 text or raw PCM16 bytes."""
         if self._connection and self._connected:
+            # The VoiceLive wire protocol is JSON, so raw frames are encoded
+            # exactly once here, straight from the received buffer.
+            if not isinstance(audio, str):
+                audio = base64.b64encode(audio).decode("ascii")
             try:
-                await self._connection.input_audio_buffer.append(audio=base64_data)
+                await self._connection.input_audio_buffer.append(audio=audio)
             except Exception as exc:
                 # Detect closed/closing transport and trigger reconnection
                 exc_str = str(exc).lower()
@@ -175,6 +192,3 @@ class VoiceLiveService:
                 logger.warning("Error closing VoiceLive connection", exc_info=True)
             self._ctx_manager = None
             self._connection = None
-        if self._credential:
-            await self._credential.close()
-            self._credential = None
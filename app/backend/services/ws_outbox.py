@@ -0,0 +1,293 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import WebSocket
+
+from app.backend.config import settings
+from app.backend.services.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+# Close code sent to clients that can't keep up (RFC 6455 "Try Again Later").
+_SLOW_CONSUMER_CLOSE_CODE = 1013
+
+_WS_FRAMES = Counter(
+    "ws_frames_total", "WebSocket frames by direction and message type.", ("direction", "type"),
+)
+# Children keyed by message type ("binary" for raw audio frames).
+WS_FRAMES_IN = _WS_FRAMES.bind("in")
+_WS_FRAMES_OUT = _WS_FRAMES.bind("out")
+
+
+class WsOutbox:
+    """Per-connection WebSocket writer with a control lane and an audio lane.
+
+    Every outbound message goes through a single writer task, so concurrent
+    producers (agent stream, VoiceLive listener, avatar tasks, TTS loops) no
+    longer race on ``ws.send_*``.
+
+    - Control lane: every JSON message except TTS audio (state, tts_stop,
+      agent_text, errors, ...).  FIFO, always drained before audio, so a
+      ``tts_stop`` never waits behind queued audio.
+    - Audio lane: TTS chunks (JSON or binary frames).  Bounded; producers
+      wait for space (backpressure) and ``drop_audio`` empties it on
+      barge-in.
+
+    A client whose queue overflows, or whose socket doesn't accept a frame
+    within ``ws_slow_consumer_seconds``, is considered a slow consumer and
+    disconnected.
+    """
+
+    def __init__(self, ws: WebSocket) -> None:
+        self._ws = ws
+        self._control: deque[dict[str, Any]] = deque()
+        self._audio: deque[dict[str, Any] | bytes] = deque()
+        self._wakeup = asyncio.Event()
+        self._audio_space = asyncio.Event()
+        self._audio_space.set()
+        self._task: asyncio.Task[None] | None = None
+        self._close_task: asyncio.Task[None] | None = None
+        self._closed = False
+        # Backpressure metrics
+        self.sent_messages = 0
+        self.sent_audio_frames = 0
+        self.dropped_audio_frames = 0
+        self.control_high_water = 0
+        self.audio_high_water = 0
+        self.audio_wait_seconds = 0.0
+        self.slow_consumer = False
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._writer_loop(), name="ws-outbox")
+
+    def send(self, data: dict[str, Any]) -> None:
+        """Queue a control-lane message (never blocks)."""
+        if self._closed:
+            return
+        if len(self._control) >= settings.ws_outbox_max_messages:
+            self._disconnect_slow_consumer("control queue full")
+            return
+        self._control.append(data)
+        self.control_high_water = max(self.control_high_water, len(self._control))
+        self._wakeup.set()
+
+    async def send_audio(self, frame: dict[str, Any] | bytes) -> None:
+        """Queue a TTS audio frame, waiting while the audio lane is full."""
+        if self._closed:
+            return
+        while len(self._audio) >= settings.ws_outbox_max_audio_frames:
+            started = time.monotonic()
+            self._audio_space.clear()
+            try:
+                await asyncio.wait_for(
+                    self._audio_space.wait(), timeout=settings.ws_slow_consumer_seconds,
+                )
+            except asyncio.TimeoutError:
+                self._disconnect_slow_consumer("audio queue stalled")
+                return
+            finally:
+                self.audio_wait_seconds += time.monotonic() - started
+            if self._closed:
+                return
+        self._audio.append(frame)
+        self.audio_high_water = max(self.audio_high_water, len(self._audio))
+        self._wakeup.set()
+
+    def drop_audio(self) -> int:
+        """Discard queued TTS audio (barge-in).  Returns the number dropped."""
+        dropped = len(self._audio)
+        self._audio.clear()
+        self.dropped_audio_frames += dropped
+        self._audio_space.set()
+        return dropped
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "control_depth": len(self._control),
+            "audio_depth": len(self._audio),
+            "control_high_water": self.control_high_water,
+            "audio_high_water": self.audio_high_water,
+            "sent_messages": self.sent_messages,
+            "sent_audio_frames": self.sent_audio_frames,
+            "dropped_audio_frames": self.dropped_audio_frames,
+            "audio_wait_seconds": round(self.audio_wait_seconds, 3),
+            "slow_consumer": self.slow_consumer,
+        }
+
+    async def _writer_loop(self) -> None:
+        try:
+            while not self._closed:
+                if not self._control and not self._audio:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+                if self._control:
+                    item: dict[str, Any] | bytes = self._control.popleft()
+                    is_audio = False
+                else:
+                    item = self._audio.popleft()
+                    is_audio = True
+                    self._audio_space.set()
+                try:
+                    if isinstance(item, bytes):
+                        send = self._ws.send_bytes(item)
+                    else:
+                        send = self._ws.send_json(item)
+                    await asyncio.wait_for(send, timeout=settings.ws_slow_consumer_seconds)
+                except asyncio.TimeoutError:
+                    self._disconnect_slow_consumer("send timed out")
+                    return
+                except Exception:
+                    logger.debug("Failed to send WS message", exc_info=True)
+                    continue
+                if is_audio:
+                    self.sent_audio_frames += 1
+                else:
+                    self.sent_messages += 1
+                _WS_FRAMES_OUT["binary" if isinstance(item, bytes) else item.get("type", "unknown")].inc()
+        except asyncio.CancelledError:
+            pass
+
+    def _disconnect_slow_consumer(self, reason: str) -> None:
+        if self._closed:
+            return
+        logger.warning("Slow WebSocket consumer (%s), disconnecting: %s", reason, self.stats())
+        self.slow_consumer = True
+        self._closed = True
+        self._control.clear()
+        self._audio.clear()
+        self._audio_space.set()
+        self._wakeup.set()
+        self._close_task = asyncio.create_task(self._close_socket(), name="ws-outbox-close")
+
+    async def _close_socket(self) -> None:
+        try:
+            await self._ws.close(code=_SLOW_CONSUMER_CLOSE_CODE)
+        except Exception:
+            logger.debug("Error closing slow WebSocket consumer", exc_info=True)
+
+    async def close(self, flush_timeout: float = 1.0, *, code: int | None = None) -> None:
+        """Give queued control messages a moment to flush, then stop the writer.
+
+        With *code*, the socket is closed with that close code as well.
+        """
+        if self._task is None:
+            return
+        self.drop_audio()
+        deadline = time.monotonic() + flush_timeout
+        while self._control and not self._closed and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        self._closed = True
+        self._wakeup.set()
+        if not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        logger.info("WebSocket outbox closed: %s", self.stats())
+        if code is not None:
+            try:
+                await self._ws.close(code=code)
+            except Exception:
+                logger.debug("Error closing WebSocket", exc_info=True)
+
+
+class TtsPacer:
+    """Releases TTS audio at real-time pace, a fixed lead ahead of playback.
+
+    Tracks when the client will have finished playing everything sent so
+    far (the playhead) and holds each chunk until the playhead is at most
+    ``lead_ms`` ahead of now.  The client never buffers more than the lead,
+    so server-side cancellation stops audible output within that time.
+    Chunk duration is derived from the codec's byte rate (exact for PCM,
+    nominal bitrate for compressed codecs).  A lead of 0 disables pacing.
+    """
+
+    def __init__(self, bytes_per_second: int, *, lead_ms: int | None = None) -> None:
+        self._bytes_per_second = bytes_per_second
+        self._lead = (settings.tts_pacing_lead_ms if lead_ms is None else lead_ms) / 1000
+        self._playhead = 0.0
+        self.paced_seconds = 0.0
+
+    async def wait(self, size: int, cancel_event: asyncio.Event) -> bool:
+        """Wait until a chunk of *size* bytes is due; False if cancelled meanwhile."""
+        if self._lead <= 0:
+            return not cancel_event.is_set()
+        now = time.monotonic()
+        delay = self._playhead - now - self._lead
+        if delay > 0:
+            self.paced_seconds += delay
+            try:
+                await asyncio.wait_for(cancel_event.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            now = time.monotonic()
+        if cancel_event.is_set():
+            return False
+        # An idle gap means the client buffer drained; restart from now.
+        self._playhead = max(self._playhead, now) + size / self._bytes_per_second
+        return True
+
+    def reset(self) -> None:
+        """Forget queued playback time (barge-in: the client flushed its buffer)."""
+        self._playhead = 0.0
+
+
+class DeltaCoalescer:
+    """Nagle-style batching of streamed text deltas into fewer frames.
+
+    Deltas are buffered and sent as one message once ``max_delay_ms`` has
+    passed since the first buffered delta or the buffer reaches
+    ``max_bytes``, whichever comes first.  Callers must ``flush`` before
+    sending the final (``is_final``) message so ordering is preserved.
+    A delay of 0 sends every delta immediately.
+    """
+
+    def __init__(
+        self,
+        outbox: WsOutbox,
+        make_message: Callable[[str], dict[str, Any]],
+        *,
+        max_delay_ms: int | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        self._outbox = outbox
+        self._make_message = make_message
+        self._max_delay = (
+            settings.agent_text_coalesce_ms if max_delay_ms is None else max_delay_ms
+        ) / 1000
+        self._max_bytes = settings.agent_text_coalesce_bytes if max_bytes is None else max_bytes
+        self._parts: list[str] = []
+        self._size = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self.frames_sent = 0
+        self.deltas_received = 0
+
+    def add(self, delta: str) -> None:
+        if not delta:
+            return
+        self.deltas_received += 1
+        self._parts.append(delta)
+        self._size += len(delta)
+        if self._max_delay <= 0 or self._size >= self._max_bytes:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self._max_delay, self.flush)
+
+    def flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._parts:
+            return
+        text = "".join(self._parts)
+        self._parts.clear()
+        self._size = 0
+        self.frames_sent += 1
+        self._outbox.send(self._make_message(text))
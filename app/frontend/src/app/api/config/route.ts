@@ -12,5 +12,7 @@ export async function GET() {
       process.env.BACKEND_API_URL ??
       process.env.NEXT_PUBLIC_API_URL ??
       "http://localhost:8000",
+    // TTS codec to request: "pcm" (default), "opus" or "mp3".
+    ttsCodec: process.env.TTS_CODEC ?? "pcm",
   });
 }
\ No newline at end of file
@@ -174,6 +174,7 @@ export function ChatInterface({ topic = "databricks" }: { topic?: TopicId }) {
     sessionSummary,
     isGeneratingSummary,
     dismissSummary,
+    queuePosition,
   } = useVoiceSession({ skill: topic });
 
   const config = TOPIC_CONFIG[topic];
@@ -231,7 +232,9 @@ export function ChatInterface({ topic = "databricks" }: { topic?: TopicId }) {
               title={isConnected ? "Connected" : "Disconnected"}
             />
             <span className="text-xs text-[var(--muted)]">
-              {isConnected ? "Connected" : "Disconnected"}
+              {queuePosition !== null
+                ? `Waiting for a slot (#${queuePosition})`
+                : isConnected ? "Connected" : "Disconnected"}
             </span>
           </div>
           <div className="h-4 w-px bg-[var(--border)]" />
@@ -6,19 +6,10 @@ import { registerAudioWorklet } from "@/lib/audio-worklet";
 interface UseAudioCaptureReturn {
   isCapturing: boolean;
   audioLevel: number;
-  startCapture: (onAudioChunk: (base64Data: string) => void) => Promise<void>;
+  startCapture: (onAudioChunk: (pcm: ArrayBuffer) => void) => Promise<void>;
   stopCapture: () => void;
 }
 
-function arrayBufferToBase64(buffer: ArrayBuffer): string {
-  const bytes = new Uint8Array(buffer);
-  let binary = "";
-  for (let i = 0; i < bytes.byteLength; i++) {
-    binary += String.fromCharCode(bytes[i]);
-  }
-  return btoa(binary);
-}
-
 export function useAudioCapture(): UseAudioCaptureReturn {
   const [isCapturing, setIsCapturing] = useState(false);
   const [audioLevel, setAudioLevel] = useState(0);
@@ -48,7 +39,7 @@ export function useAudioCapture(): UseAudioCaptureReturn {
   }, []);
 
   const startCapture = useCallback(
-    async (onAudioChunk: (base64Data: string) => void) => {
+    async (onAudioChunk: (pcm: ArrayBuffer) => void) => {
       const stream = await navigator.mediaDevices.getUserMedia({
         audio: {
           echoCancellation: true,
@@ -70,9 +61,10 @@ export function useAudioCapture(): UseAudioCaptureReturn {
         "pcm16-capture-processor"
       );
 
+      // Raw PCM16 goes straight to the WebSocket manager, which frames it
+      // as binary or falls back to base64 JSON for older servers.
       workletNode.port.onmessage = (event: MessageEvent<ArrayBuffer>) => {
-        const base64 = arrayBufferToBase64(event.data);
-        onAudioChunk(base64);
+        onAudioChunk(event.data);
       };
 
       source.connect(workletNode);
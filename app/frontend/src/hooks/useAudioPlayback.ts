@@ -1,23 +1,59 @@
 "use client";
 
 import { useState, useRef, useCallback } from "react";
+import { TTS_CODEC_MIME, type TtsCodec } from "@/lib/ws-protocol";
 
 interface UseAudioPlaybackReturn {
   isPlaying: boolean;
-  enqueueAudio: (base64Data: string) => void;
+  enqueueAudio: (data: string | ArrayBuffer, codec?: TtsCodec) => void;
   stopPlayback: () => void;
 }
 
+/**
+ * Compressed TTS stream (Opus/WebM or MP3) played through MediaSource, so
+ * decoding happens in the browser's media pipeline instead of on the main
+ * thread.  The SourceBuffer runs in "sequence" mode so each utterance's
+ * stream is appended right after the previous one.
+ */
+interface CompressedPlayer {
+  codec: Exclude<TtsCodec, "pcm">;
+  audio: HTMLAudioElement;
+  mediaSource: MediaSource;
+  url: string;
+  sourceBuffer: SourceBuffer | null;
+  pending: ArrayBuffer[];
+}
+
 /** TTS audio comes in at this sample rate from the backend (24 kHz). */
 const SOURCE_SAMPLE_RATE = 24000;
 
-function base64ToInt16Array(base64: string): Int16Array {
+function base64ToArrayBuffer(base64: string): ArrayBuffer {
   const binaryString = atob(base64);
   const bytes = new Uint8Array(binaryString.length);
   for (let i = 0; i < binaryString.length; i++) {
     bytes[i] = binaryString.charCodeAt(i);
   }
-  return new Int16Array(bytes.buffer);
+  return bytes.buffer;
+}
+
+/** Append the next queued chunk once the SourceBuffer is idle. */
+function pumpCompressed(player: CompressedPlayer): void {
+  const sb = player.sourceBuffer;
+  if (!sb || sb.updating || player.pending.length === 0) return;
+  sb.appendBuffer(player.pending.shift()!);
+  if (player.audio.paused) {
+    player.audio.play().catch((err) => {
+      console.warn("[AudioPlayback] compressed playback failed to start", err);
+    });
+  }
+}
+
+function destroyCompressed(player: CompressedPlayer): void {
+  player.pending = [];
+  player.audio.pause();
+  player.audio.removeAttribute("src");
+  player.audio.load();
+  URL.revokeObjectURL(player.url);
 }
 
 function int16ToFloat32(int16: Int16Array): Float32Array {
@@ -82,6 +118,52 @@ export function useAudioPlayback(): UseAudioPlaybackReturn {
    */
   const initPromiseRef = useRef<Promise<AudioWorkletNode> | null>(null);
 
+  const compressedRef = useRef<CompressedPlayer | null>(null);
+
+  const ensureCompressed = useCallback(
+    (codec: Exclude<TtsCodec, "pcm">): CompressedPlayer => {
+      const existing = compressedRef.current;
+      if (existing && existing.codec === codec) return existing;
+      if (existing) destroyCompressed(existing);
+
+      const mediaSource = new MediaSource();
+      const audio = new Audio();
+      const url = URL.createObjectURL(mediaSource);
+      audio.src = url;
+      const player: CompressedPlayer = {
+        codec,
+        audio,
+        mediaSource,
+        url,
+        sourceBuffer: null,
+        pending: [],
+      };
+      mediaSource.addEventListener(
+        "sourceopen",
+        () => {
+          const sb = mediaSource.addSourceBuffer(TTS_CODEC_MIME[codec]);
+          sb.mode = "sequence";
+          sb.addEventListener("updateend", () => pumpCompressed(player));
+          player.sourceBuffer = sb;
+          pumpCompressed(player);
+        },
+        { once: true }
+      );
+      audio.addEventListener("playing", () => {
+        isPlayingRef.current = true;
+        setIsPlaying(true);
+      });
+      // Playback caught up with everything received so far.
+      audio.addEventListener("waiting", () => {
+        isPlayingRef.current = false;
+        setIsPlaying(false);
+      });
+      compressedRef.current = player;
+      return player;
+    },
+    []
+  );
+
   const ensureWorklet = useCallback(async (): Promise<AudioWorkletNode> => {
     // Fast path: already initialised and alive
     if (
@@ -142,8 +224,18 @@ export function useAudioPlayback(): UseAudioPlaybackReturn {
   }, []);
 
   const enqueueAudio = useCallback(
-    (base64Data: string) => {
-      const int16 = base64ToInt16Array(base64Data);
+    (data: string | ArrayBuffer, codec: TtsCodec = "pcm") => {
+      // Binary frames carry raw bytes; JSON messages carry base64.
+      const buffer = typeof data === "string" ? base64ToArrayBuffer(data) : data;
+
+      if (codec !== "pcm") {
+        const player = ensureCompressed(codec);
+        player.pending.push(buffer);
+        pumpCompressed(player);
+        return;
+      }
+
+      const int16 = new Int16Array(buffer);
       const float32 = int16ToFloat32(int16);
 
       ensureWorklet().then((node) => {
@@ -162,13 +254,18 @@ export function useAudioPlayback(): UseAudioPlaybackReturn {
         }
       });
     },
-    [ensureWorklet]
+    [ensureWorklet, ensureCompressed]
   );
 
   const stopPlayback = useCallback(() => {
     if (workletNodeRef.current) {
       workletNodeRef.current.port.postMessage("stop");
     }
+    // Compressed streams can't be truncated in place; start fresh next time.
+    if (compressedRef.current) {
+      destroyCompressed(compressedRef.current);
+      compressedRef.current = null;
+    }
     isPlayingRef.current = false;
     setIsPlaying(false);
   }, []);
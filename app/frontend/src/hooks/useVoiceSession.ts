@@ -3,9 +3,11 @@
 import { useState, useEffect, useRef, useCallback } from "react";
 import {
   WebSocketManager,
+  isTtsCodecSupported,
   type IncomingMessage,
   type SessionState,
   type AvatarState,
+  type TtsCodec,
 } from "@/lib/ws-protocol";
 import { useAudioCapture } from "@/hooks/useAudioCapture";
 import { useAudioPlayback } from "@/hooks/useAudioPlayback";
@@ -40,6 +42,7 @@ interface UseVoiceSessionReturn {
   sessionSummary: string | null;
   isGeneratingSummary: boolean;
   dismissSummary: () => void;
+  queuePosition: number | null;
 }
 
 const DEFAULT_WS_URL = "ws://localhost:8000/ws";
@@ -61,10 +64,14 @@ function generateId(): string {
 }
 
 /** Build the final WS URL, appending query params for lite mode and skill. */
-function buildWsUrl(base: string, lite: boolean, skill: string): string {
+function buildWsUrl(base: string, lite: boolean, skill: string, ttsCodec: TtsCodec): string {
   const params: string[] = [];
   if (lite) params.push("lite=1");
   if (skill) params.push(`skill=${encodeURIComponent(skill)}`);
+  // Only ask for a compressed codec this browser can actually play.
+  if (ttsCodec !== "pcm" && isTtsCodecSupported(ttsCodec)) {
+    params.push(`tts_codec=${ttsCodec}`);
+  }
   if (params.length === 0) return base;
   const sep = base.includes("?") ? "&" : "?";
   return `${base}${sep}${params.join("&")}`;
@@ -83,6 +90,8 @@ export function useVoiceSession(options?: { skill?: string }): UseVoiceSessionRe
   const [liteMode, setLiteModeState] = useState<boolean>(readLiteModeFromStorage);
   const [sessionSummary, setSessionSummary] = useState<string | null>(null);
   const [isGeneratingSummary, setIsGeneratingSummary] = useState(false);
+  // Place in the server's admission queue while waiting for a session slot.
+  const [queuePosition, setQueuePosition] = useState<number | null>(null);
 
   // Ref mirror so the message handler closure always reads the latest value.
   const liteModeRef = useRef(liteMode);
@@ -99,6 +108,8 @@ export function useVoiceSession(options?: { skill?: string }): UseVoiceSessionRe
   // Stores the base WS URL (fetched from /api/config once) so reconnections
   // triggered by setLiteMode don't need to re-fetch.
   const wsBaseUrlRef = useRef<string>(DEFAULT_WS_URL);
+  // Preferred TTS codec from /api/config (raw PCM unless configured).
+  const ttsCodecRef = useRef<TtsCodec>("pcm");
 
   // Ref to the interval used for connection polling — needed for cleanup on reconnect.
   const checkConnectionRef = useRef<ReturnType<typeof setInterval> | null>(null);
@@ -209,7 +220,7 @@ export function useVoiceSession(options?: { skill?: string }): UseVoiceSessionRe
       case "tts_audio": {
         // In lite mode the backend won't send TTS audio, but guard here too.
         if (!liteModeRef.current) {
-          enqueueAudio(msg.data);
+          enqueueAudio(msg.data, msg.codec ?? "pcm");
         }
         break;
       }
@@ -277,6 +288,45 @@ export function useVoiceSession(options?: { skill?: string }): UseVoiceSessionRe
         break;
       }
 
+      case "session_created": {
+        setQueuePosition(null);
+        break;
+      }
+
+      case "queued": {
+        setQueuePosition(msg.position);
+        break;
+      }
+
+      case "busy": {
+        // The WebSocketManager retries after the server's hint.
+        setQueuePosition(null);
+        const busyMessage: Message = {
+          id: generateId(),
+          role: "assistant",
+          content: `⚠ ${msg.message}. Retrying in ${msg.retry_after_seconds}s…`,
+          timestamp: new Date(),
+        };
+        setMessages((prev) => [...prev, busyMessage]);
+        break;
+      }
+
+      case "reconnect": {
+        // Server is draining. The WebSocketManager reconnects on close (to
+        // another instance); restore the conversation there.
+        stopCapture();
+        stopPlayback();
+        disconnectWebRTC();
+        setAvatarState("disconnected");
+        setSessionState("idle");
+        sessionStateRef.current = "idle";
+        currentAssistantIdRef.current = null;
+        pendingHistoryRef.current = messagesRef.current
+          .filter((m) => m.content && !m.content.startsWith("⚠"))
+          .map((m) => ({ role: m.role, content: m.content }));
+        break;
+      }
+
       case "session_summary_chunk": {
         if (msg.is_final) {
           // Final summary — replace any streaming content with the complete text
@@ -308,7 +358,7 @@ export function useVoiceSession(options?: { skill?: string }): UseVoiceSessionRe
 
   /** Create a new WS connection using wsBaseUrlRef + current lite mode. */
   const connectWs = useCallback((lite: boolean) => {
-    const url = buildWsUrl(wsBaseUrlRef.current, lite, skillRef.current);
+    const url = buildWsUrl(wsBaseUrlRef.current, lite, skillRef.current, ttsCodecRef.current);
     const ws = new WebSocketManager(url);
     wsRef.current = ws;
 
@@ -321,7 +371,9 @@ export function useVoiceSession(options?: { skill?: string }): UseVoiceSessionRe
 
       // After a mode-toggle reconnect, once we receive any message from the
       // backend (proving the connection is alive), send the saved history.
-      if (pendingHistoryRef.current) {
+      // Wait for session_created: before that the client may still be
+      // queued for admission, or be told to reconnect elsewhere.
+      if (pendingHistoryRef.current && msg.type === "session_created") {
         const historyToRestore = pendingHistoryRef.current;
         pendingHistoryRef.current = null;
         ws.send({
@@ -346,6 +398,7 @@ export function useVoiceSession(options?: { skill?: string }): UseVoiceSessionRe
         if (res.ok) {
           const cfg = await res.json();
           if (cfg.wsUrl) wsUrl = cfg.wsUrl;
+          if (cfg.ttsCodec) ttsCodecRef.current = cfg.ttsCodec;
         }
       } catch {
         // fall back to default
@@ -429,8 +482,8 @@ export function useVoiceSession(options?: { skill?: string }): UseVoiceSessionRe
     // The backend will send state updates as it generates the summary.
   }, [stopCapture, stopPlayback, disconnectWebRTC]);
 
-  const onAudioChunk = useCallback((base64Data: string) => {
-    wsRef.current?.send({ type: "audio", data: base64Data });
+  const onAudioChunk = useCallback((pcm: ArrayBuffer) => {
+    wsRef.current?.sendAudio(pcm);
   }, []);
 
   const toggleListening = useCallback(async () => {
@@ -497,5 +550,6 @@ export function useVoiceSession(options?: { skill?: string }): UseVoiceSessionRe
     sessionSummary,
     isGeneratingSummary,
     dismissSummary,
+    queuePosition,
   };
 }
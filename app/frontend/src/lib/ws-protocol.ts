@@ -2,6 +2,44 @@
 
 export type SessionState = "idle" | "listening" | "thinking" | "speaking";
 
+/**
+ * Binary audio sub-protocol (mirrors app/backend/models/ws_messages.py).
+ * When the server accepts it, audio travels as binary frames: one header
+ * byte with the frame type followed by raw PCM16 24 kHz mono samples.
+ * Servers that don't select it keep the base64 JSON audio messages.
+ */
+export const BINARY_AUDIO_SUBPROTOCOL = "ads.pcm16.v1";
+export const FRAME_MIC_AUDIO = 0x01;
+export const FRAME_TTS_AUDIO = 0x02;
+
+/**
+ * TTS output codec, requested with the `tts_codec` query parameter on
+ * connect and confirmed in `session_created`.  "pcm" (raw PCM16 24 kHz)
+ * is played through the AudioWorklet; "opus" (WebM) and "mp3" are
+ * compressed streams decoded by the browser's media pipeline.
+ */
+export type TtsCodec = "pcm" | "opus" | "mp3";
+
+export const TTS_CODEC_MIME: Record<Exclude<TtsCodec, "pcm">, string> = {
+  opus: 'audio/webm; codecs="opus"',
+  mp3: "audio/mpeg",
+};
+
+/** True if this browser can play *codec* (PCM always; others via MediaSource). */
+export function isTtsCodecSupported(codec: TtsCodec): boolean {
+  if (codec === "pcm") return true;
+  return typeof MediaSource !== "undefined" && MediaSource.isTypeSupported(TTS_CODEC_MIME[codec]);
+}
+
+export function arrayBufferToBase64(buffer: ArrayBuffer): string {
+  const bytes = new Uint8Array(buffer);
+  let binary = "";
+  for (let i = 0; i < bytes.byteLength; i++) {
+    binary += String.fromCharCode(bytes[i]);
+  }
+  return btoa(binary);
+}
+
 export type OutgoingAudioMessage = {
   type: "audio";
   data: string;
@@ -54,7 +92,10 @@ export type IncomingAgentTextMessage = {
 
 export type IncomingTtsAudioMessage = {
   type: "tts_audio";
-  data: string;
+  /** base64 from JSON messages, or raw bytes from binary frames. */
+  data: string | ArrayBuffer;
+  /** Codec of `data`; absent means "pcm". */
+  codec?: TtsCodec;
 };
 
 
@@ -95,6 +136,35 @@ export type IncomingSessionSummaryChunkMessage = {
 };
 
 
+export type IncomingSessionCreatedMessage = {
+  type: "session_created";
+  session_id: string;
+  lite_mode: boolean;
+  binary_audio: boolean;
+  tts_codec: TtsCodec;
+  startup_timings: Record<string, number>;
+};
+
+/** Server is at capacity; the session starts when this client reaches the front. */
+export type IncomingQueuedMessage = {
+  type: "queued";
+  position: number;
+  queue_length: number;
+};
+
+/** Admission refused; the server closes the socket next. Retry after the hint. */
+export type IncomingBusyMessage = {
+  type: "busy";
+  message: string;
+  retry_after_seconds: number;
+};
+
+/** Server is draining: it closes the socket next; reconnect and restore history. */
+export type IncomingReconnectMessage = {
+  type: "reconnect";
+  reason: string;
+};
+
 export type AvatarState = "idle" | "connecting" | "speaking" | "disconnected";
 
 export type IncomingMessage =
@@ -107,7 +177,11 @@ export type IncomingMessage =
   | IncomingAvatarAnswerMessage
   | IncomingAvatarIceMessage
   | IncomingAvatarStateMessage
-  | IncomingSessionSummaryChunkMessage;
+  | IncomingSessionSummaryChunkMessage
+  | IncomingSessionCreatedMessage
+  | IncomingReconnectMessage
+  | IncomingQueuedMessage
+  | IncomingBusyMessage;
 
 type MessageHandler = (msg: IncomingMessage) => void;
 
@@ -119,6 +193,9 @@ export class WebSocketManager {
   private maxReconnectDelay = 30000;
   private reconnectTimer: ReturnType<typeof setTimeout> | null = null;
   private intentionalClose = false;
+  private ttsCodec: TtsCodec = "pcm";
+  // Server-provided delay for the next reconnect (from a "busy" message).
+  private retryAfterMs: number | null = null;
 
   constructor(url: string) {
     this.url = url;
@@ -132,6 +209,11 @@ export class WebSocketManager {
     return this.ws?.readyState === WebSocket.OPEN;
   }
 
+  /** True once the server has accepted the binary audio sub-protocol. */
+  get binaryAudio(): boolean {
+    return this.ws?.protocol === BINARY_AUDIO_SUBPROTOCOL;
+  }
+
   connect(): void {
     if (this.ws?.readyState === WebSocket.OPEN || this.ws?.readyState === WebSocket.CONNECTING) {
       return;
@@ -140,15 +222,26 @@ export class WebSocketManager {
     this.intentionalClose = false;
 
     try {
-      this.ws = new WebSocket(this.url);
+      this.ws = new WebSocket(this.url, [BINARY_AUDIO_SUBPROTOCOL]);
+      this.ws.binaryType = "arraybuffer";
 
       this.ws.onopen = () => {
         this.reconnectAttempts = 0;
       };
 
       this.ws.onmessage = (event: MessageEvent) => {
+        if (event.data instanceof ArrayBuffer) {
+          this.handleBinaryFrame(event.data);
+          return;
+        }
         try {
           const msg = JSON.parse(event.data as string) as IncomingMessage;
+          if (msg.type === "session_created") {
+            // Binary TTS frames carry audio in the negotiated codec.
+            this.ttsCodec = msg.tts_codec ?? "pcm";
+          } else if (msg.type === "busy") {
+            this.retryAfterMs = msg.retry_after_seconds * 1000;
+          }
           this.handlers.forEach((handler) => handler(msg));
         } catch {
           // malformed message, ignore
@@ -188,6 +281,19 @@ export class WebSocketManager {
     }
   }
 
+  /** Send raw PCM16 microphone audio, as a binary frame when negotiated. */
+  sendAudio(pcm: ArrayBuffer): void {
+    if (this.ws?.readyState !== WebSocket.OPEN) return;
+    if (this.binaryAudio) {
+      const frame = new Uint8Array(pcm.byteLength + 1);
+      frame[0] = FRAME_MIC_AUDIO;
+      frame.set(new Uint8Array(pcm), 1);
+      this.ws.send(frame);
+    } else {
+      this.send({ type: "audio", data: arrayBufferToBase64(pcm) });
+    }
+  }
+
   onMessage(handler: MessageHandler): () => void {
     this.handlers.add(handler);
     return () => {
@@ -195,13 +301,26 @@ export class WebSocketManager {
     };
   }
 
+  private handleBinaryFrame(frame: ArrayBuffer): void {
+    if (frame.byteLength < 1) return;
+    const header = new Uint8Array(frame, 0, 1)[0];
+    if (header === FRAME_TTS_AUDIO) {
+      const msg: IncomingTtsAudioMessage = {
+        type: "tts_audio",
+        data: frame.slice(1),
+        codec: this.ttsCodec,
+      };
+      this.handlers.forEach((handler) => handler(msg));
+    }
+  }
+
   private scheduleReconnect(): void {
     if (this.intentionalClose) return;
 
-    const delay = Math.min(
-      1000 * Math.pow(2, this.reconnectAttempts),
-      this.maxReconnectDelay
-    );
+    const delay =
+      this.retryAfterMs ??
+      Math.min(1000 * Math.pow(2, this.reconnectAttempts), this.maxReconnectDelay);
+    this.retryAfterMs = null;
     this.reconnectAttempts++;
 
     this.reconnectTimer = setTimeout(() => {